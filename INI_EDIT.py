@@ -1,8 +1,37 @@
-import tkinter as tk
-from gui.parameter_manager import ParameterManagerGUI
+import time
+
+# 시작 시간 측정 모드는 Tk 와 GUI 모듈을 불러오는 시간까지 포함해 측정하므로
+# 아래 import 들은 시각을 잰 뒤에 둔다 (E402 는 의도된 것)
+_STARTED_AT = time.perf_counter()
+
+import argparse  # noqa: E402
+import logging  # noqa: E402
+import tkinter as tk  # noqa: E402
+from gui.parameter_manager import ParameterManagerGUI  # noqa: E402
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parameter Manager")
+    parser.add_argument(
+        "--startup-timing",
+        action="store_true",
+        help="log the time until the first restored tab is interactive",
+    )
+    parser.add_argument(
+        "--stall-threshold",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="log UI stalls longer than this with the blocking stack (0 disables)",
+    )
+    args = parser.parse_args()
+    if args.startup_timing:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
     app_root = tk.Tk()
     app_root.title("Parameter Manager")
-    gui = ParameterManagerGUI(app_root)
+    options = {}
+    if args.stall_threshold is not None:
+        options["stall_threshold"] = args.stall_threshold or None
+    gui = ParameterManagerGUI(
+        app_root, startup_timing=args.startup_timing, started_at=_STARTED_AT, **options
+    )
     app_root.mainloop()
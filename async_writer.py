@@ -0,0 +1,111 @@
+import logging
+import threading
+from collections import OrderedDict, deque
+
+from config_io import patch_parameters_signed
+from instrumentation import trace_category, tracer
+
+logger = logging.getLogger(__name__)
+
+
+def _merge_changes(first, second):
+    if first is None or second is None:
+        return None
+    merged = {section: set(keys) for section, keys in first.items()}
+    for section, keys in second.items():
+        merged.setdefault(section, set()).update(keys)
+    return merged
+
+
+class AsyncWriter:
+    """파일 저장을 백그라운드 스레드 하나에서 순서대로 처리합니다.
+
+    같은 파일에 대한 요청이 아직 시작되지 않았다면 마지막 스냅샷만 남기고
+    합칩니다. ``save_func(path, sections, changed)`` 로 저장하고 ``(해시, 쓴
+    파일의 stat 서명, 저장 전 파일의 서명)`` 을 받으며, 기본값은 원본의 서식을
+    유지하는 :func:`config_io.patch_parameters_signed` 입니다. 완료 결과는
+    큐에 쌓였다가 ``drain()`` 을 호출한 스레드(보통 Tk 메인 스레드)에서
+    ``callback(file_hash, error, signature, previous)`` 형태로 전달됩니다.
+    서명은 저장한 순간의 값이므로 그 뒤의 외부 변경과 구별됩니다.
+    """
+
+    def __init__(self, save_func=patch_parameters_signed):
+        self._save_func = save_func
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()
+        self._results = deque()
+        self._busy = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ini-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, sections, callback=None, changed=None):
+        """``sections`` 스냅샷을 ``path`` 에 저장하도록 예약합니다.
+
+        ``changed`` 는 ``{섹션: 키 집합}`` 형태의 편집 힌트이며, 합쳐지는
+        요청들의 힌트는 합집합이 됩니다. 하나라도 ``None`` 이면 전체 비교입니다.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("AsyncWriter is closed")
+            previous = self._pending.pop(path, None)
+            callbacks = []
+            if previous is not None:
+                callbacks = previous[2]
+                changed = _merge_changes(previous[1], changed)
+            if callback is not None:
+                callbacks.append(callback)
+            self._pending[path] = (sections, changed, callbacks)
+            self._cond.notify_all()
+
+    def is_pending(self, path):
+        with self._cond:
+            return path in self._pending or self._busy == path
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                path, (sections, changed, callbacks) = self._pending.popitem(last=False)
+                self._busy = path
+            file_hash = signature = previous = error = None
+            try:
+                with tracer.span("save", trace_category(path)):
+                    file_hash, signature, previous = self._save_func(path, sections, changed)
+            except Exception as e:  # 실패는 콜백으로 전달
+                logger.warning("Failed to save %s: %s", path, e)
+                error = e
+            with self._cond:
+                self._busy = None
+                for callback in callbacks:
+                    self._results.append((callback, file_hash, error, signature, previous))
+                self._cond.notify_all()
+
+    def drain(self):
+        """완료된 저장의 콜백을 호출하고 처리한 개수를 반환합니다."""
+        count = 0
+        while True:
+            try:
+                callback, file_hash, error, signature, previous = self._results.popleft()
+            except IndexError:
+                return count
+            callback(file_hash, error, signature, previous)
+            count += 1
+
+    def flush(self, timeout=None):
+        """예약된 저장이 모두 끝날 때까지 기다립니다. 완료되면 ``True``."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and self._busy is None, timeout
+            )
+
+    def close(self, timeout=None):
+        """남은 저장을 마치고 스레드를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self.drain()
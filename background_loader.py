@@ -0,0 +1,72 @@
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 동시에 파일을 읽을 작업 스레드 수 (네트워크 드라이브의 느린 파일이 다른
+# 파일 읽기를 막지 않도록 여러 개를 둔다)
+LOAD_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class BackgroundLoader:
+    """파일 해시 계산과 파싱 같은 읽기 작업을 작업 스레드 풀에서 실행합니다.
+
+    :class:`async_writer.AsyncWriter` 와 마찬가지로 완료 결과는 큐에 쌓였다가
+    ``drain()`` 을 호출한 스레드(보통 Tk 메인 스레드)에서
+    ``callback(result, error)`` 형태로 전달됩니다.
+    """
+
+    def __init__(self, max_workers=LOAD_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ini-loader"
+        )
+        self._lock = threading.Lock()
+        self._results = deque()
+        self._running = 0
+        self._closed = False
+
+    def submit(self, func, callback, *args):
+        """``func(*args)`` 를 작업 스레드에서 실행하도록 예약합니다."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BackgroundLoader is closed")
+            self._running += 1
+        self._executor.submit(self._run, func, callback, args)
+
+    def _run(self, func, callback, args):
+        result = error = None
+        try:
+            result = func(*args)
+        except Exception as e:  # 실패는 콜백으로 전달
+            logger.warning("Background load failed: %s", e)
+            error = e
+        with self._lock:
+            self._running -= 1
+            self._results.append((callback, result, error))
+
+    @property
+    def busy(self):
+        """실행 중이거나 전달되지 않은 결과가 있으면 ``True``."""
+        with self._lock:
+            return self._running > 0 or bool(self._results)
+
+    def drain(self):
+        """완료된 작업의 콜백을 호출하고 처리한 개수를 반환합니다."""
+        count = 0
+        while True:
+            try:
+                callback, result, error = self._results.popleft()
+            except IndexError:
+                return count
+            callback(result, error)
+            count += 1
+
+    def close(self, wait=True):
+        """새 작업을 받지 않고 스레드 풀을 종료합니다. 남은 결과는 버립니다."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait)
+        self._results.clear()
@@ -0,0 +1,346 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import FIRST_KEY, FIRST_SECTION, generate_ini
+from bulk_edit import bulk_edit_file
+from config_io import (
+    compare_parameters,
+    compute_file_hash,
+    diff_parameters,
+    load_parameters,
+    patch_parameters,
+    save_parameters,
+    snapshot_parameters,
+)
+from file_watcher import FileWatcher
+from search_index import SearchIndex
+from workspace_index import summarize_file
+
+# 결과 JSON 형식이 바뀌면 올린다
+RESULT_FORMAT_VERSION = 1
+# 기본 측정 크기: (섹션 수, 섹션당 키 수)
+DEFAULT_SIZES = ((10, 100), (100, 1000))
+# 외부 변경이 반영될 때까지 기다리는 최대 시간(초)
+LATENCY_TIMEOUT_S = 10.0
+
+
+def set_first_value(path, value):
+    """생성된 파일의 첫 키 값을 ``value`` 로 바꿔 다시 씁니다 (외부 편집 흉내)."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    start = text.index(FIRST_KEY + " = ")
+    value_start = start + len(FIRST_KEY) + 3
+    end = text.index("\n", value_start)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text[:value_start] + value + text[end:])
+
+
+def measure(func, repeat):
+    """``func`` 를 ``repeat`` 번 실행한 시간과 한 번 실행할 때의 최대 메모리."""
+    func()  # 캐시 준비
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+    }
+
+
+# ----------------------------------------------------------------------
+# Tk 없이 실행하는 측정
+def core_cases(path, workdir):
+    """``([(이름, 측정할 함수), ...], 정리 함수)`` 를 반환합니다."""
+    sections = load_parameters(path)
+    copy_path = os.path.join(workdir, "copy.ini")
+    shutil.copyfile(path, copy_path)
+    edited = snapshot_parameters(sections)
+    toggle = {"value": "0"}
+
+    def parse_mapped():
+        load_parameters(path, mapped=True).close()
+
+    def save_patch():
+        # 매번 값이 바뀌어야 실제로 쓰기가 일어난다
+        toggle["value"] = "1" if toggle["value"] == "0" else "0"
+        edited[FIRST_SECTION][FIRST_KEY] = toggle["value"]
+        patch_parameters(copy_path, edited, {FIRST_SECTION: {FIRST_KEY}})
+
+    other = snapshot_parameters(sections)
+    other[FIRST_SECTION][FIRST_KEY] = "changed"
+
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(path)
+
+    index = SearchIndex(sections)
+    index.build()
+
+    return [
+        ("hash", lambda: compute_file_hash(path)),
+        ("parse", lambda: load_parameters(path)),
+        ("parse_compact", lambda: load_parameters(path, compact=True)),
+        ("parse_mapped", parse_mapped),
+        ("save_full", lambda: save_parameters(copy_path, sections)),
+        ("save_patch", save_patch),
+        (
+            "bulk_flip_file",
+            lambda: bulk_edit_file(copy_path, FIRST_KEY, flip=True, section_pattern=FIRST_SECTION),
+        ),
+        ("diff_one_value", lambda: diff_parameters(sections, other)),
+        ("compare_one_value", lambda: compare_parameters(sections, other)),
+        ("watch_poll_unchanged", watcher.poll),
+        ("search_index_build", lambda: SearchIndex(sections).build()),
+        ("search_one_key", lambda: index.search(FIRST_KEY)),
+        ("search_all_keys", lambda: index.search("param")),
+        ("workspace_summary", lambda: summarize_file(path)),
+    ], watcher.close
+
+
+def watch_latency(path, repeat):
+    """외부에서 파일을 쓴 뒤 ``FileWatcher.poll()`` 이 알아챌 때까지의 시간."""
+    watcher = FileWatcher()
+    watcher.add(path)
+    times = []
+    try:
+        for n in range(repeat):
+            set_first_value(path, str(n % 2))
+            start = time.perf_counter()
+            while not watcher.poll():
+                if time.perf_counter() - start > LATENCY_TIMEOUT_S:
+                    raise TimeoutError("file change was not detected")
+            times.append(time.perf_counter() - start)
+    finally:
+        watcher.close()
+    return {"min_s": min(times), "median_s": statistics.median(times)}
+
+
+# ----------------------------------------------------------------------
+# Tk 측정 (화면이 없으면 건너뜀)
+def _make_root():
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        return None, f"Tk unavailable: {e}"
+    root.withdraw()
+    return root, None
+
+
+def _displayed_value(tab, section, key):
+    if tab.virtual_grid is not None:
+        widgets = tab.virtual_grid.cell_widgets(section, key)
+    else:
+        widgets = tab.widget_registry.get(section, {}).get("params", {}).get(key)
+    return None if widgets is None else widgets[2].get()
+
+
+def tk_cases(path, repeat):
+    """``(이름, 결과)`` 목록을 반환합니다. Tk 를 쓸 수 없으면 ``skipped`` 결과."""
+    names = ("tab_build", "refresh_ui", "layout", "monitor_reload", "external_write_latency")
+    root, reason = _make_root()
+    if root is None:
+        return [(name, {"skipped": reason}) for name in names]
+    from gui.parameter_tab import ParameterTab
+
+    results = []
+    try:
+        def build():
+            tab = ParameterTab(root, path)
+            root.update_idletasks()
+            tab.destroy()
+
+        results.append(("tab_build", measure(build, repeat)))
+
+        tab = ParameterTab(root, path)
+        tab.pack()
+        root.update_idletasks()
+
+        def refresh():
+            tab.refresh_ui()
+            root.update_idletasks()
+
+        results.append(("refresh_ui", measure(refresh, repeat)))
+
+        def layout():
+            tab.grid_columns = 3 if tab.grid_columns != 3 else 5
+            tab.layout_parameters()
+            root.update_idletasks()
+
+        results.append(("layout", measure(layout, repeat)))
+
+        counter = {"n": 0}
+
+        def reload():
+            counter["n"] += 1
+            set_first_value(path, str(counter["n"] % 2))
+            tab.monitor_file_changes()
+            root.update_idletasks()
+
+        results.append(("monitor_reload", measure(reload, repeat)))
+
+        # 외부 쓰기 → 감시자 → 탭 모델 → 위젯 표시까지의 지연
+        watcher = FileWatcher()
+        watcher.add(path, tab.last_file_hash)
+        times = []
+        for n in range(repeat):
+            value = "latency%d" % n
+            set_first_value(path, value)
+            start = time.perf_counter()
+            while _displayed_value(tab, FIRST_SECTION, FIRST_KEY) != value:
+                for _path, new_hash in watcher.poll():
+                    tab.monitor_file_changes(new_hash)
+                root.update()
+                if time.perf_counter() - start > LATENCY_TIMEOUT_S:
+                    raise TimeoutError("widget was not updated")
+            times.append(time.perf_counter() - start)
+        watcher.close()
+        results.append((
+            "external_write_latency",
+            {"min_s": min(times), "median_s": statistics.median(times)},
+        ))
+        tab.destroy()
+    finally:
+        root.destroy()
+    return results
+
+
+# ----------------------------------------------------------------------
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run(sizes, value_length=8, repeat=5, include_tk=True, log=None):
+    """모든 측정을 실행하고 JSON 으로 직렬화할 수 있는 결과를 반환합니다."""
+    results = []
+    for sections, keys in sizes:
+        workdir = tempfile.mkdtemp(prefix="ini-bench-")
+        try:
+            path = os.path.join(workdir, "bench.ini")
+            file_bytes = generate_ini(path, sections, keys, value_length)
+            size = {
+                "sections": sections,
+                "keys": keys,
+                "value_length": value_length,
+                "file_bytes": file_bytes,
+            }
+            cases, cleanup = core_cases(path, workdir)
+            timed = [(name, measure(func, repeat)) for name, func in cases]
+            cleanup()
+            timed.append(("watch_detect_latency", watch_latency(path, repeat)))
+            for name, result in timed:
+                results.append({"case": name, "group": "core", **size, **result})
+            if include_tk:
+                for name, result in tk_cases(path, repeat):
+                    results.append({"case": name, "group": "tk", **size, **result})
+            if log is not None:
+                log(f"{sections}x{keys}: done ({file_bytes} bytes)")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "version": RESULT_FORMAT_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current):
+    """같은 측정 항목의 median 비율(현재/기준) 표를 문자열 목록으로 반환합니다."""
+    def key(r):
+        return (r["case"], r["sections"], r["keys"], r["value_length"])
+
+    old = {key(r): r for r in baseline["results"] if "median_s" in r}
+    lines = []
+    for r in current["results"]:
+        base = old.get(key(r))
+        if base is None or "median_s" not in r or not base["median_s"]:
+            continue
+        ratio = r["median_s"] / base["median_s"]
+        lines.append(
+            f"{r['case']:<24} {r['sections']:>5}x{r['keys']:<6} "
+            f"{base['median_s'] * 1000:10.2f} ms -> {r['median_s'] * 1000:10.2f} ms  x{ratio:.2f}"
+        )
+    return lines
+
+
+def _parse_sizes(text):
+    sizes = []
+    for item in text.split(","):
+        sections, keys = item.lower().split("x")
+        sizes.append((int(sections), int(keys)))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure parse/save/hash/watch/render performance on synthetic INI files."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=DEFAULT_SIZES,
+        help="comma separated SECTIONSxKEYS list, e.g. 10x100,100x1000",
+    )
+    parser.add_argument("--value-length", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-tk", action="store_true", help="skip the Tk cases")
+    parser.add_argument("--output", help="write the JSON result to this file")
+    parser.add_argument("--compare", help="baseline JSON result to compare against")
+    args = parser.parse_args(argv)
+
+    result = run(
+        args.sizes,
+        value_length=args.value_length,
+        repeat=args.repeat,
+        include_tk=not args.no_tk,
+        log=lambda msg: print(msg, file=sys.stderr),
+    )
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        for line in compare(baseline, result):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import random
+import string
+
+# 생성되는 값의 종류별 비율: 토글 값 "0"/"1" 이 대부분인 실제 파일과 비슷하게
+TOGGLE_RATIO = 0.7
+
+# 생성된 파일의 첫 섹션과 첫 키 (외부 변경 지연 측정에 사용)
+FIRST_SECTION = "Section00000"
+FIRST_KEY = "param_0_0"
+
+
+def section_name(index):
+    return f"Section{index:05d}"
+
+
+def make_value(rng, value_length):
+    if value_length <= 1 or rng.random() < TOGGLE_RATIO:
+        return rng.choice("01")
+    return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(value_length))
+
+
+def generate_ini(path, sections, keys, value_length=8, seed=0, comments=True):
+    """``sections`` × ``keys`` 크기의 합성 INI 파일을 만들고 바이트 수를 반환합니다.
+
+    같은 ``seed`` 면 항상 같은 내용이 만들어지므로 커밋 간 결과를 비교할 수
+    있습니다. ``comments`` 가 참이면 섹션마다 주석과 빈 줄을 넣어 서식을
+    보존하는 저장 경로도 함께 측정되게 합니다.
+    """
+    rng = random.Random(seed)
+    size = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for s in range(sections):
+            lines = []
+            if comments:
+                lines.append(f"; generated section {s}\n")
+            lines.append(f"[{section_name(s)}]\n")
+            for k in range(keys):
+                lines.append(f"param_{s}_{k} = {make_value(rng, value_length)}\n")
+            if comments:
+                lines.append("\n")
+            chunk = "".join(lines)
+            f.write(chunk)
+            size += len(chunk.encode("utf-8"))
+    return size
+
@@ -0,0 +1,89 @@
+import re
+from fnmatch import translate
+
+from config_io import load_parameters, patch_parameters
+
+# 일괄 편집에서 값을 반전할 때의 켜짐 값 (토글 버튼과 같은 규칙)
+ON_VALUE = "1"
+OFF_VALUE = "0"
+
+
+def _has_magic(pattern):
+    return any(ch in pattern for ch in "*?[")
+
+
+def _matcher(pattern):
+    """glob 패턴을 ``이름 -> bool`` 함수로 바꿉니다 (대소문자 구분)."""
+    if not _has_magic(pattern):
+        return pattern.__eq__
+    return re.compile(translate(pattern)).match
+
+
+def flip_value(value):
+    return OFF_VALUE if value == ON_VALUE else ON_VALUE
+
+
+def plan_bulk_edit(sections, key_pattern, value=None, section_pattern="*", flip=False):
+    """일괄 편집으로 실제로 바뀌는 값을 ``{섹션: {키: 새 값}}`` 으로 반환합니다.
+
+    ``section_pattern`` 과 ``key_pattern`` 은 ``fnmatch`` 형식의 glob
+    패턴입니다. ``flip`` 이 참이면 각 값을 ON/OFF 반전하고, 아니면
+    ``value`` 로 바꿉니다. 이미 같은 값인 키는 결과에 들어가지 않습니다.
+    """
+    if not flip and value is None:
+        raise ValueError("either value or flip is required")
+    match_section = _matcher(section_pattern)
+    match_key = _matcher(key_pattern)
+    exact_key = None if _has_magic(key_pattern) else key_pattern
+    changes = {}
+    for section, params in sections.items():
+        if not match_section(section):
+            continue
+        if exact_key is not None:
+            # 와일드카드가 없으면 키를 바로 찾는다
+            keys = (exact_key,) if exact_key in params else ()
+        else:
+            keys = [key for key in params.keys() if match_key(key)]
+        section_changes = {}
+        for key in keys:
+            old = params[key]
+            new = flip_value(old) if flip else value
+            if new != old:
+                section_changes[key] = new
+        if section_changes:
+            changes[section] = section_changes
+    return changes
+
+
+def apply_changes(sections, changes):
+    """``plan_bulk_edit`` 결과를 모델에 한 번에 반영합니다.
+
+    저장 힌트로 쓸 ``{섹션: 키 집합}`` 을 반환합니다.
+    """
+    hints = {}
+    for section, values in changes.items():
+        params = sections[section]
+        for key, value in values.items():
+            params[key] = value
+        hints[section] = set(values)
+    return hints
+
+
+def count_changes(changes):
+    return sum(len(values) for values in changes.values())
+
+
+def bulk_edit_file(path, key_pattern, value=None, section_pattern="*", flip=False):
+    """열려 있지 않은 파일에 일괄 편집을 적용하고 바뀐 값의 개수를 반환합니다.
+
+    파일을 메모리 매핑해 한 번만 훑고(일치한 키의 값만 디코딩), 그 인덱스로
+    바뀐 줄만 고쳐 한 번에 씁니다. 바뀐 값이 없으면 파일을 쓰지 않습니다.
+    """
+    sections = load_parameters(path, mapped=True)
+    try:
+        changes = plan_bulk_edit(sections, key_pattern, value, section_pattern, flip)
+        if changes:
+            patch_parameters(path, sections, apply_changes(sections, changes))
+    finally:
+        sections.close()
+    return count_changes(changes)
@@ -1,20 +1,79 @@
 import hashlib
+import logging
+import mmap
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from array import array
 from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from parameter_store import INTERN_VALUE_MAX_LEN, ParameterStore, SectionStore
+
+logger = logging.getLogger(__name__)
+
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+# 이 크기 이상의 파일만 여러 프로세스로 나누어 파싱 (작으면 프로세스 시작이 더 느리다)
+PARALLEL_PARSE_THRESHOLD = 32 * 1024 * 1024
+# 병렬 파싱의 최대 작업 프로세스 수와 작업자당 조각 수 (섹션 크기가 고르지
+# 않아도 작업자들이 비슷하게 끝나도록 조각을 더 잘게 나눈다)
+PARSE_WORKERS = os.cpu_count() or 1
+SHARDS_PER_WORKER = 4
+# 저장할 수 있는 파일을 메모리 매핑할지 여부. Windows 에서는 매핑이 열려 있는
+# 파일을 os.replace 로 교체할 수 없으므로 매핑 대신 내용을 메모리로 읽는다
+MAP_EDITED_FILES = os.name != "nt"
+
+# /proc 에서 umask 를 읽을 수 없는 플랫폼에서 한 번 알아낸 umask
+_fallback_umask = None
+_umask_lock = threading.Lock()
+
+
+def stat_signature(path):
+    """``(mtime_ns, size, inode)`` 튜플을 반환하고 파일이 없으면 ``None``."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
 
 def compute_file_hash(filepath):
-    """파일이 존재하면 md5 해시를 반환하고 없으면 ``None``을 반환합니다."""
+    """파일이 존재하면 md5 해시를 반환하고 없으면 ``None``을 반환합니다.
+
+    파일 전체를 메모리에 올리지 않도록 일정 크기씩 나누어 읽습니다.
+    """
     if not filepath:
         return None
+    digest = hashlib.md5()
     try:
         with open(filepath, "rb") as file:
-            return hashlib.md5(file.read()).hexdigest()
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
     except FileNotFoundError:
         return None
+    return digest.hexdigest()
+
 
+def load_parameters(filepath, mapped=False, compact=False, parallel=False):
+    """INI 형식 파일을 읽어 ``OrderedDict`` 구조로 파라미터를 불러옵니다.
 
-def load_parameters(filepath):
-    """INI 형식 파일을 읽어 ``OrderedDict`` 구조로 파라미터를 불러옵니다."""
+    ``mapped`` 가 참이면 파일을 메모리 매핑하고 값은 접근할 때 디코딩하는
+    :class:`MappedParameters` 를, ``compact`` 가 참이면 키/값을 병렬 리스트로
+    보관하는 :class:`parameter_store.ParameterStore` 를 반환합니다.
+    ``parallel`` 이 참이면 큰 파일을 섹션 경계에서 나누어 여러 프로세스에서
+    파싱합니다 (:func:`load_parameters_parallel`).
+    """
+    if mapped:
+        return load_parameters_mapped(filepath)
+    if parallel:
+        return load_parameters_parallel(filepath, compact=compact)
+    if compact:
+        return _load_parameters_compact(filepath)
     sections = OrderedDict()
     if not filepath:
         return sections
@@ -34,14 +93,833 @@ def load_parameters(filepath):
     return sections
 
 
+def _load_parameters_compact(filepath):
+    """:func:`load_parameters` 와 같은 규칙으로 ``ParameterStore`` 를 만듭니다.
+
+    섹션 하나를 다 읽을 때마다 임시 ``dict`` 를 ``SectionStore`` 로 바꾸므로
+    불러오는 동안에도 최대 메모리가 섹션 하나 분량만큼만 늘어납니다.
+    """
+    sections = ParameterStore()
+    if not filepath:
+        return sections
+    pool = {}
+    current_section = "DEFAULT"
+    current = {}
+    with open(filepath, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                sections[current_section] = SectionStore.from_dict(current, pool)
+                current_section = line[1:-1].strip()
+                current = {}
+            elif "=" in line:
+                key, value = map(str.strip, line.split("=", 1))
+                current[key] = value
+    sections[current_section] = SectionStore.from_dict(current, pool)
+    return sections
+
+
+def _is_header(line):
+    line = line.strip()
+    return line[:1] == b"[" and line[-1:] == b"]"
+
+
+def shard_ranges(filepath, count):
+    """파일을 섹션 머리줄에서 시작하는 최대 ``count`` 개의 바이트 범위로 나눕니다.
+
+    ``[(start, end), ...]`` 를 파일 순서대로 반환합니다. 첫 범위는 파일
+    처음(암묵적인 ``DEFAULT`` 섹션)부터 시작하고, 나머지는 줄 맨 앞의 ``[``
+    로 시작하는 섹션 머리줄에서 시작합니다. 경계를 찾지 못한 부분은 앞
+    범위에 합쳐집니다.
+    """
+    with open(filepath, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0 or count <= 1:
+            return [(0, size)]
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            starts = [0]
+            for i in range(1, count):
+                pos = max(size * i // count, starts[-1]) - 1
+                while True:
+                    pos = buf.find(b"\n[", pos + 1)
+                    if pos < 0:
+                        break
+                    line_end = buf.find(b"\n", pos + 1)
+                    if _is_header(buf[pos + 1:size if line_end < 0 else line_end]):
+                        break
+                if pos < 0:
+                    break
+                if pos + 1 > starts[-1]:
+                    starts.append(pos + 1)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _parse_shard(filepath, start, end):
+    """파일의 ``[start, end)`` 범위를 ``[(섹션 이름, 키 리스트, 값 리스트), ...]`` 로
+    파싱합니다.
+
+    작업 프로세스에서 실행됩니다. 머리줄이 나올 때마다 새 항목을 만들고,
+    파일 처음부터 시작하는 조각은 ``DEFAULT`` 항목으로 시작합니다. 같은
+    키와 짧은 값은 한 객체로 공유해 두므로 pickle 이 한 번만 보냅니다.
+    """
+    with open(filepath, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+    if "\r" in text:
+        # 텍스트 모드로 읽을 때와 같은 줄 나눔
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    current = {}
+    blocks = [("DEFAULT", current)] if start == 0 else []
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = {}
+            blocks.append((line[1:-1].strip(), current))
+        elif "=" in line:
+            key, value = map(str.strip, line.split("=", 1))
+            current[key] = value
+    pool = {}
+    share = pool.setdefault
+    return [
+        (
+            name,
+            [share(key, key) for key in params],
+            [
+                share(value, value) if len(value) <= INTERN_VALUE_MAX_LEN else value
+                for value in params.values()
+            ],
+        )
+        for name, params in blocks
+    ]
+
+
+def load_parameters_parallel(filepath, compact=False, workers=None, threshold=None):
+    """큰 파일을 섹션 경계에서 나누어 프로세스 풀에서 파싱합니다.
+
+    결과는 :func:`load_parameters` 와 같습니다. 조각은 파일 순서대로 합쳐지며,
+    다시 나온 섹션이 앞의 내용을 대체하되 처음 위치를 유지하는 규칙과
+    ``DEFAULT`` 섹션 규칙도 그대로입니다. 파일이 ``threshold`` (기본값
+    ``PARALLEL_PARSE_THRESHOLD``) 보다 작거나 작업자가 하나뿐이거나 프로세스
+    풀을 시작할 수 없거나 도중에 깨지면 현재 스레드에서 파싱합니다. 작업
+    프로세스는 GUI 의 스레드를 복제하지 않도록 ``spawn`` 방식으로 시작합니다.
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    threshold = PARALLEL_PARSE_THRESHOLD if threshold is None else threshold
+    try:
+        size = os.path.getsize(filepath) if filepath else 0
+    except OSError:
+        size = 0
+    if workers <= 1 or size < threshold:
+        return load_parameters(filepath, compact=compact)
+    ranges = shard_ranges(filepath, workers * SHARDS_PER_WORKER)
+    if len(ranges) == 1:
+        return load_parameters(filepath, compact=compact)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            shards = list(
+                pool.map(
+                    _parse_shard,
+                    [filepath] * len(ranges),
+                    [start for start, _end in ranges],
+                    [end for _start, end in ranges],
+                )
+            )
+    except (OSError, ImportError, RuntimeError, BrokenProcessPool) as e:
+        # 풀 시작 실패(세마포어 미지원, 고정 실행 파일 등)도 순차 파싱으로 대신합니다
+        logger.warning("Parallel parse of %s failed, parsing sequentially: %s", filepath, e)
+        return load_parameters(filepath, compact=compact)
+    sections = ParameterStore() if compact else OrderedDict()
+    for blocks in shards:
+        for name, keys, values in blocks:
+            if compact:
+                sections[name] = SectionStore.from_lists(keys, values)
+            else:
+                sections[name] = OrderedDict(zip(keys, values))
+    return sections
+
+
+class _SectionIndex:
+    """파일 안에서 한 섹션이 차지하는 범위와 키/값 오프셋.
+
+    키 오프셋은 섹션 시작(``start``)에 대한 상대 위치이므로, 앞쪽 섹션의
+    길이가 바뀌어도 ``start``/``end`` 만 옮기면 그대로 쓸 수 있습니다.
+    """
+
+    __slots__ = (
+        "name", "start", "end", "header_end", "keys", "slots", "offsets", "shadowed"
+    )
+
+    def __init__(self, name, start, header_end=0):
+        self.name = name
+        self.start = start
+        self.end = start
+        self.header_end = header_end
+        self.keys = []
+        self.slots = {}
+        # 키마다 (줄 시작, 줄 끝, 값 시작, 값 끝) 네 개의 상대 바이트 오프셋
+        self.offsets = array("q")
+        # 같은 키가 다시 나와 가려진 줄의 (키, 줄 시작, 줄 끝)
+        self.shadowed = None
+
+    def moved(self, start):
+        """같은 내용을 ``start`` 위치로 옮긴 인덱스를 반환합니다."""
+        clone = _SectionIndex.__new__(_SectionIndex)
+        for name in _SectionIndex.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.end = start + (self.end - self.start)
+        clone.start = start
+        return clone
+
+
+def build_index(buf):
+    """바이트 버퍼를 한 번 훑어 섹션 범위와 키/값 바이트 오프셋을 만듭니다.
+
+    ``load_parameters`` 와 같은 규칙을 따릅니다. 같은 섹션이 다시 나오면
+    나중 것이 앞의 내용을 대체하고, 같은 키가 다시 나오면 처음 위치에 나중
+    값이 쓰입니다. 반환 값은 파일에 나온 순서대로의 :class:`_SectionIndex`
+    목록이며 첫 항목은 암묵적인 ``DEFAULT`` 섹션입니다.
+    """
+    current = _SectionIndex("DEFAULT", 0)
+    spans = [current]
+    size = len(buf)
+    pos = 0
+    while pos < size:
+        newline = buf.find(b"\n", pos)
+        end = size if newline < 0 else newline + 1
+        line = buf[pos:end]
+        stripped = line.strip()
+        if stripped and stripped[:1] not in (b"#", b";"):
+            if stripped[:1] == b"[" and stripped[-1:] == b"]":
+                current.end = pos
+                name = stripped[1:-1].decode("utf-8").strip()
+                current = _SectionIndex(name, pos, end - pos)
+                spans.append(current)
+            else:
+                eq = line.find(b"=")
+                if eq >= 0:
+                    key = sys.intern(line[:eq].decode("utf-8").strip())
+                    base = pos - current.start
+                    value_end = len(line.rstrip(b"\r\n"))
+                    offsets = (base, base + len(line), base + eq + 1, base + value_end)
+                    slot = current.slots.get(key)
+                    if slot is None:
+                        current.slots[key] = len(current.keys)
+                        current.keys.append(key)
+                        current.offsets.extend(offsets)
+                    else:
+                        if current.shadowed is None:
+                            current.shadowed = []
+                        old = current.offsets[slot * 4:slot * 4 + 2]
+                        current.shadowed.append((key, old[0], old[1]))
+                        current.offsets[slot * 4:slot * 4 + 4] = array("q", offsets)
+        pos = end
+    current.end = size
+    return spans
+
+
+class MappedSection(MutableMapping):
+    """메모리 매핑된 파일 위에서 값을 지연 디코딩하는 섹션 매핑.
+
+    값을 바꾸거나 키를 추가하면 덮어쓴 값만 파이썬 문자열로 보관합니다.
+    키 목록은 인덱스와 공유하다가 키가 추가되거나 삭제될 때 복사합니다.
+    """
+
+    __slots__ = (
+        "_buf", "_base", "_keys", "_slots", "_offsets", "_overrides", "_owned"
+    )
+
+    def __init__(self, buf, index):
+        self._buf = buf
+        self._base = index.start
+        self._keys = index.keys
+        self._slots = index.slots
+        self._offsets = index.offsets
+        self._overrides = {}
+        self._owned = False
+
+    def _detach(self):
+        if not self._owned:
+            self._keys = list(self._keys)
+            self._slots = dict(self._slots)
+            self._owned = True
+
+    def __getitem__(self, key):
+        if key in self._overrides:
+            return self._overrides[key]
+        slot = self._slots[key]
+        start = self._base + self._offsets[slot * 4 + 2]
+        end = self._base + self._offsets[slot * 4 + 3]
+        return self._buf[start:end].decode("utf-8").strip()
+
+    def __setitem__(self, key, value):
+        if key not in self._slots:
+            self._detach()
+            self._slots[key] = -1
+            self._keys.append(key)
+        self._overrides[key] = value
+
+    def __delitem__(self, key):
+        if key not in self._slots:
+            raise KeyError(key)
+        self._detach()
+        del self._slots[key]
+        self._keys.remove(key)
+        self._overrides.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def copy(self):
+        """매핑과 오프셋은 공유하고 덮어쓴 값만 복사한 섹션을 만듭니다."""
+        clone = MappedSection.__new__(MappedSection)
+        clone._buf = self._buf
+        clone._base = self._base
+        clone._offsets = self._offsets
+        clone._keys = list(self._keys) if self._owned else self._keys
+        clone._slots = dict(self._slots) if self._owned else self._slots
+        clone._owned = self._owned
+        clone._overrides = dict(self._overrides)
+        return clone
+
+    def __repr__(self):
+        return f"MappedSection({len(self._keys)} keys)"
+
+
+class MappedParameters(OrderedDict):
+    """``load_parameters`` 와 같은 매핑 인터페이스를 가진 메모리 매핑 모델.
+
+    섹션 값은 :class:`MappedSection` 이며 파일 내용은 매핑을 통해서만
+    읽습니다. 매핑된 파일을 제자리에서 잘라 쓰면 읽기가 실패하므로 이
+    모듈의 ``save_parameters`` 는 항상 임시 파일을 만든 뒤 교체합니다.
+    ``MAP_EDITED_FILES`` 가 거짓이면(Windows) 교체가 막히지 않도록 파일을
+    매핑하지 않고 메모리로 읽으며, 값은 마찬가지로 접근할 때 디코딩합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._mmap = None
+        self.index = []
+
+    def close(self):
+        """매핑을 해제합니다. 이후에는 값을 읽을 수 없습니다."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def load_parameters_mapped(filepath):
+    """파일을 메모리 매핑해 :class:`MappedParameters` 로 불러옵니다.
+
+    만든 인덱스는 저장용 레이아웃 캐시에도 넣어 두므로, 곧바로
+    :func:`patch_parameters` 로 저장할 때 파일을 다시 훑지 않습니다.
+    """
+    sections = MappedParameters()
+    if not filepath:
+        return sections
+    with open(filepath, "rb") as file:
+        st = os.fstat(file.fileno())
+        if st.st_size:
+            buf = _map_for_edit(file)
+            if isinstance(buf, mmap.mmap):
+                sections._mmap = buf
+        else:
+            buf = b""
+    sections.index = build_index(buf)
+    if st.st_size:
+        _store_layout(filepath, (st.st_mtime_ns, st.st_size, st.st_ino), sections.index)
+    for span in sections.index:
+        sections[span.name] = MappedSection(buf, span)
+    return sections
+
+
+def snapshot_parameters(sections):
+    """저장용으로 섹션 구조의 얕은 복사본을 만듭니다.
+
+    값 문자열은 원본과 공유하므로 복사 비용은 키 개수에 비례하는 포인터
+    복사뿐이며, 이후 원본을 수정해도 복사본에는 영향이 없습니다.
+    """
+    return OrderedDict((section, params.copy()) for section, params in sections.items())
+
+
+def _serialize_chunks(sections):
+    for section, params in sections.items():
+        lines = [] if section == "DEFAULT" else [f"[{section}]\n"]
+        lines.extend(f"{key}={value}\n" for key, value in params.items())
+        lines.append("\n")
+        yield "".join(lines).encode("utf-8")
+
+
+def write_atomic(filepath, chunks):
+    """바이트 조각들을 임시 파일에 쓰고 fsync 한 뒤 원래 파일과 교체합니다.
+
+    저장 도중 프로세스가 종료되어도 원본 파일(과 그 파일의 메모리 매핑)이
+    잘린 상태로 남지 않습니다. 쓴 바이트의 md5 해시와 쓴 파일의 stat 서명
+    ``(해시, 서명)`` 을 반환하므로 저장 후 파일을 다시 읽을 필요가 없습니다.
+    서명은 교체 전에 쓴 파일 자체에서 얻으므로, 교체 직후 다른 프로세스가
+    파일을 바꿔도 그 내용이 우리가 쓴 것으로 기록되지 않습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(filepath)}.", suffix=".tmp", dir=directory
+    )
+    digest = hashlib.md5()
+    try:
+        with open(fd, "wb") as file:
+            for chunk in chunks:
+                digest.update(chunk)
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+            # 이름을 바꿔도 mtime, 크기, inode 는 그대로다
+            st = os.fstat(file.fileno())
+        _copy_mode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+    return digest.hexdigest(), (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def save_parameters(filepath, sections):
-    """파라미터 섹션 구조를 INI 형식 파일로 저장합니다."""
+    """파라미터 섹션 구조를 INI 형식 파일로 저장합니다.
+
+    :func:`write_atomic` 으로 저장하며 쓴 내용의 md5 해시를 반환합니다.
+    """
     if not filepath:
+        return None
+    return write_atomic(filepath, _serialize_chunks(sections))[0]
+
+
+# 패치 저장용 레이아웃 인덱스 캐시: 경로 -> (stat 서명, 섹션 인덱스 목록)
+LAYOUT_CACHE_SIZE = 32
+_layout_cache = OrderedDict()
+_layout_lock = threading.Lock()
+
+
+def _cached_layout(filepath, signature):
+    with _layout_lock:
+        cached = _layout_cache.get(filepath)
+        if cached is None or cached[0] != signature:
+            return None
+        _layout_cache.move_to_end(filepath)
+        return cached[1]
+
+
+def _store_layout(filepath, signature, spans):
+    with _layout_lock:
+        _layout_cache[filepath] = (signature, spans)
+        _layout_cache.move_to_end(filepath)
+        while len(_layout_cache) > LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
+
+
+def _ends_with_newline(buf, piece):
+    if isinstance(piece, tuple):
+        return piece[1] == piece[0] or buf[piece[1] - 1:piece[1]] == b"\n"
+    return not piece or piece[-1:] == b"\n"
+
+
+def _rewrite_span(buf, span, params, newline):
+    """키 순서가 바뀐 섹션은 헤더만 남기고 본문을 모델 순서로 다시 씁니다."""
+    header = buf[span.start:span.start + span.header_end]
+    if header and not header.endswith(b"\n"):
+        header += newline
+    body = b"".join(f"{k}={v}".encode("utf-8") + newline for k, v in params.items())
+    return header + body
+
+
+def _patch_span(buf, span, params, changed_keys, newline):
+    """섹션 한 개를 패치한 바이트를 반환하고, 바뀐 것이 없으면 ``None``.
+
+    ``changed_keys`` 가 주어지면 그 키들의 값만 비교합니다.
+    """
+    base = span.start
+    offsets = span.offsets
+    slots = span.slots
+    model_keys = list(params.keys())
+    if span.keys == model_keys:
+        removed = added = ()
+        common = model_keys
+    else:
+        removed = [key for key in span.keys if key not in params]
+        added = [key for key in model_keys if key not in slots]
+        common = [key for key in model_keys if key in slots]
+        if [key for key in span.keys if key in params] != common:
+            return _rewrite_span(buf, span, params, newline)
+    if changed_keys is not None:
+        common = [key for key in changed_keys if key in slots and key in params]
+
+    edits = []
+    for key in common:
+        slot = slots[key] * 4
+        value_start = base + offsets[slot + 2]
+        value_end = base + offsets[slot + 3]
+        raw = buf[value_start:value_end]
+        new_value = params[key]
+        if raw.decode("utf-8").strip() == new_value:
+            continue
+        core = raw.strip()
+        start = value_start + (len(raw) - len(raw.lstrip())) if core else value_end
+        edits.append((start, start + len(core), new_value.encode("utf-8")))
+    if removed:
+        removed_set = set(removed)
+        for key in removed:
+            slot = slots[key] * 4
+            edits.append((base + offsets[slot], base + offsets[slot + 1], b""))
+        for key, line_start, line_end in span.shadowed or ():
+            if key in removed_set:
+                edits.append((base + line_start, base + line_end, b""))
+    if added:
+        if offsets:
+            insert_at = base + max(offsets[1::4])
+        elif span.header_end:
+            insert_at = base + span.header_end
+        else:
+            insert_at = span.end
+        text = b"".join(
+            f"{key}={params[key]}".encode("utf-8") + newline for key in added
+        )
+        if insert_at > 0 and buf[insert_at - 1:insert_at] != b"\n":
+            text = newline + text
+        edits.append((insert_at, insert_at, text))
+    if not edits:
+        return None
+
+    edits.sort(key=lambda edit: (edit[0], edit[1]))
+    parts = []
+    pos = span.start
+    for start, end, replacement in edits:
+        parts.append(buf[pos:start])
+        parts.append(replacement)
+        pos = max(pos, end)
+    parts.append(buf[pos:span.end])
+    return b"".join(parts)
+
+
+def _patch_layout(buf, spans, sections, changed):
+    """원본 버퍼와 인덱스를 기준으로 저장할 조각과 새 인덱스를 만듭니다.
+
+    조각은 원본에서 그대로 복사할 ``(start, end)`` 범위이거나 새 바이트입니다.
+    """
+    first_newline = buf.find(b"\n")
+    newline = b"\r\n" if first_newline > 0 and buf[first_newline - 1] == 13 else b"\n"
+    occurrences = OrderedDict()
+    for span in spans:
+        occurrences.setdefault(span.name, []).append(span)
+    model_names = list(sections)
+    common_file = [name for name in occurrences if name in sections]
+    new_names = [name for name in model_names if name not in occurrences]
+    if model_names == common_file + new_names:
+        # 기존 섹션의 순서가 그대로면 파일 순서대로 두고 새 섹션은 끝에 붙인다
+        order = spans + new_names
+    else:
+        # 순서가 바뀌면 같은 이름의 출현들을 모아 모델 순서대로 옮긴다
+        order = [spans[0]]
+        for name in model_names:
+            if name in occurrences:
+                order.extend(span for span in occurrences[name] if span is not spans[0])
+            else:
+                order.append(name)
+
+    pieces = []
+    new_spans = []
+    out = 0
+
+    def append_gap(gap):
+        nonlocal out
+        pieces.append(gap)
+        new_spans[-1].end += len(gap)
+        out += len(gap)
+
+    def append_new_section(name):
+        nonlocal out
+        if not _ends_with_newline(buf, pieces[-1]):
+            append_gap(newline)
+        if out:
+            append_gap(newline)
+        data = f"[{name}]".encode("utf-8") + newline + b"".join(
+            f"{key}={value}".encode("utf-8") + newline
+            for key, value in sections[name].items()
+        )
+        pieces.append(data)
+        new_spans.append(build_index(data)[-1].moved(out))
+        out += len(data)
+
+    for span in order:
+        if isinstance(span, str):
+            append_new_section(span)
+            continue
+        name = span.name
+        if name not in sections:
+            if span is not spans[0]:
+                continue
+            data = _patch_span(buf, span, {}, None, newline)
+        elif occurrences[name][-1] is not span:
+            data = None
+        else:
+            keys = None if changed is None else changed.get(name, ())
+            data = _patch_span(buf, span, sections[name], keys, newline)
+        if pieces and span.header_end and not _ends_with_newline(buf, pieces[-1]):
+            append_gap(newline)
+        if data is None:
+            pieces.append((span.start, span.end))
+            new_spans.append(span.moved(out))
+            out += span.end - span.start
+        else:
+            pieces.append(data)
+            reindexed = build_index(data)[-1 if span.header_end else 0]
+            new_spans.append(reindexed.moved(out))
+            out += len(data)
+
+    return pieces, new_spans
+
+
+def _emit_pieces(buf, pieces):
+    view = memoryview(buf)
+    try:
+        for piece in pieces:
+            if isinstance(piece, tuple):
+                chunk = view[piece[0]:piece[1]]
+                yield chunk
+                chunk.release()
+            else:
+                yield piece
+    finally:
+        view.release()
+
+
+def patch_parameters(filepath, sections, changed=None):
+    """원본 파일의 주석, 빈 줄, 서식을 유지한 채 바뀐 줄만 고쳐 저장합니다.
+
+    바뀐 값은 해당 값 부분만, 추가된 키는 섹션의 마지막 키 뒤에, 삭제된 키는
+    그 줄만 고치며 나머지 바이트는 원본에서 그대로 복사합니다. 새 섹션은
+    파일 끝에 붙습니다. ``changed`` 에 ``{섹션: 키 목록}`` 을 주면 그 키들의
+    값만 비교하므로 비교 비용이 편집 크기에 비례합니다. 저장한 파일의 인덱스는
+    고친 섹션만 다시 훑어 캐시해 두었다가 다음 저장에 사용합니다.
+
+    원본이 없거나 비어 있으면 :func:`save_parameters` 와 같이 새로 씁니다.
+    반환 값은 쓴 내용의 md5 해시입니다.
+    """
+    if not filepath:
+        return None
+    return patch_parameters_signed(filepath, sections, changed)[0]
+
+
+def patch_parameters_signed(filepath, sections, changed=None):
+    """:func:`patch_parameters` 와 같지만 ``(해시, 쓴 파일의 서명, 이전 서명)`` 을 반환합니다.
+
+    쓴 파일의 stat 서명은 :func:`write_atomic` 이 얻은 값이므로 감시자에 우리가
+    쓴 내용으로 기록할 때 씁니다. 이전 서명은 패치한 원본 파일의 서명(없었으면
+    ``None``)이며, 호출한 쪽이 마지막으로 확인한 서명과 다르면 그 사이의 외부
+    변경 위에 패치한 것입니다.
+    """
+    if not filepath:
+        return None, None, None
+    try:
+        file = open(filepath, "rb")
+    except FileNotFoundError:
+        return (*write_atomic(filepath, _serialize_chunks(sections)), None)
+    with file:
+        st = os.fstat(file.fileno())
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if not st.st_size:
+            return (*write_atomic(filepath, _serialize_chunks(sections)), signature)
+        buf = _map_for_edit(file)
+    try:
+        spans = _cached_layout(filepath, signature)
+        if spans is None:
+            spans = build_index(buf)
+        pieces, new_spans = _patch_layout(buf, spans, sections, changed)
+        file_hash, written = write_atomic(filepath, _emit_pieces(buf, pieces))
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+    _store_layout(filepath, written, new_spans)
+    return file_hash, written, signature
+
+
+def _map_for_edit(file):
+    """저장할 수 있는 파일의 내용을 매핑하거나, Windows 에서는 메모리로 읽습니다."""
+    if MAP_EDITED_FILES:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return file.read()
+
+
+def _fsync_dir(directory):
+    """교체된 디렉터리 항목이 디스크에 기록되도록 합니다 (가능한 경우)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
         return
-    with open(filepath, "w", encoding="utf-8") as file:
-        for section, params in sections.items():
-            if section != "DEFAULT":
-                file.write(f"[{section}]\n")
-            for key, value in params.items():
-                file.write(f"{key}={value}\n")
-            file.write("\n")
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _current_umask():
+    """프로세스의 umask 를 바꾸지 않고 읽습니다.
+
+    Linux 에서는 ``/proc/self/status`` 의 ``Umask:`` 줄을 읽습니다. 그 밖의
+    플랫폼에서는 처음 한 번만 ``os.umask`` 로 알아내는데, 그동안 다른
+    스레드가 만드는 파일이 더 넓은 권한을 갖지 않도록 0o077 로 바꿨다가
+    되돌립니다.
+    """
+    global _fallback_umask
+    try:
+        with open("/proc/self/status", "rb") as status:
+            for line in status:
+                if line.startswith(b"Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    with _umask_lock:
+        if _fallback_umask is None:
+            _fallback_umask = os.umask(0o077)
+            os.umask(_fallback_umask)
+        return _fallback_umask
+
+
+def _copy_mode(src, dst):
+    """기존 파일의 권한 비트를 임시 파일에 옮깁니다.
+
+    원본이 없으면 ``open()`` 으로 만들 때와 같이 umask 를 반영한 권한을 씁니다.
+    """
+    try:
+        mode = os.stat(src).st_mode & 0o7777
+    except OSError:
+        mode = 0o666 & ~_current_umask()
+    try:
+        os.chmod(dst, mode)
+    except OSError:
+        pass
+
+
+def _diff_section(old_params, new_params):
+    if isinstance(old_params, SectionStore) and old_params.same_structure(new_params):
+        # 압축 모델은 키 리스트 비교와 값 리스트 비교만으로 끝난다
+        return {
+            "added": [],
+            "removed": [],
+            "changed": old_params.changed_keys(new_params),
+            "reordered": False,
+        }
+    old_keys = list(old_params.keys())
+    new_keys = list(new_params.keys())
+    if old_keys == new_keys:
+        added = removed = []
+        reordered = False
+        common = new_keys
+    else:
+        added = [key for key in new_keys if key not in old_params]
+        removed = [key for key in old_keys if key not in new_params]
+        common = [key for key in new_keys if key in old_params]
+        reordered = [key for key in old_keys if key in new_params] != common
+    changed = [key for key in common if old_params[key] != new_params[key]]
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "reordered": reordered,
+    }
+
+
+def diff_parameters(old_sections, new_sections):
+    """두 섹션 구조의 차이를 섹션/키 단위로 계산합니다.
+
+    반환 값은 다음 키를 가진 딕셔너리입니다.
+
+    - ``added`` / ``removed``: 새로 생기거나 사라진 섹션 이름 목록
+    - ``order_changed``: 공통 섹션의 순서가 바뀌었는지 여부
+    - ``sections``: 차이가 있는 공통 섹션별 ``added``, ``removed``,
+      ``changed`` 키 목록과 키 순서 변경 여부 ``reordered``
+    """
+    added = [sec for sec in new_sections if sec not in old_sections]
+    removed = [sec for sec in old_sections if sec not in new_sections]
+    old_common = [sec for sec in old_sections if sec in new_sections]
+    new_common = [sec for sec in new_sections if sec in old_sections]
+    sections = {}
+    for sec in new_common:
+        section_diff = _diff_section(old_sections[sec], new_sections[sec])
+        if any(section_diff.values()):
+            sections[sec] = section_diff
+    return {
+        "added": added,
+        "removed": removed,
+        "order_changed": old_common != new_common,
+        "sections": sections,
+    }
+
+
+def section_fingerprint(params):
+    """섹션의 키와 값을 순서대로 요약한 16바이트 지문을 반환합니다.
+
+    지문이 같은 두 섹션은 내용이 같다고 보고 키를 비교하지 않습니다.
+    """
+    text = "\x00".join(params.keys()) + "\x01" + "\x00".join(params.values())
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _fingerprint(prints, section, params):
+    if prints is None:
+        return section_fingerprint(params)
+    digest = prints.get(section)
+    if digest is None:
+        digest = prints[section] = section_fingerprint(params)
+    return digest
+
+
+def compare_parameters(left, right, left_prints=None, right_prints=None):
+    """두 모델을 비교해 값이 다른 항목만 ``{섹션: [(키, 왼쪽 값, 오른쪽 값)]}`` 로 반환합니다.
+
+    한쪽에만 있는 섹션이나 키는 없는 쪽 값이 ``None`` 입니다. 공통 섹션은
+    먼저 :func:`section_fingerprint` 를 비교해 같으면 키를 훑지 않으므로
+    전체 비용은 키 수에 선형입니다. ``left_prints``/``right_prints`` 에
+    딕셔너리를 주면 계산한 지문을 섹션 이름별로 보관해 다음 비교에
+    재사용합니다 (값을 바꾼 섹션은 호출한 쪽에서 지워야 합니다).
+    결과는 왼쪽 순서를 따르고 오른쪽에만 있는 섹션과 키가 뒤에 붙습니다.
+    """
+    result = OrderedDict()
+    for section, params in left.items():
+        other = right.get(section)
+        if other is None:
+            result[section] = [(key, value, None) for key, value in params.items()]
+            continue
+        if params is other or _fingerprint(
+            left_prints, section, params
+        ) == _fingerprint(right_prints, section, other):
+            continue
+        # 섹션 구현과 관계없이 해시 조회가 되도록 일반 딕셔너리로 바꿔 비교
+        mine = dict(params.items())
+        theirs = dict(other.items())
+        rows = [
+            (key, value, theirs.get(key))
+            for key, value in mine.items()
+            if theirs.get(key) != value
+        ]
+        rows.extend((key, None, value) for key, value in theirs.items() if key not in mine)
+        if rows:
+            result[section] = rows
+    for section, params in right.items():
+        if section not in left:
+            result[section] = [(key, None, value) for key, value in params.items()]
+    return result
@@ -0,0 +1,115 @@
+from collections import deque
+
+# 되돌리기 기록에 남기는 최대 편집 수
+DEFAULT_HISTORY_LIMIT = 500
+# 모든 기록에 담긴 값 변경의 최대 합계 (일괄 편집이 메모리를 차지하지 않도록)
+DEFAULT_MAX_VALUES = 100000
+
+# 기록 종류
+VALUES = "values"
+MOVE = "move"
+ADD = "add"
+
+
+class EditJournal:
+    """탭 하나의 편집을 차이(delta)로 기록하는 되돌리기/다시 실행 기록.
+
+    모델 스냅샷 대신 다음 두 가지 항목만 남깁니다.
+
+    - ``(VALUES, ((섹션, 키, 이전 값, 새 값), ...))``: 한 번의 편집(일괄
+      편집이면 여러 값)
+    - ``(MOVE, 섹션, 이동 칸 수)``: 섹션 순서 변경 (위로 -1, 아래로 +1)
+    - ``(ADD, 섹션, ((키, 값), ...), 섹션 생성 여부)``: 없던 키 추가 (섹션이
+      없었으면 섹션도 함께 만든 편집)
+
+    항목 수가 ``limit`` 을 넘거나 값 변경의 합계가 ``max_values`` 를 넘으면
+    가장 오래된 항목부터 버립니다. 새 편집을 기록하면 다시 실행 목록은
+    비워집니다.
+    """
+
+    def __init__(self, limit=DEFAULT_HISTORY_LIMIT, max_values=DEFAULT_MAX_VALUES):
+        self.limit = limit
+        self.max_values = max_values
+        self._undo = deque()
+        self._redo = []
+        self._values = 0
+
+    @staticmethod
+    def _size(entry):
+        if entry[0] == VALUES:
+            return len(entry[1])
+        return len(entry[2]) if entry[0] == ADD else 1
+
+    def _push(self, entry):
+        self._undo.append(entry)
+        self._values += self._size(entry)
+        while self._undo and (
+            len(self._undo) > self.limit or self._values > self.max_values
+        ):
+            self._values -= self._size(self._undo.popleft())
+
+    def record_values(self, deltas):
+        """``(섹션, 키, 이전 값, 새 값)`` 목록을 한 번의 편집으로 기록합니다."""
+        deltas = tuple(d for d in deltas if d[2] != d[3])
+        if not deltas:
+            return
+        self._redo.clear()
+        self._push((VALUES, deltas))
+
+    def record_add(self, section, items, created=False):
+        """섹션에 없던 ``(키, 값)`` 들의 추가를 한 번의 편집으로 기록합니다."""
+        items = tuple(items)
+        if not items:
+            return
+        self._redo.clear()
+        self._push((ADD, section, items, created))
+
+    def record_move(self, section, offset):
+        self._redo.clear()
+        self._push((MOVE, section, offset))
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """되돌릴 항목을 꺼내 반환합니다. 없으면 ``None``."""
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._values -= self._size(entry)
+        self._redo.append(entry)
+        return entry
+
+    def redo(self):
+        """다시 실행할 항목을 꺼내 반환합니다. 없으면 ``None``."""
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._push(entry)
+        return entry
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._values = 0
+
+
+def inverse_changes(deltas):
+    """값 변경 기록을 되돌리는 ``{섹션: {키: 이전 값}}`` 을 만듭니다."""
+    changes = {}
+    for section, key, old, _new in reversed(deltas):
+        changes.setdefault(section, {})[key] = old
+    return changes
+
+
+def forward_changes(deltas):
+    """값 변경 기록을 다시 적용하는 ``{섹션: {키: 새 값}}`` 을 만듭니다."""
+    changes = {}
+    for section, key, _old, new in deltas:
+        changes.setdefault(section, {})[key] = new
+    return changes
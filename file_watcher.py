@@ -0,0 +1,247 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+
+from config_io import compute_file_hash, stat_signature
+
+logger = logging.getLogger(__name__)
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# inotify 를 쓰더라도 이 횟수마다 한 번은 모든 파일의 stat 을 확인한다.
+# (네트워크 마운트처럼 이벤트가 오지 않는 파일 시스템 대비)
+FULL_SCAN_EVERY = 10
+
+
+class _Inotify:
+    """ctypes 로 감싼 최소한의 inotify 인스턴스 (디렉터리 단위 감시)."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._init1 = libc.inotify_init1
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = self._init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dir_by_wd = {}
+        self._wd_by_dir = {}
+
+    @classmethod
+    def create(cls):
+        """inotify 를 사용할 수 없으면 ``None`` 을 반환합니다."""
+        if not hasattr(os, "O_CLOEXEC"):
+            return None
+        try:
+            return cls()
+        except (OSError, AttributeError) as e:
+            logger.info("inotify unavailable, falling back to polling: %s", e)
+            return None
+
+    def watch_dir(self, directory):
+        if directory in self._wd_by_dir:
+            return True
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dir_by_wd[wd] = directory
+        self._wd_by_dir[directory] = wd
+        return True
+
+    def is_watching(self, directory):
+        return directory in self._wd_by_dir
+
+    def unwatch_dir(self, directory):
+        wd = self._wd_by_dir.pop(directory, None)
+        if wd is not None:
+            self._dir_by_wd.pop(wd, None)
+            self._rm_watch(self.fd, wd)
+
+    def read_events(self):
+        """대기 중인 이벤트를 ``(directory, name, mask)`` 목록으로 돌려줍니다."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                logger.warning("Failed to read inotify events: %s", e)
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                directory = self._dir_by_wd.get(wd)
+                if mask & IN_IGNORED and directory is not None:
+                    self._dir_by_wd.pop(wd, None)
+                    self._wd_by_dir.pop(directory, None)
+                events.append((directory, os.fsdecode(name), mask))
+        return events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _WatchEntry:
+    __slots__ = ("signature", "hash")
+
+    def __init__(self, signature, file_hash):
+        self.signature = signature
+        self.hash = file_hash
+
+
+class FileWatcher:
+    """여러 파일을 하나의 감시자로 확인하는 서비스.
+
+    ``poll()`` 은 먼저 ``os.stat`` 서명 ``(mtime_ns, size, inode)`` 을 비교하고,
+    서명이 바뀐 파일만 해시를 다시 계산합니다. inotify 를 쓸 수 있으면
+    이벤트가 들어온 파일만 stat 하고, 그렇지 않으면 모든 파일을 stat 합니다.
+    """
+
+    def __init__(self, use_inotify=True):
+        self._entries = {}
+        self._by_abspath = {}
+        self._dirty = set()
+        self._polls = 0
+        self._inotify = _Inotify.create() if use_inotify else None
+
+    @property
+    def uses_inotify(self):
+        return self._inotify is not None
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def add(self, path, known_hash=None, signature=None):
+        """감시 대상에 ``path`` 를 추가합니다.
+
+        ``known_hash`` 가 주어지면 현재 내용의 해시로 간주하여 다시 계산하지 않습니다.
+        ``signature`` 에는 그 해시를 계산하기 *전에* 잡은 stat 서명을 줍니다.
+        그 뒤에 파일이 바뀌었으면 첫 ``poll()`` 에서 서명이 달라 다시 해시하므로
+        변경을 놓치지 않습니다. 주지 않으면 지금 stat 합니다.
+        """
+        if signature is None:
+            signature = stat_signature(path)
+        if known_hash is None:
+            known_hash = compute_file_hash(path)
+        self._entries[path] = _WatchEntry(signature, known_hash)
+        abspath = os.path.abspath(path)
+        self._by_abspath[abspath] = path
+        if self._inotify is not None:
+            directory = os.path.dirname(abspath)
+            if not self._inotify.watch_dir(directory):
+                logger.info("Cannot watch %s with inotify, polling instead", directory)
+
+    def remove(self, path):
+        if self._entries.pop(path, None) is None:
+            return
+        self._dirty.discard(path)
+        abspath = os.path.abspath(path)
+        self._by_abspath.pop(abspath, None)
+        if self._inotify is not None:
+            directory = os.path.dirname(abspath)
+            if not any(os.path.dirname(p) == directory for p in self._by_abspath):
+                self._inotify.unwatch_dir(directory)
+
+    def signature(self, path):
+        """``path`` 의 마지막으로 확인한 내용에 해당하는 stat 서명 (감시 중이 아니면 ``None``)."""
+        entry = self._entries.get(path)
+        return None if entry is None else entry.signature
+
+    def acknowledge(self, path, file_hash, signature=None):
+        """프로그램이 직접 쓴 내용을 현재 상태로 기록해 다시 해시하지 않게 합니다.
+
+        ``signature`` 에는 쓴 시점의 stat 서명(:func:`config_io.write_atomic`)을
+        줍니다. 그 뒤에 다른 프로세스가 파일을 바꿨으면 서명이 달라 다음
+        ``poll()`` 에서 변경으로 보고됩니다. 주지 않으면 지금 stat 합니다.
+        """
+        entry = self._entries.get(path)
+        if entry is not None:
+            entry.signature = stat_signature(path) if signature is None else signature
+            entry.hash = file_hash
+
+    def _collect_inotify_dirty(self):
+        for directory, name, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW or directory is None:
+                self._dirty.update(self._entries)
+                continue
+            if name:
+                watched = self._by_abspath.get(os.path.join(directory, name))
+                if watched is not None:
+                    self._dirty.add(watched)
+            else:
+                # 디렉터리 자체에 대한 이벤트는 그 안의 모든 파일에 해당
+                self._dirty.update(
+                    path for abspath, path in self._by_abspath.items()
+                    if os.path.dirname(abspath) == directory
+                )
+
+    def poll(self):
+        """변경된 파일을 ``[(path, new_hash), ...]`` 로 반환합니다.
+
+        파일이 삭제되면 ``new_hash`` 는 ``None`` 입니다.
+        """
+        self._polls += 1
+        if self._inotify is None or self._polls % FULL_SCAN_EVERY == 0:
+            candidates = list(self._entries)
+            if self._inotify is not None:
+                self._inotify.read_events()
+        else:
+            self._collect_inotify_dirty()
+            # 감시를 걸지 못했거나 디렉터리가 사라진 파일은 매번 stat 으로 확인
+            self._dirty.update(
+                path for abspath, path in self._by_abspath.items()
+                if not self._inotify.is_watching(os.path.dirname(abspath))
+            )
+            candidates = [p for p in self._dirty if p in self._entries]
+        self._dirty.clear()
+
+        changes = []
+        for path in candidates:
+            entry = self._entries[path]
+            signature = stat_signature(path)
+            if signature == entry.signature:
+                continue
+            entry.signature = signature
+            new_hash = compute_file_hash(path) if signature is not None else None
+            if new_hash != entry.hash:
+                entry.hash = new_hash
+                changes.append((path, new_hash))
+        return changes
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._entries.clear()
+        self._by_abspath.clear()
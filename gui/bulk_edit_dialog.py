@@ -0,0 +1,88 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class BulkEditDialog(tk.Toplevel):
+    """Ask for section/key patterns and a new value or an ON/OFF flip.
+
+    The edit itself is done by ``ParameterManagerGUI.bulk_edit``; the dialog
+    shows the running totals it reports.
+    """
+
+    def __init__(self, manager):
+        super().__init__(manager.root_window)
+        self.manager = manager
+        self.title("Bulk Edit")
+        self.transient(manager.root_window)
+        self.resizable(False, False)
+
+        self.section_var = tk.StringVar(value="*")
+        self.key_var = tk.StringVar()
+        self.value_var = tk.StringVar(value="1")
+        self.mode_var = tk.StringVar(value="set")
+        self.scope_var = tk.StringVar(value="current")
+
+        form = ttk.Frame(self, padding=8)
+        form.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(form, text="Section pattern:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(form, textvariable=self.section_var, width=30).grid(
+            row=0, column=1, columnspan=2, sticky="ew", pady=2
+        )
+        ttk.Label(form, text="Key pattern:").grid(row=1, column=0, sticky=tk.W)
+        key_entry = ttk.Entry(form, textvariable=self.key_var, width=30)
+        key_entry.grid(row=1, column=1, columnspan=2, sticky="ew", pady=2)
+
+        ttk.Radiobutton(
+            form, text="Set value:", variable=self.mode_var, value="set"
+        ).grid(row=2, column=0, sticky=tk.W)
+        ttk.Entry(form, textvariable=self.value_var, width=30).grid(
+            row=2, column=1, columnspan=2, sticky="ew", pady=2
+        )
+        ttk.Radiobutton(
+            form, text="Flip ON/OFF", variable=self.mode_var, value="flip"
+        ).grid(row=3, column=0, sticky=tk.W)
+
+        ttk.Radiobutton(
+            form, text="Current tab", variable=self.scope_var, value="current"
+        ).grid(row=4, column=0, sticky=tk.W, pady=(6, 0))
+        ttk.Radiobutton(
+            form, text="All open tabs", variable=self.scope_var, value="all"
+        ).grid(row=4, column=1, sticky=tk.W, pady=(6, 0))
+
+        self.status_label = ttk.Label(form, text="Patterns use * and ? wildcards.")
+        self.status_label.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=(6, 0))
+
+        buttons = ttk.Frame(form)
+        buttons.grid(row=6, column=0, columnspan=3, sticky=tk.E, pady=(6, 0))
+        ttk.Button(buttons, text="Apply", command=self.apply).pack(side=tk.LEFT, padx=2)
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side=tk.LEFT, padx=2)
+        form.columnconfigure(1, weight=1)
+
+        self.bind("<Return>", lambda e: self.apply())
+        self.bind("<Escape>", lambda e: self.destroy())
+        key_entry.focus_set()
+
+    def apply(self):
+        key_pattern = self.key_var.get().strip()
+        if not key_pattern:
+            self.status_label.config(text="Enter a key pattern.")
+            return
+        flip = self.mode_var.get() == "flip"
+        self.manager.bulk_edit(
+            key_pattern,
+            value=None if flip else self.value_var.get().strip(),
+            section_pattern=self.section_var.get().strip() or "*",
+            flip=flip,
+            all_tabs=self.scope_var.get() == "all",
+            callback=self.show_result,
+        )
+
+    def show_result(self, totals):
+        if not self.winfo_exists():
+            return
+        text = f"Changed {totals['values']} value(s) in {totals['files']} file(s)"
+        if totals["pending"]:
+            text += f", {totals['pending']} file(s) in progress…"
+        if totals["failed"]:
+            text += f", {totals['failed']} failed"
+        self.status_label.config(text=text + ".")
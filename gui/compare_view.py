@@ -0,0 +1,296 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from config_io import compare_parameters
+
+# 한 번에 만드는 최대 차이 행 수 (나머지는 "Show more" 로 이어서 만든다)
+COMPARE_PAGE_ROWS = 500
+# 한쪽에 없는 키를 표시하는 글자
+MISSING_TEXT = "(missing)"
+
+
+def tab_labels(paths):
+    """Return ``{label: path}`` with the shortest unique trailing path parts.
+
+    ``prod/app.ini`` and ``staging/app.ini`` are labelled by their parent
+    directory while files with a unique name keep just the basename.
+    """
+    # 경로마다 뒤에서부터 몇 단계를 보여 줄지 늘려 가며 겹치지 않게 한다
+    parts = {path: os.path.normpath(path).split(os.sep) for path in paths}
+    depth = dict.fromkeys(paths, 1)
+    while True:
+        labels = {}
+        for path in paths:
+            labels.setdefault(os.sep.join(parts[path][-depth[path]:]), []).append(path)
+        clashes = [
+            path for group in labels.values() if len(group) > 1 for path in group
+            if depth[path] < len(parts[path])
+        ]
+        if not clashes:
+            return {label: group[0] for label, group in labels.items()}
+        for path in clashes:
+            depth[path] += 1
+
+
+class CompareWindow(tk.Toplevel):
+    """Show only the values that differ between two open tabs.
+
+    The models are compared with ``config_io.compare_parameters``; section
+    fingerprints are kept on each tab (``ParameterTab.section_prints``) and
+    dropped there whenever a section is edited or reloaded, so a refresh only
+    re-hashes the sections that changed since the last one.  Copies go
+    through ``ParameterTab.apply_changes`` of the receiving tab, so they
+    update its widgets, are saved and can be undone there like any other
+    edit.
+    """
+
+    def __init__(self, manager, left_tab=None, right_tab=None):
+        super().__init__(manager.root_window)
+        self.manager = manager
+        self.title("Compare")
+        self.geometry("900x600")
+        self._rows = {}
+        self._section_frames = {}
+        # 섹션별 다음 행 번호와 다음 섹션 프레임의 행 번호
+        self._next_row = {}
+        self._next_section_row = 0
+        self._remaining = iter(())
+        self._copied = set()
+        self._more_button = None
+        self.differences = {}
+
+        self._tab_paths = [
+            path for path, tab in manager.tabs.items()
+            if hasattr(tab, "apply_changes") and not tab.loading
+        ]
+        bar = ttk.Frame(self, padding=4)
+        bar.pack(fill=tk.X, side=tk.TOP)
+        self.left_var = tk.StringVar()
+        self.right_var = tk.StringVar()
+        # 이름이 같은 파일(prod/app.ini, staging/app.ini)도 구분되는 이름
+        self._labels = tab_labels(self._tab_paths)
+        names = list(self._labels)
+        for var, column in ((self.left_var, 0), (self.right_var, 2)):
+            combo = ttk.Combobox(bar, textvariable=var, values=names, state="readonly")
+            combo.grid(row=0, column=column, sticky="ew")
+            combo.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+        ttk.Label(bar, text="\u2194").grid(row=0, column=1, padx=4)
+        ttk.Button(bar, text="Refresh", command=self.refresh).grid(
+            row=0, column=3, padx=(8, 0)
+        )
+        self.summary_label = ttk.Label(bar, text="")
+        self.summary_label.grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(4, 0))
+        bar.columnconfigure(0, weight=1)
+        bar.columnconfigure(2, weight=1)
+
+        self.canvas = tk.Canvas(self)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.content = ttk.Frame(self.canvas)
+        self.content.bind(
+            "<Configure>",
+            lambda e: self.canvas.config(scrollregion=self.canvas.bbox("all")),
+        )
+        self.canvas_window = self.canvas.create_window((0, 0), window=self.content, anchor="nw")
+        self.canvas.bind(
+            "<Configure>",
+            lambda e: self.canvas.itemconfigure(self.canvas_window, width=e.width),
+        )
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.content.columnconfigure(0, weight=1)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+        self._select(self.left_var, left_tab, 0)
+        self._select(self.right_var, right_tab, 1)
+        self.refresh()
+
+    def _select(self, var, tab, default_index):
+        path = getattr(tab, "file_path", None)
+        if path in self._tab_paths:
+            index = self._tab_paths.index(path)
+        elif len(self._tab_paths) > default_index:
+            index = default_index
+        else:
+            return
+        path = self._tab_paths[index]
+        var.set(next(label for label, p in self._labels.items() if p == path))
+
+    def _tab_for(self, var):
+        tab = self.manager.tabs.get(self._labels.get(var.get()))
+        # 잠든 탭(자리 표시 탭)은 비교할 수 없다
+        if hasattr(tab, "apply_changes") and tab.winfo_exists():
+            return tab
+        return None
+
+    @property
+    def left_tab(self):
+        return self._tab_for(self.left_var)
+
+    @property
+    def right_tab(self):
+        return self._tab_for(self.right_var)
+
+    def _on_mousewheel(self, event):
+        if event.delta:
+            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return "break"
+
+    # ------------------------------------------------------------------
+    @property
+    def paths(self):
+        """Paths of the two selected tabs."""
+        return {self._labels.get(var.get()) for var in (self.left_var, self.right_var)}
+
+    def refresh(self):
+        """Recompare both models and redraw the differing rows."""
+        for frame in self._section_frames.values():
+            frame.destroy()
+        self._section_frames.clear()
+        self._rows.clear()
+        self._next_row.clear()
+        self._next_section_row = 0
+        self._copied.clear()
+        if self._more_button is not None:
+            self._more_button.destroy()
+            self._more_button = None
+        left, right = self.left_tab, self.right_tab
+        if left is None or right is None or left is right:
+            self.differences = {}
+            self.summary_label.config(text="Choose two different open tabs.")
+            return
+        self.differences = compare_parameters(
+            left.sections, right.sections, left.section_prints, right.section_prints
+        )
+        # 복사하면 self.differences 가 바뀌므로 남은 행은 미리 목록으로 만들어 둔다
+        self._remaining = iter(
+            [(section, row) for section, rows in self.differences.items() for row in rows]
+        )
+        self._render_page()
+        self._update_summary()
+        self.canvas.yview_moveto(0)
+
+    def _update_summary(self):
+        count = len(self._rows)
+        total = sum(len(rows) for rows in self.differences.values())
+        if not total:
+            text = "No differences."
+        else:
+            text = f"{total} differing value(s) in {len(self.differences)} section(s)"
+            if count < total:
+                text += f", showing {count}"
+        self.summary_label.config(text=text)
+
+    def _render_page(self):
+        if self._more_button is not None:
+            self._more_button.destroy()
+            self._more_button = None
+        rendered = 0
+        for section, row in self._remaining:
+            if (section, row[0]) in self._copied:
+                # 앞 페이지에서 이미 복사해 차이가 없어진 행
+                continue
+            self._add_row(section, *row)
+            rendered += 1
+            if rendered >= COMPARE_PAGE_ROWS:
+                break
+        else:
+            return
+        self._more_button = ttk.Button(
+            self.content, text="Show more\u2026", command=self._show_more
+        )
+        self._more_button.grid(row=self._next_section_row + 1, column=0, pady=4)
+
+    def _show_more(self):
+        self._render_page()
+        self._update_summary()
+
+    def _section_frame(self, section):
+        info = self._section_frames.get(section)
+        if info is None:
+            fonts = self.manager.zoom_context
+            info = ttk.Frame(self.content, borderwidth=2, relief="groove")
+            info.grid(row=self._next_section_row, column=0, sticky="nsew", padx=1, pady=1)
+            self._next_section_row += 1
+            ttk.Label(info, text=section, font=fonts.header_font).grid(
+                row=0, column=0, columnspan=5, sticky=tk.W, padx=4
+            )
+            info.columnconfigure(1, weight=1)
+            info.columnconfigure(4, weight=1)
+            self._section_frames[section] = info
+        return info
+
+    def _add_row(self, section, key, left_value, right_value):
+        frame = self._section_frame(section)
+        fonts = self.manager.zoom_context
+        row = self._next_row.get(section, 1)
+        self._next_row[section] = row + 1
+        # 한쪽에만 있는 키는 없는 쪽으로만 복사할 수 있다
+        to_right = "normal" if left_value is not None else "disabled"
+        to_left = "normal" if right_value is not None else "disabled"
+        widgets = [
+            ttk.Label(frame, text=key, font=fonts.param_font, anchor=tk.W),
+            self._value_entry(frame, left_value),
+            ttk.Button(
+                frame,
+                text="\u2192",
+                width=2,
+                command=lambda: self.copy_value(section, key, to_right=True),
+                state=to_right,
+            ),
+            ttk.Button(
+                frame,
+                text="\u2190",
+                width=2,
+                command=lambda: self.copy_value(section, key, to_right=False),
+                state=to_left,
+            ),
+            self._value_entry(frame, right_value),
+        ]
+        for column, widget in enumerate(widgets):
+            widget.grid(row=row, column=column, sticky="ew", padx=1, pady=1)
+        self._rows[(section, key)] = widgets
+
+    def _value_entry(self, parent, value):
+        entry = ttk.Entry(parent, width=24, font=self.manager.zoom_context.param_font)
+        entry.insert(0, MISSING_TEXT if value is None else value)
+        entry.config(state="readonly")
+        return entry
+
+    def copy_value(self, section, key, to_right=True):
+        """Copy one value across and drop the row once both sides match.
+
+        A key the receiving tab lacks is added to it, together with its
+        section if that is missing too.
+        """
+        source, target = self.left_tab, self.right_tab
+        if not to_right:
+            source, target = target, source
+        if source is None or target is None:
+            return
+        try:
+            value = source.sections[section][key]
+        except KeyError:
+            # 비교 후 외부에서 바뀐 경우
+            self.refresh()
+            return
+        if key in target.sections.get(section, ()):
+            target.apply_changes({section: {key: value}})
+        else:
+            target.insert_parameters(section, {key: value})
+        self._copied.add((section, key))
+        widgets = self._rows.pop((section, key), None)
+        for widget in widgets or ():
+            widget.destroy()
+        rows = [row for row in self.differences.get(section, ()) if row[0] != key]
+        if rows:
+            self.differences[section] = rows
+        else:
+            self.differences.pop(section, None)
+            frame = self._section_frames.pop(section, None)
+            if frame is not None:
+                frame.destroy()
+        self._update_summary()
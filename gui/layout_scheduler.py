@@ -0,0 +1,60 @@
+import time
+
+# 레이아웃 패스 사이의 최소 간격(ms). 약 60fps 에 맞춰 연속된 이벤트를 모은다
+FRAME_INTERVAL_MS = 16
+
+
+class LayoutScheduler:
+    """Collapse bursts of layout requests into a single idle-time pass.
+
+    ``request(**flags)`` may be called for every resize, zoom or content
+    ``<Configure>`` event; the flags of all requests made before the pass
+    runs are OR-ed together and handed to ``callback(flags)`` once.  Passes
+    are at least ``FRAME_INTERVAL_MS`` apart so a window drag produces at
+    most one relayout per frame.
+    """
+
+    def __init__(self, widget, callback, frame_interval_ms=FRAME_INTERVAL_MS):
+        self.widget = widget
+        self.callback = callback
+        self.frame_interval_ms = frame_interval_ms
+        self._flags = {}
+        self._after_id = None
+        self._last_run = 0.0
+
+    @property
+    def pending(self):
+        return self._after_id is not None
+
+    def request(self, **flags):
+        for name, value in flags.items():
+            if value:
+                self._flags[name] = True
+        if self._after_id is not None:
+            return
+        elapsed_ms = (time.perf_counter() - self._last_run) * 1000
+        delay = int(self.frame_interval_ms - elapsed_ms)
+        if delay > 0:
+            self._after_id = self.widget.after(delay, self._wait_idle)
+        else:
+            self._after_id = self.widget.after_idle(self._run)
+
+    def _wait_idle(self):
+        # 프레임 간격이 지난 뒤에도 남은 이벤트를 먼저 처리하고 실행
+        self._after_id = self.widget.after_idle(self._run)
+
+    def flush(self):
+        """Run a pending pass (or an empty one) right now."""
+        self.cancel()
+        self._run()
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self):
+        self._after_id = None
+        flags, self._flags = self._flags, {}
+        self._last_run = time.perf_counter()
+        self.callback(flags)
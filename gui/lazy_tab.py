@@ -0,0 +1,28 @@
+from tkinter import ttk
+
+
+class LazyTab(ttk.Frame):
+    """Notebook placeholder for a file whose tab is not built (yet).
+
+    ``ParameterManagerGUI`` replaces it with a real ``ParameterTab`` the first
+    time it is selected.  Until then it only remembers the saved UI state so
+    that closing the application writes it back unchanged.
+
+    A hibernated tab (see ``ParameterManagerGUI.hibernate_tab``) also keeps
+    its ``model`` as ``(file_hash, sections, stat_signature)`` and its undo
+    ``journal``, so it can be rebuilt without reading the file again.
+    """
+
+    def __init__(self, master, file_path, initial_state=None, model=None, journal=None):
+        super().__init__(master)
+        self.file_path = file_path
+        self.initial_state = initial_state
+        self.model = model
+        self.journal = journal
+
+    @property
+    def hibernated(self):
+        return self.model is not None
+
+    def get_state(self):
+        return self.initial_state or {}
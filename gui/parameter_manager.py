@@ -1,15 +1,85 @@
+import logging
 import os
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog
+from .bulk_edit_dialog import BulkEditDialog
+from .compare_view import CompareWindow
+from .lazy_tab import LazyTab
 from .parameter_tab import ParameterTab
+from .workspace_panel import WorkspacePanel
+from .zoom_context import ZoomContext
+from async_writer import AsyncWriter
+from background_loader import BackgroundLoader
+from bulk_edit import bulk_edit_file
+from config_io import stat_signature
+from file_watcher import FileWatcher
+from instrumentation import trace_category, tracer
+from parse_cache import ParseCache
+from stall_watchdog import STALL_THRESHOLD_S, StallWatchdog
 from state_manager import load_state, save_state
 
+logger = logging.getLogger(__name__)
+
+# 공유 파일 감시자의 확인 주기(ms)와 한 번에 처리할 탭 수
+WATCH_INTERVAL_MS = 500
+WATCH_DISPATCH_BATCH = 8
+# 시작 시간 측정 모드에서 첫 탭이 준비됐는지 확인하는 주기(ms)
+STARTUP_POLL_MS = 20
+# 열리지 않은 탭 파일의 일괄 편집 결과를 확인하는 주기(ms)
+BULK_POLL_MS = 50
+# 이 시간(초) 동안 보지 않은 탭은 위젯을 버리고 모델만 남긴다 (None 이면 끔)
+HIBERNATE_IDLE_S = 15 * 60
+# 위젯을 유지하는 최대 탭 수와 그 탭들의 파라미터 셀 위젯 합계 (메모리 예산)
+MAX_LIVE_TABS = 8
+LIVE_CELL_BUDGET = 20000
+# 잠재울 탭을 확인하는 주기(ms)
+HIBERNATE_CHECK_MS = 10000
+# 측정이 켜져 있을 때 상태 표시줄의 p50/p99 를 갱신하는 주기(ms)
+TIMING_REFRESH_MS = 1000
+# 상태 표시줄에 보여 줄 구간 이름과 표시 순서
+TIMING_SPANS = (
+    ("parse", "parse"),
+    ("load_cached", "cached"),
+    ("refresh_ui", "refresh"),
+    ("layout_parameters", "layout"),
+    ("adjust_window_size", "idle"),
+    ("save", "save"),
+    ("rehash", "rehash"),
+)
+
 class ParameterManagerGUI:
-    def __init__(self, root_window):
+    def __init__(
+        self,
+        root_window,
+        startup_timing=False,
+        started_at=None,
+        hibernate_after=HIBERNATE_IDLE_S,
+        max_live_tabs=MAX_LIVE_TABS,
+        cell_budget=LIVE_CELL_BUDGET,
+        stall_threshold=STALL_THRESHOLD_S,
+    ):
+        """``startup_timing`` logs the time until the first tab is interactive.
+
+        ``started_at`` is the ``time.perf_counter()`` value to measure from,
+        e.g. taken before Tk was initialised; defaults to now.
+        ``hibernate_after`` (seconds, ``None`` to disable), ``max_live_tabs``
+        and ``cell_budget`` control tab hibernation (see
+        ``enforce_tab_budget``).  Main loop stalls longer than
+        ``stall_threshold`` seconds are logged with the blocking callback's
+        stack (``None`` disables the watchdog).
+        """
+        self._started_at = time.perf_counter() if started_at is None else started_at
+        # 시작 시간 측정 모드에서 측정한 첫 탭 준비 시간(ms)
+        self.startup_ms = None
         self.root_window = root_window
         # store window state in a user writable location
         self.state_path = os.path.expanduser("~/.ini_editor/state.json")
         os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        # 바뀌지 않은 파일은 다시 파싱하지 않도록 state.json 옆에 둔 파싱 캐시
+        self.parse_cache = ParseCache(
+            os.path.join(os.path.dirname(self.state_path), "cache")
+        )
         self.open_files = []
         self.saved_geometry = None
         self.file_states = {}
@@ -22,6 +92,29 @@ class ParameterManagerGUI:
         ) = load_state(self.state_path)
         if loaded_zoom is not None:
             self.zoom = loaded_zoom
+        # 모든 탭이 함께 쓰는 폰트와 셀 크기
+        self.zoom_context = ZoomContext(self.zoom)
+        self.zoom = self.zoom_context.zoom
+
+        # 열린 모든 탭의 키와 값을 거르는 검색 막대 (Ctrl+F)
+        self.filter_bar = ttk.Frame(self.root_window)
+        ttk.Label(self.filter_bar, text="Filter:").pack(side=tk.LEFT, padx=(4, 2))
+        self.filter_var = tk.StringVar()
+        self.filter_entry = ttk.Entry(self.filter_bar, textvariable=self.filter_var)
+        self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.filter_entry.bind("<Escape>", lambda e: self.filter_var.set(""))
+        ttk.Button(
+            self.filter_bar, text="\u00d7", width=2, command=lambda: self.filter_var.set("")
+        ).pack(side=tk.LEFT, padx=2)
+        self.filter_label = ttk.Label(self.filter_bar, text="")
+        self.filter_label.pack(side=tk.LEFT, padx=4)
+        self.filter_bar.pack(fill=tk.X, side=tk.TOP)
+        self._filter_after_id = None
+        self.filter_var.trace_add("write", lambda *args: self.schedule_filter())
+        self.root_window.bind("<Control-f>", self.focus_filter)
+        self.root_window.bind("<Control-z>", lambda e: self.undo())
+        self.root_window.bind("<Control-y>", lambda e: self.redo())
+        self.root_window.bind("<Control-Z>", lambda e: self.redo())
 
         self.notebook = ttk.Notebook(self.root_window)
         style = ttk.Style()
@@ -30,6 +123,9 @@ class ParameterManagerGUI:
         self.status_bar = ttk.Frame(self.root_window)
         self.zoom_label = ttk.Label(self.status_bar, text="")
         self.zoom_label.pack(side=tk.RIGHT, padx=4)
+        # 측정이 켜져 있을 때만 보이는 구간별 p50/p99 표시
+        self.timing_label = ttk.Label(self.status_bar, text="")
+        self._timing_after_id = None
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
         self.update_zoom_label()
         self.notebook.bind("<Button-3>", self.show_tab_menu)
@@ -40,22 +136,150 @@ class ParameterManagerGUI:
 
         self.tabs = {}
         self.current_tab = None
+        # 탭을 잠재우는 기준과 경로별 마지막으로 본 시각 (time.monotonic)
+        self.hibernate_after = hibernate_after
+        self.max_live_tabs = max_live_tabs
+        self.cell_budget = cell_budget
+        self._last_viewed = {}
+        self._hibernate_after_id = None
+        # 열린 작업 공간 폴더의 파일 트리 (없으면 None)
+        self.workspace = None
+        # 열린 비교 창 (외부 변경을 반영한 탭을 다시 비교)
+        self.compare_windows = []
+        # 모든 탭의 파일 변경을 한 곳에서 감시
+        self.file_watcher = FileWatcher()
+        self._watch_after_id = None
+        # 모든 탭의 저장을 처리하는 백그라운드 쓰기 스레드
+        self.writer = AsyncWriter()
+        # 탭의 파일 해시 계산과 파싱을 맡는 작업 스레드 풀
+        self.loader = BackgroundLoader()
+        # 작업 스레드에서 진행 중인 파일 일괄 편집 수
+        self._bulk_jobs = 0
+        self._bulk_after_id = None
         self.initialize_menu()
 
         if self.saved_geometry:
             self.root_window.geometry(self.saved_geometry)
+        # 복원한 탭은 자리만 만들어 두고 처음 선택될 때 만든다
+        restored = None
         for f in self.open_files:
             if os.path.exists(f):
-                self._open_file(f)
+                restored = self._open_file(f, lazy=True)
+        if restored is not None:
+            self.notebook.select(restored)
         self.set_zoom(self.zoom)
         self.root_window.protocol("WM_DELETE_WINDOW", self.on_close)
         # Bind once to handle window resize events and delegate to the active tab
         self._resize_bind_id = self.root_window.bind("<Configure>", self.on_root_resize)
+        self._watch_after_id = self.root_window.after(
+            WATCH_INTERVAL_MS, self._poll_file_events
+        )
+        self._hibernate_after_id = self.root_window.after(
+            HIBERNATE_CHECK_MS, self._check_hibernation
+        )
+        # 메인 루프를 막는 콜백을 찾아 기록하는 감시자
+        self.watchdog = None
+        if stall_threshold is not None:
+            self.watchdog = StallWatchdog(
+                self.root_window.after, stall_threshold, context=self._stall_context
+            )
+            self.watchdog.start()
+        if startup_timing:
+            self.root_window.after(STARTUP_POLL_MS, self._report_startup_when_ready)
+        if tracer.enabled:
+            self.set_timing(True)
+
+    def _report_startup_when_ready(self):
+        """Log the time to the first interactive tab once it is fully built."""
+        tab = self.current_tab
+        if tab is not None and (
+            getattr(tab, "loading", False) or getattr(tab, "populating", False)
+        ):
+            self.root_window.after(STARTUP_POLL_MS, self._report_startup_when_ready)
+            return
+        # 남은 idle 작업(그리기)까지 끝난 뒤 측정
+        self.root_window.after_idle(self._report_startup)
+
+    def _report_startup(self):
+        elapsed_ms = (time.perf_counter() - self._started_at) * 1000
+        lazy = sum(isinstance(tab, LazyTab) for tab in self.tabs.values())
+        logger.info(
+            "Startup: first interactive tab after %.0f ms (%d tabs restored, %d deferred)",
+            elapsed_ms,
+            len(self.tabs),
+            lazy,
+        )
+        self.startup_ms = elapsed_ms
+
+    def _stall_context(self):
+        """Current tab and its file size for stall reports.
+
+        Called on the watchdog thread, so it must not touch Tk.
+        """
+        path = getattr(self.current_tab, "file_path", None)
+        size = None
+        if path:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                pass
+        return {"tab": path, "size": size}
+
+    def _poll_file_events(self):
+        """Check all open files once and hand changes to their tabs."""
+        try:
+            # 저장 완료를 먼저 반영해야 우리가 쓴 내용을 외부 변경으로 보지 않는다
+            self.writer.drain()
+            with tracer.span("watch_poll"):
+                changes = self.file_watcher.poll()
+            if changes:
+                self._dispatch_file_changes(changes)
+        finally:
+            # 탭 하나의 콜백이 실패해도 모든 탭이 쓰는 감시 루프는 계속 돈다
+            self._watch_after_id = self.root_window.after(
+                WATCH_INTERVAL_MS, self._poll_file_events
+            )
+
+    def _dispatch_file_changes(self, changes):
+        batch = changes[:WATCH_DISPATCH_BATCH]
+        rest = changes[WATCH_DISPATCH_BATCH:]
+        reloaded = set()
+        for path, new_hash in batch:
+            tab = self.tabs.get(path)
+            if tab is None:
+                continue
+            if new_hash is None:
+                logger.warning("Watched file is no longer readable: %s", path)
+                continue
+            if hasattr(tab, "monitor_file_changes"):
+                tab.monitor_file_changes(new_hash)
+                reloaded.add(path)
+        if reloaded:
+            self._refresh_compare_windows(reloaded)
+        if rest:
+            # 남은 탭은 다음 idle 시점에 처리해 UI 가 멈추지 않게 한다
+            self.root_window.after_idle(self._dispatch_file_changes, rest)
+
+    def _refresh_compare_windows(self, paths):
+        """Recompare the open compare windows that show one of ``paths``.
+
+        Only sections the reload changed are fingerprinted again.
+        """
+        self.compare_windows = [
+            window for window in self.compare_windows if window.winfo_exists()
+        ]
+        for window in self.compare_windows:
+            if window.paths & paths:
+                window.refresh()
 
     def switch_active_tab(self, new_tab):
         """Manage global mouse wheel bindings when the active tab changes."""
         if self.current_tab is new_tab:
             return
+        now = time.monotonic()
+        for tab in (self.current_tab, new_tab):
+            if tab is not None:
+                self._last_viewed[tab.file_path] = now
         if self.current_tab and hasattr(self.current_tab, "unbind_mousewheel"):
             self.current_tab.unbind_mousewheel()
         self.current_tab = new_tab
@@ -66,11 +290,29 @@ class ParameterManagerGUI:
         menu_bar = tk.Menu(self.root_window)
         file_menu = tk.Menu(menu_bar, tearoff=0)
         file_menu.add_command(label="Open File(s)", command=self.open_files_dialog)
+        file_menu.add_command(label="Open Folder...", command=self.open_workspace_dialog)
+        file_menu.add_command(label="Rescan Folder", command=self.rescan_workspace)
         file_menu.add_command(label="Exit", command=self.on_close)
         menu_bar.add_cascade(label="File", menu=file_menu)
 
+        edit_menu = tk.Menu(menu_bar, tearoff=0)
+        edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self.undo)
+        edit_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self.redo)
+        edit_menu.add_separator()
+        edit_menu.add_command(label="Bulk Edit...", command=self.open_bulk_edit)
+        menu_bar.add_cascade(label="Edit", menu=edit_menu)
+
         view_menu = tk.Menu(menu_bar, tearoff=0)
         view_menu.add_command(label="Reset Zoom", command=lambda: self.set_zoom(1.0))
+        view_menu.add_command(label="Compare Tabs...", command=self.open_compare)
+        view_menu.add_separator()
+        self.timing_var = tk.BooleanVar(value=tracer.enabled)
+        view_menu.add_checkbutton(
+            label="Performance Timing",
+            variable=self.timing_var,
+            command=lambda: self.set_timing(self.timing_var.get()),
+        )
+        view_menu.add_command(label="Export Trace...", command=self.export_trace)
         menu_bar.add_cascade(label="View", menu=view_menu)
         self.root_window.config(menu=menu_bar)
 
@@ -84,6 +326,40 @@ class ParameterManagerGUI:
             if file_path and file_path not in self.tabs:
                 self._open_file(file_path)
 
+    def open_workspace_dialog(self):
+        directory = filedialog.askdirectory(title="Select Workspace Folder")
+        if directory:
+            self.open_workspace(directory)
+
+    def open_workspace(self, directory):
+        """Show the INI files under ``directory`` in a side tree.
+
+        The folder is scanned in the background; no tab is created until a
+        file is activated in the tree.  Replaces any open workspace.
+        """
+        self.close_workspace()
+        self.workspace = WorkspacePanel(self.root_window, self, directory)
+        self.workspace.pack(side=tk.LEFT, fill=tk.Y, before=self.notebook)
+        return self.workspace
+
+    def rescan_workspace(self):
+        if self.workspace is not None:
+            self.workspace.rescan()
+
+    def close_workspace(self):
+        if self.workspace is not None:
+            self.workspace.destroy()
+            self.workspace = None
+
+    def open_workspace_file(self, file_path):
+        """Select the tab of ``file_path``, opening it first if needed."""
+        tab = self.tabs.get(file_path)
+        if tab is None:
+            return self._open_file(file_path)
+        # 자리 표시 탭이면 선택될 때 on_tab_changed 가 실제 탭으로 바꾼다
+        self.notebook.select(tab)
+        return self.tabs[file_path]
+
     def show_tab_menu(self, event):
         try:
             index = self.notebook.index(f"@{event.x},{event.y}")
@@ -111,13 +387,20 @@ class ParameterManagerGUI:
         tab.destroy()
 
         if file_path:
+            self.file_watcher.remove(file_path)
             self.tabs.pop(file_path, None)
+            self._last_viewed.pop(file_path, None)
             if file_path in self.open_files:
                 self.open_files.remove(file_path)
 
     def on_close(self):
         for path, tab in self.tabs.items():
+            if hasattr(tab, "flush_save"):
+                tab.flush_save()
             self.file_states[path] = tab.get_state()
+        self.writer.close()
+        self.loader.close(wait=False)
+        self.close_workspace()
         save_state(
             self.state_path,
             self.root_window.geometry(),
@@ -126,20 +409,53 @@ class ParameterManagerGUI:
             self.zoom,
         )
         self.switch_active_tab(None)
+        if self._filter_after_id is not None:
+            self.root_window.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        if self._bulk_after_id is not None:
+            self.root_window.after_cancel(self._bulk_after_id)
+            self._bulk_after_id = None
+        if self._hibernate_after_id is not None:
+            self.root_window.after_cancel(self._hibernate_after_id)
+            self._hibernate_after_id = None
+        if self._timing_after_id is not None:
+            self.root_window.after_cancel(self._timing_after_id)
+            self._timing_after_id = None
+        if self._watch_after_id is not None:
+            self.root_window.after_cancel(self._watch_after_id)
+            self._watch_after_id = None
+        self.file_watcher.close()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            self.watchdog.log_summary()
         # remove resize binding before destroying the window
         if hasattr(self, "_resize_bind_id"):
             self.root_window.unbind("<Configure>", self._resize_bind_id)
         self.root_window.destroy()
 
-    def _open_file(self, file_path):
+    def _open_file(self, file_path, lazy=False):
+        """Add a tab for ``file_path`` and return it.
+
+        With ``lazy`` only a ``LazyTab`` placeholder is added; it is replaced
+        by a real tab the first time it is selected (see ``on_tab_changed``).
+        """
         tab_state = self.file_states.get(file_path)
+        if lazy:
+            tab = LazyTab(self.notebook, file_path, initial_state=tab_state)
+            self.notebook.add(tab, text=os.path.basename(file_path))
+            self.tabs[file_path] = tab
+            if file_path not in self.open_files:
+                self.open_files.append(file_path)
+            return tab
         tab = ParameterTab(
             self.notebook,
             file_path,
             initial_state=tab_state,
             manager=self,
-            zoom=self.zoom,
+            background=True,
+            zoom_context=self.zoom_context,
         )
+        tab.set_filter(self.filter_query, apply=False)
         self.notebook.add(tab, text=os.path.basename(file_path))
         self.tabs[file_path] = tab
         self.notebook.select(tab)
@@ -147,10 +463,118 @@ class ParameterManagerGUI:
         self.switch_active_tab(tab)
         if file_path not in self.open_files:
             self.open_files.append(file_path)
+        return tab
+
+    def _materialize(self, placeholder):
+        """Replace a ``LazyTab`` with a real ``ParameterTab`` at the same position.
+
+        A hibernated placeholder hands over its model and undo journal unless
+        the file changed on disk since it went to sleep.
+        """
+        file_path = placeholder.file_path
+        preloaded = None
+        if placeholder.hibernated:
+            file_hash, sections, signature = placeholder.model
+            if stat_signature(file_path) == signature:
+                preloaded = (file_hash, sections, signature)
+        tab = ParameterTab(
+            self.notebook,
+            file_path,
+            initial_state=placeholder.initial_state,
+            manager=self,
+            background=True,
+            zoom_context=self.zoom_context,
+            preloaded=preloaded,
+        )
+        if placeholder.journal is not None:
+            tab.journal = placeholder.journal
+        tab.set_filter(self.filter_query, apply=False)
+        self.notebook.insert(placeholder, tab, text=os.path.basename(file_path))
+        # 자리 표시 탭을 지우기 전에 선택을 옮겨야 이웃 탭이 선택되지 않는다
+        self.notebook.select(tab)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        self.tabs[file_path] = tab
+        return tab
+
+    def hibernate_tab(self, tab):
+        """Replace ``tab`` by a ``LazyTab`` that keeps only its model and state.
+
+        The widgets, the tab's timers and its watcher entry are dropped; the
+        model, file hash, undo journal and ``get_state()`` (including the
+        scroll position) are kept for ``_materialize``.  Returns ``False``
+        for tabs that cannot sleep right now: the current tab, tabs that are
+        loading or being built, and tabs with edits not yet on disk (their
+        save is started so they can sleep on a later check).
+        """
+        if tab is self.current_tab or not isinstance(tab, ParameterTab):
+            return False
+        if tab.loading or tab.populating:
+            return False
+        if tab.save_pending:
+            tab.flush_save()
+            return False
+        file_path = tab.file_path
+        placeholder = LazyTab(
+            self.notebook,
+            file_path,
+            initial_state=tab.get_state(),
+            # 지금 stat 하면 아직 확인하지 않은 외부 변경이 기준값에 섞인다
+            model=(tab.last_file_hash, tab.sections, self.file_watcher.signature(file_path)),
+            journal=tab.journal,
+        )
+        self.notebook.insert(tab, placeholder, text=os.path.basename(file_path))
+        self.notebook.forget(tab)
+        tab.destroy()
+        self.file_watcher.remove(file_path)
+        self.tabs[file_path] = placeholder
+        return True
+
+    def enforce_tab_budget(self, now=None):
+        """Hibernate idle tabs, then least recently viewed ones over budget.
+
+        A tab is idle after ``hibernate_after`` seconds without being
+        selected.  While more than ``max_live_tabs`` tabs have widgets, or
+        their parameter cells exceed ``cell_budget``, the least recently
+        viewed tabs are hibernated as well.  Returns the hibernated paths.
+        """
+        now = time.monotonic() if now is None else now
+        live = [tab for tab in self.tabs.values() if isinstance(tab, ParameterTab)]
+        count = len(live)
+        cells = sum(tab.cell_count for tab in live)
+        live.sort(key=lambda tab: self._last_viewed.get(tab.file_path, now))
+        hibernated = []
+        for tab in live:
+            idle = now - self._last_viewed.get(tab.file_path, now)
+            over_budget = count > self.max_live_tabs or cells > self.cell_budget
+            if not over_budget and (
+                self.hibernate_after is None or idle < self.hibernate_after
+            ):
+                # 나머지 탭은 더 최근에 본 탭이다
+                break
+            tab_cells = tab.cell_count
+            if self.hibernate_tab(tab):
+                count -= 1
+                cells -= tab_cells
+                hibernated.append(tab.file_path)
+        if hibernated:
+            logger.info("Hibernated %d tab(s): %s", len(hibernated), ", ".join(hibernated))
+        return hibernated
+
+    def _check_hibernation(self):
+        self._hibernate_after_id = None
+        self.enforce_tab_budget()
+        self._hibernate_after_id = self.root_window.after(
+            HIBERNATE_CHECK_MS, self._check_hibernation
+        )
 
     def on_tab_changed(self, event):
         tab_id = self.notebook.select()
+        if not tab_id:
+            return
         tab = self.notebook.nametowidget(tab_id)
+        if isinstance(tab, LazyTab):
+            tab = self._materialize(tab)
         self.switch_active_tab(tab)
         if hasattr(tab, "update_layout_for_current_size"):
             tab.update_layout_for_current_size()
@@ -161,16 +585,197 @@ class ParameterManagerGUI:
             self.current_tab.on_resize(event)
 
     def set_zoom(self, value):
-        """Apply zoom level globally to all tabs."""
-        value = max(0.5, min(3.0, value))
-        if self.zoom == value:
+        """Apply zoom level globally to all tabs.
+
+        The shared fonts change at once; only the visible tab is relaid out
+        now, the others catch up when they are selected.
+        """
+        if not self.zoom_context.set_zoom(value):
             return
-        self.zoom = value
-        for tab in self.tabs.values():
-            if hasattr(tab, "set_zoom"):
-                tab.set_zoom(value)
+        self.zoom = self.zoom_context.zoom
+        if self.current_tab is not None and hasattr(self.current_tab, "sync_zoom"):
+            self.current_tab.sync_zoom()
         self.update_zoom_label()
 
+    def undo(self):
+        """Undo the last edit or section move of the current tab."""
+        if hasattr(self.current_tab, "undo"):
+            self.current_tab.undo()
+
+    def redo(self):
+        if hasattr(self.current_tab, "redo"):
+            self.current_tab.redo()
+
+    def open_compare(self):
+        """Open a compare window for the current tab and the next loaded tab."""
+        others = [
+            tab for tab in self.tabs.values()
+            if tab is not self.current_tab and isinstance(tab, ParameterTab)
+        ]
+        window = CompareWindow(self, self.current_tab, others[0] if others else None)
+        self.compare_windows.append(window)
+        return window
+
+    def open_bulk_edit(self):
+        return BulkEditDialog(self)
+
+    def bulk_edit(
+        self,
+        key_pattern,
+        value=None,
+        section_pattern="*",
+        flip=False,
+        all_tabs=False,
+        callback=None,
+    ):
+        """Apply a pattern edit to the current tab or to every open tab.
+
+        Each loaded tab applies it as one model update, one widget pass and
+        one save.  Files whose tab was never selected or is still loading
+        are patched directly on the loader threads.  A tab that finishes
+        loading afterwards is reloaded by the watcher: its baseline is the
+        stat signature taken before the tab read the file, so a patch that
+        lands after the read is seen as a change.  ``callback(totals)`` is
+        called with running ``values``/``files``/``pending``/``failed``
+        counts, first right away and again as background files finish.
+        Returns the totals dictionary.
+        """
+        if all_tabs:
+            tabs = list(self.tabs.values())
+        else:
+            tabs = [self.current_tab] if self.current_tab is not None else []
+        totals = {"values": 0, "files": 0, "pending": 0, "failed": 0}
+
+        def report():
+            if callback is not None:
+                callback(totals)
+
+        def on_file_done(count, error):
+            self._bulk_jobs -= 1
+            totals["pending"] -= 1
+            if error is not None:
+                logger.warning("Bulk edit failed: %s", error)
+                totals["failed"] += 1
+            elif count:
+                totals["values"] += count
+                totals["files"] += 1
+            report()
+
+        for tab in tabs:
+            if isinstance(tab, LazyTab) or tab.loading:
+                totals["pending"] += 1
+                self._bulk_jobs += 1
+                self.loader.submit(
+                    bulk_edit_file,
+                    on_file_done,
+                    tab.file_path,
+                    key_pattern,
+                    value,
+                    section_pattern,
+                    flip,
+                )
+                continue
+            count = tab.bulk_edit(key_pattern, value, section_pattern, flip)
+            if count:
+                totals["values"] += count
+                totals["files"] += 1
+        if self._bulk_jobs and self._bulk_after_id is None:
+            self._bulk_after_id = self.root_window.after(
+                BULK_POLL_MS, self._poll_bulk_results
+            )
+        report()
+        return totals
+
+    def _poll_bulk_results(self):
+        self._bulk_after_id = None
+        self.loader.drain()
+        if self._bulk_jobs:
+            self._bulk_after_id = self.root_window.after(
+                BULK_POLL_MS, self._poll_bulk_results
+            )
+
+    @property
+    def filter_query(self):
+        return self.filter_var.get().strip()
+
+    def focus_filter(self, event=None):
+        # 첫 입력이 빠르도록 불러온 탭의 검색 색인을 미리 만든다
+        for tab in self.tabs.values():
+            if hasattr(tab, "search_index") and not tab.loading:
+                tab.search_index().build()
+        self.filter_entry.focus_set()
+        self.filter_entry.select_range(0, tk.END)
+        return "break"
+
+    def schedule_filter(self):
+        """Run ``apply_filter`` once after the keystrokes queued so far."""
+        if self._filter_after_id is None:
+            self._filter_after_id = self.root_window.after_idle(self.apply_filter)
+
+    def apply_filter(self):
+        """Search every loaded tab and filter the visible one right away.
+
+        Hidden tabs only compute their matches; their widgets are updated
+        when they are selected.  Tabs that were never opened are skipped.
+        """
+        self._filter_after_id = None
+        query = self.filter_query
+        total = 0
+        matched_tabs = 0
+        for tab in self.tabs.values():
+            if not hasattr(tab, "set_filter"):
+                continue
+            count = tab.set_filter(query, apply=tab is self.current_tab)
+            if count:
+                total += count
+                matched_tabs += 1
+        if query:
+            self.filter_label.config(text=f"{total} matches in {matched_tabs} tab(s)")
+        else:
+            self.filter_label.config(text="")
+
     def update_zoom_label(self):
         self.zoom_label.config(text=f"Zoom: {int(self.zoom * 100)}%")
 
+    def set_timing(self, enabled):
+        """Turn span recording and the status bar timing display on or off."""
+        tracer.enabled = enabled
+        self.timing_var.set(enabled)
+        if self._timing_after_id is not None:
+            self.root_window.after_cancel(self._timing_after_id)
+            self._timing_after_id = None
+        if enabled:
+            self.timing_label.pack(side=tk.RIGHT, padx=4, before=self.zoom_label)
+            self.update_timing_label()
+        else:
+            self.timing_label.pack_forget()
+
+    def update_timing_label(self):
+        """Show rolling p50/p99 of the active tab's spans in the status bar."""
+        path = getattr(self.current_tab, "file_path", None)
+        stats = tracer.summary(trace_category(path)) if path else {}
+        parts = [
+            f"{label} {stats[name][1]:.0f}/{stats[name][2]:.0f}"
+            for name, label in TIMING_SPANS
+            if name in stats
+        ]
+        text = " \u00b7 ".join(parts) + " ms (p50/p99)" if parts else "no timings yet"
+        self.timing_label.config(text=text)
+        self._timing_after_id = self.root_window.after(
+            TIMING_REFRESH_MS, self.update_timing_label
+        )
+
+    def export_trace(self):
+        """Write the recorded spans as a Chrome trace JSON file."""
+        path = filedialog.asksaveasfilename(
+            title="Export Trace",
+            defaultextension=".json",
+            filetypes=(("Chrome Trace", "*.json"), ("All Files", "*.*")),
+        )
+        if not path:
+            return
+        try:
+            tracer.export_chrome_trace(path)
+        except OSError as e:
+            logger.warning("Failed to export trace to %s: %s", path, e)
+
@@ -1,44 +1,174 @@
 import tkinter as tk
 from tkinter import ttk
-from tkinter import font as tkfont
+import logging
 import os
+import time
 from collections import OrderedDict
-from config_io import compute_file_hash, load_parameters, save_parameters
+from async_writer import AsyncWriter
+from background_loader import BackgroundLoader
+from bulk_edit import apply_changes, count_changes, plan_bulk_edit
+from config_io import (
+    compute_file_hash,
+    diff_parameters,
+    load_parameters,
+    snapshot_parameters,
+    stat_signature,
+)
+from edit_journal import (
+    ADD,
+    DEFAULT_HISTORY_LIMIT,
+    MOVE,
+    EditJournal,
+    forward_changes,
+    inverse_changes,
+)
+from file_watcher import FileWatcher
+from instrumentation import trace_category, traced, tracer
+from parameter_store import SectionStore
+from search_index import SearchIndex
+from .layout_scheduler import LayoutScheduler
+from .virtual_grid import VirtualGrid
+from .zoom_context import ZoomContext
+
+logger = logging.getLogger(__name__)
+
+# 마지막 편집 후 이 시간(ms) 동안 추가 편집이 없으면 저장
+SAVE_DEBOUNCE_MS = 300
+# 백그라운드 저장 완료를 확인하는 주기(ms)
+SAVE_POLL_MS = 50
+# 매니저 없이 단독으로 쓰일 때 파일 변경을 확인하는 주기(ms)
+STANDALONE_WATCH_INTERVAL_MS = 1000
+# 이 크기 이상의 파일은 메모리 매핑으로 열어 값을 필요할 때만 디코딩
+MAPPED_LOAD_THRESHOLD = 64 * 1024 * 1024
+# 파라미터 수가 이 값 이상이면 보이는 행만 위젯으로 만드는 가상 그리드를 사용
+VIRTUAL_GRID_THRESHOLD = 2000
+# 백그라운드 읽기 결과를 확인하는 주기(ms)
+LOAD_POLL_MS = 30
+# 위젯을 나누어 만들 때 한 번에 메인 루프를 점유하는 최대 시간(ms)
+POPULATE_SLICE_MS = 15
+# 다시 만들 때 재사용하려고 숨겨 두는 파라미터 셀의 최대 수
+CELL_POOL_LIMIT = 2000
+
+
+def _file_size(file_path):
+    try:
+        return os.path.getsize(file_path) if file_path else 0
+    except OSError:
+        return 0
+
+
+def _read_file(file_path):
+    """Parse the file into the compact store, memory-mapping it when it is very large.
+
+    Files above ``config_io.PARALLEL_PARSE_THRESHOLD`` that are still parsed
+    eagerly are split at section headers and parsed in worker processes; if
+    the pool cannot start or breaks, the file is parsed on this thread.
+    """
+    with tracer.span("parse", trace_category(file_path)):
+        if _file_size(file_path) >= MAPPED_LOAD_THRESHOLD:
+            return load_parameters(file_path, mapped=True)
+        return load_parameters(file_path, compact=True, parallel=True)
+
+
+def _load_file(file_path, cache=None):
+    """Hash and parse a file, using the parse cache when one is given.
+
+    Returns ``(file_hash, sections, signature)`` where ``signature`` is the
+    stat signature taken *before* the file was read, so a write that lands
+    while (or after) it is read is seen by the watcher.  Runs on a loader
+    worker thread for background loads.  Memory-mapped files bypass the
+    cache since their values are decoded on demand.
+    """
+    signature = stat_signature(file_path)
+    if cache is not None and 0 < _file_size(file_path) < MAPPED_LOAD_THRESHOLD:
+        with tracer.span("load_cached", trace_category(file_path)):
+            return (*cache.load(file_path, _read_file), signature)
+    with tracer.span("hash", trace_category(file_path)):
+        file_hash = compute_file_hash(file_path)
+    return file_hash, _read_file(file_path), signature
+
 
 class ParameterTab(ttk.Frame):
-    def __init__(self, master, file_path, initial_state=None, manager=None, zoom=1.0):
+    def __init__(
+        self,
+        master,
+        file_path,
+        initial_state=None,
+        manager=None,
+        zoom=1.0,
+        virtual=None,
+        background=False,
+        zoom_context=None,
+        history_limit=DEFAULT_HISTORY_LIMIT,
+        preloaded=None,
+    ):
+        """Create the tab and load ``file_path`` (on a worker with ``background``).
+
+        ``preloaded`` is an already parsed ``(file_hash, sections, signature)``
+        triple, e.g. kept by a hibernated tab; the file is then not read
+        again.
+        """
         super().__init__(master)
         self.file_path = file_path
         self.manager = manager
         self.sections = OrderedDict()
         self.last_file_hash = None
+        # 읽기 전에 잡은 stat 서명 (감시자의 기준값)
+        self._loaded_signature = None
         self.widget_registry = {}
+        # 숨겨 두었다가 재사용하는 파라미터 셀 (frame, label, button, entry)
+        self._cell_pool = []
+        # None 이면 파라미터 수에 따라 가상 그리드 사용 여부를 자동으로 결정
+        self.virtual = virtual
+        self.virtual_grid = None
+        self._own_watcher = None
+        self._watch_after_id = None
+        self._own_writer = None
+        self._own_loader = None
+        self._load_poll_id = None
+        self._populate_after_id = None
+        self._placeholder = None
+        # 백그라운드로 파일을 읽는 중이면 True
+        self.loading = False
+        self._save_after_id = None
+        self._save_poll_id = None
+        self._save_dirty = False
+        self._saves_in_flight = 0
+        # 저장 중이라 미룬 외부 변경 반영 (저장이 모두 끝나면 다시 읽는다)
+        self._reload_after_save = False
+        # 다음 저장에서 값을 비교할 키 ({섹션: 키 집합}), None 이면 전체 비교
+        self._changed_keys = {}
         self.section_states = (initial_state or {}).get("collapsed", {})
         self._saved_order = (initial_state or {}).get("order")
-        # 줌 배율과 기본 폰트/셀 크기 설정
-        self.zoom = zoom
-        self.base_cell_width = int(120 * 0.85)
-        self.cell_width = self.base_cell_width
-        self.base_header_font_size = 9
-        self.base_param_font_size = 10
-        self.header_font = tkfont.Font(
-            family="Arial", size=self.base_header_font_size, weight="bold"
-        )
-        self.param_font = tkfont.Font(
-            family="Arial", size=self.base_param_font_size, weight="bold"
-        )
-        self.button_font = tkfont.Font(
-            family="Arial", size=self.base_param_font_size, weight="bold"
-        )
+        # 위젯이 다 만들어진 뒤 맞출 세로 스크롤 위치 (0.0 - 1.0)
+        self._pending_scroll = (initial_state or {}).get("scroll")
+        # 폰트와 셀 크기는 매니저의 모든 탭이 공유 (단독 사용 시 탭 전용)
+        self.zoom_context = zoom_context if zoom_context is not None else ZoomContext(zoom)
+        # 마지막으로 레이아웃에 반영한 줌 세대 (다르면 표시될 때 다시 배치)
+        self._zoom_generation = None
         self.grid_columns = 4
+        # 검색 색인은 처음 검색할 때 만든다
+        self._search_index = None
+        # 비교 창이 재사용하는 섹션 지문 {섹션: 지문} (config_io.compare_parameters)
+        self.section_prints = {}
+        # 필터 검색어와 그에 일치하는 {섹션: [키, ...]} (None 이면 모두 표시)
+        self.filter_query = ""
+        self.filter_matches = None
+        # 일치 결과를 아직 위젯에 반영하지 않았으면 True (숨은 탭)
+        self._filter_dirty = False
+        # 값 편집과 섹션 이동의 되돌리기 기록
+        self.journal = EditJournal(history_limit)
 
         self.canvas = tk.Canvas(self)
         self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
         self.scrollable_content = ttk.Frame(self.canvas)
+        # 크기 변경, 줌, 내용 변경 이벤트를 모아 idle 시점에 한 번만 배치
+        self._layout_scheduler = LayoutScheduler(self, self._run_layout)
+        self._pending_width = None
 
         self.scrollable_content.bind(
             "<Configure>",
-            lambda e: self.adjust_window_size()
+            lambda e: self.schedule_layout()
         )
 
         # canvas에 올려질 프레임의 ID를 저장해 이후 사이즈 조정에 사용
@@ -51,7 +181,7 @@ class ParameterTab(ttk.Frame):
             lambda e: self.canvas.itemconfigure(self.canvas_window, width=e.width),
         )
         self.scrollable_content.columnconfigure(0, weight=1)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
@@ -65,8 +195,17 @@ class ParameterTab(ttk.Frame):
         self._padding_initialized = False
         self._resize_bind_id = None
 
-        self.set_zoom(self.zoom)
-        self.load_parameters()
+        self.sync_zoom()
+        if preloaded is not None:
+            self.last_file_hash, sections, self._loaded_signature = preloaded
+            self._set_model(sections)
+            self.refresh_ui(progressive=background)
+            self.schedule_layout()
+            self._start_watching()
+        elif background and self.file_path:
+            self.load_parameters_async()
+        else:
+            self.load_parameters()
 
     def update_layout_for_current_size(self):
         """Recalculate grid layout using the current toplevel size."""
@@ -76,17 +215,119 @@ class ParameterTab(ttk.Frame):
         self.update_idletasks()
         self._padding = toplevel.winfo_width() - self.winfo_width()
         self._padding_initialized = True
-        width = toplevel.winfo_width()
-        new_cols = max(1, (width - self._padding) // self.cell_width)
-        self.canvas.itemconfigure(self.canvas_window, width=width - self._padding)
-        if new_cols != self.grid_columns:
-            self.grid_columns = new_cols
-            self.layout_parameters()
+        self._pending_width = None
+        self.sync_zoom()
+        self.sync_filter()
+        # 예약된 요청과 합쳐 지금 바로 한 번 배치
+        self._layout_scheduler.request(resize=True)
+        self._layout_scheduler.flush()
+
+    def schedule_layout(self, resize=False, zoom=False, width=None):
+        """Request a coalesced layout pass (see ``_run_layout``).
+
+        ``resize`` recomputes the column count for ``width`` (or the current
+        toplevel width), ``zoom`` re-measures rows after a font change; every
+        pass ends with one ``adjust_window_size``.
+        """
+        if width is not None:
+            self._pending_width = width
+        self._layout_scheduler.request(resize=resize, zoom=zoom)
+
+    def _run_layout(self, flags):
+        if not self.winfo_exists():
+            return
+        zoom = flags.get("zoom", False)
+        relaid = False
+        if flags.get("resize") or zoom:
+            width = self._pending_width
+            self._pending_width = None
+            if width is None:
+                width = self.winfo_toplevel().winfo_width()
+            if not self._padding_initialized:
+                self._padding = width - self.winfo_width()
+                self._padding_initialized = True
+            new_cols = max(1, (width - self._padding) // self.cell_width)
+            self.canvas.itemconfigure(self.canvas_window, width=width - self._padding)
+            if new_cols != self.grid_columns:
+                self.grid_columns = new_cols
+                self.layout_parameters()
+                relaid = True
+        if zoom and self.virtual_grid is not None:
+            self.virtual_grid.invalidate_metrics()
+            if not relaid:
+                self.virtual_grid.relayout()
         self.adjust_window_size()
+        if self._pending_scroll is not None and not (self.loading or self.populating):
+            self.canvas.yview_moveto(self._pending_scroll)
+            self._pending_scroll = None
+
+    def _read_sections(self):
+        return _read_file(self.file_path)
 
     def load_parameters(self):
-        self.last_file_hash = compute_file_hash(self.file_path)
-        self.sections = load_parameters(self.file_path)
+        self.last_file_hash, sections, self._loaded_signature = _load_file(
+            self.file_path, self._parse_cache()
+        )
+        self._set_model(sections)
+        self.refresh_ui()
+        self.schedule_layout()
+        self._start_watching()
+
+    def _parse_cache(self):
+        return getattr(self.manager, "parse_cache", None)
+
+    def _loader(self):
+        shared = getattr(self.manager, "loader", None)
+        if shared is not None:
+            return shared
+        if self._own_loader is None:
+            self._own_loader = BackgroundLoader(max_workers=1)
+        return self._own_loader
+
+    def load_parameters_async(self):
+        """Hash and parse the file on a worker thread.
+
+        A placeholder is shown until the result arrives; the widgets are then
+        created in time slices (see ``_populate``) so the main loop and the
+        other tabs stay responsive.
+        """
+        self.loading = True
+        self._placeholder = ttk.Label(
+            self.scrollable_content,
+            text=f"Loading {os.path.basename(self.file_path)}\u2026",
+            font=self.header_font,
+        )
+        self._placeholder.grid(row=0, column=0, sticky="w", padx=4, pady=4)
+        self._loader().submit(
+            _load_file, self._on_loaded, self.file_path, self._parse_cache()
+        )
+        self._load_poll_id = self.after(LOAD_POLL_MS, self._poll_load_result)
+
+    def _poll_load_result(self):
+        self._load_poll_id = None
+        self._loader().drain()
+        if self.loading:
+            self._load_poll_id = self.after(LOAD_POLL_MS, self._poll_load_result)
+
+    def _on_loaded(self, result, error):
+        if not self.loading or not self.winfo_exists():
+            return
+        self.loading = False
+        if self._placeholder is not None:
+            self._placeholder.destroy()
+            self._placeholder = None
+        if error is not None:
+            logger.warning("Failed to load %s: %s", self.file_path, error)
+            result = (None, OrderedDict(), None)
+        self.last_file_hash, sections, self._loaded_signature = result
+        self._set_model(sections)
+        self.refresh_ui(progressive=True)
+        self.schedule_layout()
+        self._start_watching()
+
+    def _set_model(self, sections):
+        """Install a freshly parsed model, applying the saved section order."""
+        self.sections = sections
         if self._saved_order:
             ordered = OrderedDict()
             for sec in self._saved_order:
@@ -100,105 +341,348 @@ class ParameterTab(ttk.Frame):
             (len(key) for params in self.sections.values() for key in params),
             default=0,
         )
-        self.refresh_ui()
-        self.adjust_window_size()
-        self.after(100, self.monitor_file_changes)
+        self._model_changed()
+
+    def _file_watcher(self):
+        shared = getattr(self.manager, "file_watcher", None)
+        return shared if shared is not None else self._own_watcher
+
+    def _start_watching(self):
+        """Register with the manager's watcher, or poll with a private one."""
+        if not self.file_path:
+            return
+        shared = getattr(self.manager, "file_watcher", None)
+        if shared is not None:
+            shared.add(self.file_path, self.last_file_hash, self._loaded_signature)
+            return
+        if self._own_watcher is None:
+            self._own_watcher = FileWatcher(use_inotify=False)
+        self._own_watcher.add(self.file_path, self.last_file_hash, self._loaded_signature)
+        if self._watch_after_id is None:
+            self._watch_after_id = self.after(
+                STANDALONE_WATCH_INTERVAL_MS, self._poll_own_watcher
+            )
+
+    def _poll_own_watcher(self):
+        for _path, new_hash in self._own_watcher.poll():
+            if new_hash is not None:
+                self.monitor_file_changes(new_hash)
+        self._watch_after_id = self.after(
+            STANDALONE_WATCH_INTERVAL_MS, self._poll_own_watcher
+        )
+
+    def _writer(self):
+        shared = getattr(self.manager, "writer", None)
+        if shared is not None:
+            return shared
+        if self._own_writer is None:
+            self._own_writer = AsyncWriter()
+        return self._own_writer
+
+    def _schedule_save(self, section=None, param_name=None):
+        """Save after SAVE_DEBOUNCE_MS without further edits.
+
+        ``section``/``param_name`` name the edited value so the writer only
+        patches that line; structural edits need no hint.
+        """
+        if section is not None and self._changed_keys is not None:
+            self._changed_keys.setdefault(section, set()).add(param_name)
+        self._save_dirty = True
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DEBOUNCE_MS, self.flush_save)
+
+    def flush_save(self):
+        """Hand pending edits to the background writer right away."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if not self._save_dirty or not self.file_path:
+            return
+        self._save_dirty = False
+        self._saves_in_flight += 1
+        changed, self._changed_keys = self._changed_keys, {}
+        self._writer().submit(
+            self.file_path,
+            snapshot_parameters(self.sections),
+            self._on_saved,
+            changed=changed,
+        )
+        if self._save_poll_id is None:
+            self._save_poll_id = self.after(SAVE_POLL_MS, self._poll_save_results)
+
+    def _poll_save_results(self):
+        self._save_poll_id = None
+        self._writer().drain()
+        if self._saves_in_flight and self.winfo_exists():
+            self._save_poll_id = self.after(SAVE_POLL_MS, self._poll_save_results)
+
+    def _on_saved(self, file_hash, error, signature=None, previous=None):
+        """Record a finished save and pick up external edits it was patched over.
+
+        ``previous`` is the stat signature of the file the writer patched.
+        If it is not what the watcher last saw, another program wrote the
+        file before our save; the patch only rewrote our edited lines, so
+        the file is read back once no save is pending.  A save that finishes
+        after the tab was closed is only counted.
+        """
+        self._saves_in_flight -= 1
+        if error is not None:
+            logger.warning("Failed to save %s: %s", self.file_path, error)
+            return
+        if not self.winfo_exists():
+            # 닫힌 탭은 감시 목록에서 빠졌으므로 서명을 비교하거나 다시 읽지 않는다
+            return
+        watcher = self._file_watcher()
+        if watcher is not None and previous != watcher.signature(self.file_path):
+            self._reload_after_save = True
+        self.last_file_hash = file_hash
+        self._acknowledge_write(signature)
+        if self._reload_after_save and not self.save_pending:
+            self._reload_after_save = False
+            self.apply_reload(self._read_sections())
+
+    @property
+    def save_pending(self):
+        """True while edits are waiting for or being written to disk."""
+        return self._save_dirty or self._saves_in_flight > 0
+
+    def _acknowledge_write(self, signature=None):
+        """Tell the watcher that the file content written by us is current.
+
+        ``signature`` is the stat signature the writer saw right after
+        writing; a change made after that is still reported by the watcher.
+        """
+        watcher = self._file_watcher()
+        if watcher is not None:
+            watcher.acknowledge(self.file_path, self.last_file_hash, signature)
 
-    def refresh_ui(self):
+    def _on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.virtual_grid is not None:
+            self.virtual_grid.schedule_render()
+
+    def _use_virtual_grid(self):
+        if self.virtual is None:
+            total = sum(len(params) for params in self.sections.values())
+            self.virtual = total >= VIRTUAL_GRID_THRESHOLD
+        return self.virtual
+
+    @traced("refresh_ui")
+    def refresh_ui(self, progressive=False):
+        """Rebuild all widgets from the model.
+
+        With ``progressive`` the section widgets are created a slice at a
+        time between event loop iterations instead of in one blocking pass.
+        """
+        self._cancel_populate()
+        # 새로 만드는 위젯에는 현재 필터가 그대로 적용된다
+        self._filter_dirty = False
+        for info in self.widget_registry.values():
+            self._release_cells(info["params"].values())
+        keep = {cell[0] for cell in self._cell_pool}
+        keep.add(self._placeholder)
         for widget in self.scrollable_content.winfo_children():
-            widget.destroy()
+            if widget not in keep:
+                widget.destroy()
         self.widget_registry.clear()
 
-        for sec_index, (section, params) in enumerate(self.sections.items()):
-            outer = ttk.Frame(self.scrollable_content, borderwidth=2, relief="groove")
-            outer.grid(row=sec_index, column=0, sticky="nsew", padx=1, pady=1)
-            header = ttk.Frame(outer)
-            header.grid(row=0, column=0, sticky="ew")
-            outer.columnconfigure(0, weight=1)
-
-            collapsed = self.section_states.get(section, False)
-            toggle_btn = ttk.Button(
-                header,
-                text="+" if collapsed else "-",
-                width=2,
-                command=lambda s=section: self.toggle_section(s),
-            )
-            toggle_btn.pack(side="left")
-
-            up_btn = ttk.Button(
-                header, text="\u2191", width=2, command=lambda s=section: self.move_section_up(s)
-            )
-            up_btn.pack(side="left")
-
-            down_btn = ttk.Button(
-                header, text="\u2193", width=2, command=lambda s=section: self.move_section_down(s)
-            )
-            down_btn.pack(side="left")
-
-            ttk.Label(header, text=section, font=self.header_font).pack(
-                side="left", padx=(4, 0), fill="x", expand=True
-            )
-
-
-            grid_frame = ttk.Frame(outer)
-            grid_frame.grid(row=1, column=0, sticky="nsew")
-
-            self.widget_registry[section] = {
-                "frame": outer,
-                "grid_frame": grid_frame,
-                "params": {},
-                "toggle": toggle_btn,
-            }
+        if self._use_virtual_grid():
+            if self.virtual_grid is None:
+                self.virtual_grid = VirtualGrid(self)
+                self.canvas.itemconfigure(self.canvas_window, state="hidden")
+            self.virtual_grid.release_all()
+            self.virtual_grid.relayout()
+            return
+
+        if progressive:
+            self._populate(self._iter_build_steps())
+            return
+        for sec_index, section in enumerate(self.sections):
+            self._build_section(section, sec_index)
+        self.layout_parameters()
+
+    def _iter_build_steps(self):
+        """Create section widgets one header or cell per step.
+
+        Values may be edited and sections expanded between steps, so values
+        are read from the model when a cell is created and cells that already
+        exist are skipped.  Structural changes restart the population (see
+        ``apply_reload``).
+        """
+        for sec_index, section in enumerate(list(self.sections)):
+            if section in self.widget_registry:
+                continue
+            self._build_section(section, sec_index, build_params=False)
+            yield
+            info = self.widget_registry[section]
+            if self.section_states.get(section, False):
+                continue
+            params = self.sections[section]
+            for index, param_name in enumerate(list(params.keys())):
+                if info["built"]:
+                    break
+                if param_name not in info["params"]:
+                    self.create_parameter_widget(section, index, param_name, params[param_name])
+                    yield
+            else:
+                info["built"] = True
+            self._layout_section(section)
+
+    @traced("populate_slice")
+    def _populate(self, steps):
+        """Run ``steps`` for at most POPULATE_SLICE_MS, then yield to Tk."""
+        self._populate_after_id = None
+        deadline = time.perf_counter() + POPULATE_SLICE_MS / 1000
+        for _ in steps:
+            if time.perf_counter() >= deadline:
+                self._populate_after_id = self.after(1, self._populate, steps)
+                return
+        self.schedule_layout()
+
+    def _cancel_populate(self):
+        if self._populate_after_id is not None:
+            self.after_cancel(self._populate_after_id)
+            self._populate_after_id = None
+
+    @property
+    def populating(self):
+        """True while widgets are still being created in time slices."""
+        return self._populate_after_id is not None
+
+    def _build_section(self, section, sec_index, build_params=True):
+        """Create the header and grid frame of a section.
+
+        Parameter cells are only created when the section is expanded; a
+        collapsed section gets its cells the first time it is opened.
+        """
+        outer = ttk.Frame(self.scrollable_content, borderwidth=2, relief="groove")
+        outer.grid(row=sec_index, column=0, sticky="nsew", padx=1, pady=1)
+        if self._section_hidden(section):
+            outer.grid_remove()
+        header = ttk.Frame(outer)
+        header.grid(row=0, column=0, sticky="ew")
+        outer.columnconfigure(0, weight=1)
+
+        collapsed = self.section_states.get(section, False)
+        toggle_btn = ttk.Button(
+            header,
+            text="+" if collapsed else "-",
+            width=2,
+            command=lambda s=section: self.toggle_section(s),
+        )
+        toggle_btn.pack(side="left")
+
+        up_btn = ttk.Button(
+            header, text="\u2191", width=2, command=lambda s=section: self.move_section_up(s)
+        )
+        up_btn.pack(side="left")
+
+        down_btn = ttk.Button(
+            header, text="\u2193", width=2, command=lambda s=section: self.move_section_down(s)
+        )
+        down_btn.pack(side="left")
+
+        ttk.Label(header, text=section, font=self.header_font).pack(
+            side="left", padx=(4, 0), fill="x", expand=True
+        )
 
-            if collapsed:
-                grid_frame.grid_remove()
+        grid_frame = ttk.Frame(outer)
+        grid_frame.grid(row=1, column=0, sticky="nsew")
 
-            for index, (param_name, param_value) in enumerate(params.items()):
+        self.widget_registry[section] = {
+            "frame": outer,
+            "grid_frame": grid_frame,
+            "params": {},
+            "toggle": toggle_btn,
+            "built": False,
+        }
+
+        if collapsed:
+            grid_frame.grid_remove()
+        elif build_params:
+            self._build_section_params(section)
+
+    def _build_section_params(self, section):
+        """Create the parameter cells of a section that has none yet."""
+        info = self.widget_registry[section]
+        params = info["params"]
+        for index, (param_name, param_value) in enumerate(self.sections[section].items()):
+            if param_name not in params:
                 self.create_parameter_widget(section, index, param_name, param_value)
-        self.layout_parameters()
+        info["built"] = True
 
     def create_parameter_widget(self, section, index, param_name, param_value):
+        """Create or recycle the cell of one parameter in its section grid.
+
+        Cells are children of ``scrollable_content`` and gridded *into* the
+        section's grid frame, so they outlive the section frames and can be
+        taken from ``_cell_pool`` when widgets are rebuilt.
+        """
         section_info = self.widget_registry[section]
         row, column = divmod(index, self.grid_columns)
         row += 1
         container = section_info["grid_frame"]
-        parameter_frame = ttk.Frame(
-            container, borderwidth=1, relief="solid", width=self.cell_width
+        if self._cell_pool:
+            parameter_frame, label, toggle_button, value_entry = self._cell_pool.pop()
+            parameter_frame.config(width=self.cell_width)
+            label.config(text=param_name, font=self.param_font)
+            value_entry.config(font=self.param_font)
+            value_entry.delete(0, tk.END)
+            # 나중에 만든 섹션 프레임에 가려지지 않도록 위로 올린다
+            parameter_frame.lift()
+        else:
+            parameter_frame = ttk.Frame(
+                self.scrollable_content, borderwidth=1, relief="solid", width=self.cell_width
+            )
+            # 파라미터 텍스트 크기를 키워 가독성을 높임
+            label = ttk.Label(
+                parameter_frame,
+                text=param_name,
+                font=self.param_font,
+                anchor=tk.W,
+            )
+            label.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+            toggle_button = tk.Button(parameter_frame, fg="white", width=4)
+            toggle_button.grid(row=1, column=0)
+            value_entry = ttk.Entry(parameter_frame, width=8, font=self.param_font)
+            value_entry.grid(row=1, column=1)
+        # 셀 간 간격을 좁히기 위해 padding 값을 조정
+        parameter_frame.grid(
+            in_=container, row=row, column=column, padx=1, pady=1, sticky="nsew"
         )
-        # 셀 간 간격을 좁히기 위해 padding 값을 조정
-        parameter_frame.grid(row=row, column=column, padx=1, pady=1, sticky="nsew")
-
-        # 파라미터 텍스트 크기를 키워 가독성을 높임
-        ttk.Label(
-            parameter_frame,
-            text=param_name,
-            font=self.param_font,
-            anchor=tk.W,
-        ).grid(row=0, column=0, columnspan=2, sticky=tk.W)
-
-        toggle_button = tk.Button(
-            parameter_frame,
+        toggle_button.config(
             text="ON" if param_value == "1" else "OFF",
             bg="green" if param_value == "1" else "red",
-            fg="white",
             font=self.button_font,
-            width=4,
             command=lambda: self.toggle_parameter_value(section, param_name),
         )
-        toggle_button.grid(row=1, column=0)
-
-        value_entry = ttk.Entry(parameter_frame, width=8, font=self.param_font)
         value_entry.insert(0, param_value)
         value_entry.bind(
             "<Return>",
             lambda e: self.update_parameter_value(section, param_name, value_entry.get()),
         )
-        value_entry.grid(row=1, column=1)
-
         section_info["params"][param_name] = (parameter_frame, toggle_button, value_entry)
 
+    def _release_cells(self, cells):
+        """Hide parameter cells and keep up to CELL_POOL_LIMIT for reuse."""
+        for parameter_frame, toggle_button, value_entry in cells:
+            if len(self._cell_pool) >= CELL_POOL_LIMIT:
+                parameter_frame.destroy()
+                continue
+            parameter_frame.grid_forget()
+            label = parameter_frame.grid_slaves(row=0, column=0)[0]
+            self._cell_pool.append((parameter_frame, label, toggle_button, value_entry))
+
     def update_parameter_widget(self, section, param_name, param_value):
-        parameter_frame, toggle_button, value_entry = self.widget_registry[section]["params"][param_name]
+        if self.virtual_grid is not None:
+            self.virtual_grid.update_cell(section, param_name, param_value)
+            return
+        widgets = self.widget_registry.get(section, {}).get("params", {}).get(param_name)
+        if widgets is None:
+            # 아직 위젯이 만들어지지 않은 섹션은 모델만 갱신된 상태로 둔다
+            return
+        parameter_frame, toggle_button, value_entry = widgets
         toggle_button.config(
             text="ON" if param_value == "1" else "OFF",
             bg="green" if param_value == "1" else "red",
@@ -212,67 +696,347 @@ class ParameterTab(ttk.Frame):
     def toggle_parameter_value(self, section, param_name):
         current = self.sections[section][param_name]
         self.sections[section][param_name] = "0" if current == "1" else "1"
+        self.journal.record_values(
+            [(section, param_name, current, self.sections[section][param_name])]
+        )
+        self._section_edited(section)
         self.update_parameter_widget(section, param_name, self.sections[section][param_name])
-        save_parameters(self.file_path, self.sections)
-        self.last_file_hash = compute_file_hash(self.file_path)
+        self._schedule_save(section, param_name)
 
     def update_parameter_value(self, section, param_name, param_value):
+        self.journal.record_values(
+            [(section, param_name, self.sections[section][param_name], param_value)]
+        )
         self.sections[section][param_name] = param_value
+        self._section_edited(section)
         self.update_parameter_widget(section, param_name, param_value)
-        save_parameters(self.file_path, self.sections)
-        self.last_file_hash = compute_file_hash(self.file_path)
+        self._schedule_save(section, param_name)
 
-    def monitor_file_changes(self):
+    def bulk_edit(self, key_pattern, value=None, section_pattern="*", flip=False):
+        """Set ``value`` (or flip ON/OFF) for every matching key of this file.
+
+        Patterns are ``fnmatch`` globs; see :func:`bulk_edit.plan_bulk_edit`.
+        Returns the number of changed values.
+        """
+        changes = plan_bulk_edit(self.sections, key_pattern, value, section_pattern, flip)
+        return self.apply_changes(changes)
+
+    def apply_changes(self, changes, record=True):
+        """Apply ``{section: {key: value}}`` as a single edit.
+
+        The model is updated in one pass, each affected widget is refreshed
+        once and one save carrying all edited keys is handed to the writer
+        right away instead of after the edit debounce.  With ``record`` the
+        edit becomes one undo step.
+        """
+        if not changes:
+            return 0
+        if record:
+            self.journal.record_values(
+                (section, key, self.sections[section][key], value)
+                for section, values in changes.items()
+                for key, value in values.items()
+            )
+        hints = apply_changes(self.sections, changes)
+        for section, values in changes.items():
+            self._section_edited(section)
+            for key, value in values.items():
+                self.update_parameter_widget(section, key, value)
+        if self._changed_keys is not None:
+            for section, keys in hints.items():
+                self._changed_keys.setdefault(section, set()).update(keys)
+        self._save_dirty = True
+        self.flush_save()
+        return count_changes(changes)
+
+    def insert_parameters(self, section, values, record=True):
+        """Add the keys of ``values`` that ``section`` lacks, creating it if needed.
+
+        Keys the section already has are left alone (``apply_changes`` edits
+        those).  Widgets are updated like for an external structural change,
+        one save is handed to the writer right away and with ``record`` the
+        addition becomes one undo step.  Returns the number of added keys.
+        """
+        created = section not in self.sections
+        params = SectionStore() if created else self.sections[section]
+        items = [(key, value) for key, value in values.items() if key not in params]
+        if not items:
+            return 0
+        if created:
+            self.sections[section] = params
+        for key, value in items:
+            params[key] = value
+        if record:
+            self.journal.record_add(section, items, created)
+        self._keys_edited(section, [key for key, _value in items], created, added=True)
+        return len(items)
+
+    def _remove_parameters(self, section, keys, drop_section=False):
+        """Undo ``insert_parameters``: remove ``keys`` and the then empty section."""
+        params = self.sections.get(section)
+        if params is None:
+            return
+        keys = [key for key in keys if key in params]
+        for key in keys:
+            del params[key]
+        dropped = drop_section and not params
+        if dropped:
+            del self.sections[section]
+        if keys or dropped:
+            self._keys_edited(section, keys, dropped, added=False)
+
+    def _keys_edited(self, section, keys, whole_section, added):
+        if whole_section:
+            diff = {
+                "added": [section] if added else [],
+                "removed": [] if added else [section],
+                "order_changed": False,
+                "sections": {},
+            }
+        else:
+            diff = {
+                "added": [],
+                "removed": [],
+                "order_changed": False,
+                "sections": {
+                    section: {
+                        "added": keys if added else [],
+                        "removed": [] if added else keys,
+                        "changed": [],
+                        "reordered": False,
+                    }
+                },
+            }
+        self._model_changed([section])
+        self._show_diff(diff)
+        if self._changed_keys is not None and added:
+            self._changed_keys.setdefault(section, set()).update(keys)
+        self._save_dirty = True
+        self.flush_save()
+
+    def monitor_file_changes(self, current_hash=None):
+        """Reload the model when the file content differs from the last hash.
+
+        The shared ``FileWatcher`` passes the hash it already computed; without
+        it the file is hashed here.  While a save is pending the reload is
+        deferred until the save has finished (see ``_on_saved``).
+        """
         if not self.file_path:
             return
-        file_size = os.path.getsize(self.file_path)
-        interval = 1000 if file_size < 1024 * 10 else 2000
-        current_hash = compute_file_hash(self.file_path)
-        if current_hash != self.last_file_hash:
-            new_sections = load_parameters(self.file_path)
+        if self.save_pending:
+            # 저장이 끝난 뒤 파일을 다시 읽는다 (패치 저장은 편집한 줄만 고치므로
+            # 다른 키의 외부 변경은 파일에 남아 있다)
+            self._reload_after_save = True
+            return
+        if current_hash is None:
+            with tracer.span("rehash", trace_category(self.file_path)):
+                current_hash = compute_file_hash(self.file_path)
+        if current_hash is not None and current_hash != self.last_file_hash:
+            self.apply_reload(self._read_sections())
+            self.last_file_hash = current_hash
 
-            structure_changed = (
-                list(new_sections.keys()) != list(self.sections.keys())
-            )
-            if not structure_changed:
-                for sec in new_sections:
-                    if list(new_sections[sec].keys()) != list(
-                        self.sections.get(sec, {}).keys()
-                    ):
-                        structure_changed = True
-                        break
+    @traced("apply_reload")
+    def apply_reload(self, new_sections):
+        """Replace the model and touch only the widgets that differ.
+
+        Sections and cells that are not part of the diff keep their widgets,
+        and the scroll position is preserved.
+        """
+        if self.populating:
+            # 위젯을 나누어 만드는 중이면 새 모델로 처음부터 다시 만든다
+            self.sections = new_sections
+            self._model_changed()
+            self.refresh_ui(progressive=True)
+            return
+        diff = diff_parameters(self.sections, new_sections)
+        self.sections = new_sections
+        self._model_changed(diff["sections"])
+        self._show_diff(diff)
 
-            if structure_changed:
-                self.sections = new_sections
-                self.refresh_ui()
+    def _show_diff(self, diff):
+        """Bring the widgets in line with ``self.sections`` after ``diff``.
+
+        ``diff`` has the shape returned by ``config_io.diff_parameters``.
+        """
+        if self.populating:
+            self.refresh_ui(progressive=True)
+            return
+        sections = self.sections
+        structure_changed = bool(
+            diff["added"] or diff["removed"] or diff["order_changed"]
+        ) or any(
+            sec_diff["added"] or sec_diff["removed"] or sec_diff["reordered"]
+            for sec_diff in diff["sections"].values()
+        )
+        if self.virtual_grid is not None:
+            self._filter_dirty = False
+            if structure_changed or self.filter_query:
+                self.virtual_grid.release_all()
+                self.virtual_grid.relayout()
             else:
-                for sec, params in new_sections.items():
-                    for param, value in params.items():
-                        if self.sections[sec][param] != value:
-                            self.sections[sec][param] = value
-                            self.update_parameter_widget(sec, param, value)
-                self.adjust_window_size()
+                for sec, sec_diff in diff["sections"].items():
+                    for key in sec_diff["changed"]:
+                        self.virtual_grid.update_cell(sec, key, sections[sec][key])
+            return
 
-            self.last_file_hash = current_hash
-        self.after(interval, self.monitor_file_changes)
+        top = self.canvas.yview()[0]
+        for sec in diff["removed"]:
+            info = self.widget_registry.pop(sec, None)
+            if info is not None:
+                self._release_cells(info["params"].values())
+                info["frame"].destroy()
+        for sec in diff["added"]:
+            self._build_section(sec, 0)
+        for sec, sec_diff in diff["sections"].items():
+            info = self.widget_registry.get(sec)
+            if info is None or not info["built"]:
+                continue
+            params = sections[sec]
+            self._release_cells(info["params"].pop(key) for key in sec_diff["removed"])
+            for key in sec_diff["added"]:
+                self.create_parameter_widget(sec, 0, key, params[key])
+            for key in sec_diff["changed"]:
+                self.update_parameter_widget(sec, key, params[key])
+            if sec_diff["added"] or sec_diff["removed"] or sec_diff["reordered"]:
+                self._layout_section(sec)
+        for sec in diff["added"]:
+            self._layout_section(sec)
+        if diff["added"] or diff["removed"] or diff["order_changed"]:
+            self._grid_sections()
+        self.sync_filter()
+        self.schedule_layout()
+        if structure_changed:
+            self.canvas.yview_moveto(top)
+
+    def search_index(self):
+        """Return the search index of this tab's model, creating it on first use."""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.sections)
+        return self._search_index
+
+    def _section_edited(self, section):
+        """Drop what is cached about ``section`` after its values changed."""
+        if self._search_index is not None:
+            self._search_index.invalidate(section)
+        self.section_prints.pop(section, None)
+
+    def _model_changed(self, changed=None):
+        """Re-point the search index at ``self.sections`` and redo the filter.
+
+        ``changed`` lists the sections whose content differs from the old
+        model; ``None`` means all of them.  Their section fingerprints are
+        dropped as well.
+        """
+        if self._search_index is not None:
+            self._search_index.set_sections(self.sections, changed)
+        if changed is None:
+            self.section_prints.clear()
+        else:
+            for section in list(self.section_prints):
+                if section in changed or section not in self.sections:
+                    del self.section_prints[section]
+        if self.filter_query:
+            self.filter_matches = self.search_index().search(self.filter_query)
+            self._filter_dirty = True
+
+    def set_filter(self, query, apply=True):
+        """Show only the parameters whose key or value contains ``query``.
+
+        Sections without a match are hidden entirely.  Returns the number of
+        matching parameters (``None`` for an empty query).  With ``apply``
+        false only the matches are computed; the widgets follow on the next
+        ``sync_filter``, which the manager calls when the tab is selected.
+        """
+        if query == self.filter_query:
+            return self.filter_count
+        self.filter_query = query
+        self.filter_matches = self.search_index().search(query) if query else None
+        self._filter_dirty = True
+        if apply:
+            self.sync_filter()
+            self.canvas.yview_moveto(0)
+        return self.filter_count
+
+    @property
+    def filter_count(self):
+        if self.filter_matches is None:
+            return None
+        return sum(len(keys) for keys in self.filter_matches.values())
+
+    def sync_filter(self):
+        """Hide or show widgets to match ``filter_matches`` if it changed."""
+        if not self._filter_dirty or self.loading:
+            return
+        self._filter_dirty = False
+        if self.virtual_grid is not None:
+            self.virtual_grid.relayout()
+        else:
+            for section, info in self.widget_registry.items():
+                if self._section_hidden(section):
+                    info["frame"].grid_remove()
+                else:
+                    info["frame"].grid()
+            self.layout_parameters()
+        self.schedule_layout()
+
+    def _section_hidden(self, section):
+        return self.filter_matches is not None and section not in self.filter_matches
+
+    def _grid_sections(self):
+        """Re-grid the existing section frames in model order."""
+        for sec_index, section in enumerate(self.sections):
+            info = self.widget_registry.get(section)
+            if info is not None:
+                info["frame"].grid_configure(row=sec_index)
+                if self._section_hidden(section):
+                    info["frame"].grid_remove()
 
+    @traced("adjust_window_size")
     def adjust_window_size(self):
+        if self.virtual_grid is not None:
+            self.canvas.config(scrollregion=self.virtual_grid.scrollregion())
+            self.virtual_grid.schedule_render()
+            return
         self.update_idletasks()
         bbox = self.canvas.bbox("all")
         if bbox:
             self.canvas.config(scrollregion=bbox)
 
-    def _apply_zoom(self):
-        """Update fonts and layout according to the current zoom level."""
-        self.cell_width = int(self.base_cell_width * self.zoom)
-        self.header_font.config(size=int(self.base_header_font_size * self.zoom))
-        self.param_font.config(size=int(self.base_param_font_size * self.zoom))
-        self.button_font.config(size=int(self.base_param_font_size * self.zoom))
-        self.update_layout_for_current_size()
+    @property
+    def zoom(self):
+        return self.zoom_context.zoom
+
+    @property
+    def cell_width(self):
+        return self.zoom_context.cell_width
+
+    @property
+    def header_font(self):
+        return self.zoom_context.header_font
+
+    @property
+    def param_font(self):
+        return self.zoom_context.param_font
+
+    @property
+    def button_font(self):
+        return self.zoom_context.button_font
+
+    def sync_zoom(self):
+        """Schedule a relayout if the shared zoom changed since the last one.
+
+        Hidden tabs are not touched when the zoom changes; the manager calls
+        this for the visible tab and on tab selection.
+        """
+        if self._zoom_generation == self.zoom_context.generation:
+            return False
+        self._zoom_generation = self.zoom_context.generation
+        self.schedule_layout(zoom=True)
+        return True
 
     def set_zoom(self, value):
-        self.zoom = value
-        self._apply_zoom()
+        self.zoom_context.set_zoom(value)
+        self.sync_zoom()
 
     def _on_mousewheel(self, event):
         ctrl_pressed = bool(event.state & 0x4)
@@ -320,71 +1084,149 @@ class ParameterTab(ttk.Frame):
         if event.widget is not toplevel:
             return
 
-        if not self._padding_initialized:
-            self._padding = event.width - self.winfo_width()
-            self._padding_initialized = True
+        # 드래그 중 연속된 이벤트는 마지막 폭으로 한 번만 배치
+        self.schedule_layout(resize=True, width=event.width)
 
-        new_cols = max(1, (event.width - self._padding) // self.cell_width)
+    @traced("layout_parameters")
+    def layout_parameters(self):
+        if self.virtual_grid is not None:
+            self.virtual_grid.relayout()
+            return
+        for section in self.widget_registry:
+            self._layout_section(section)
 
-        # 창 크기에 맞춰 내부 프레임 폭을 바로 반영
-        self.canvas.itemconfigure(self.canvas_window, width=event.width - self._padding)
-
-        if new_cols != self.grid_columns:
-            self.grid_columns = new_cols
-            self.layout_parameters()
-
-        self.adjust_window_size()
-
-    def layout_parameters(self):
-        for section, info in self.widget_registry.items():
-            container = info["grid_frame"]
-            for i in range(self.grid_columns):
-                container.columnconfigure(i, minsize=self.cell_width)
-            for index, param_name in enumerate(self.sections[section].keys()):
-                frame = info["params"][param_name][0]
-                row, column = divmod(index, self.grid_columns)
-                row += 1
-                frame.grid_configure(row=row, column=column, sticky="nw")
+    def _layout_section(self, section):
+        info = self.widget_registry[section]
+        if not info["built"]:
+            return
+        container = info["grid_frame"]
+        for i in range(self.grid_columns):
+            container.columnconfigure(i, minsize=self.cell_width)
+        params = info["params"]
+        keys = self.sections[section].keys()
+        if self.filter_matches is not None:
+            keys = self.filter_matches.get(section, ())
+            shown = set(keys)
+            # 일치하지 않는 셀은 grid 설정을 기억한 채 숨긴다
+            for param_name, widgets in params.items():
+                if param_name not in shown:
+                    widgets[0].grid_remove()
+        for index, param_name in enumerate(keys):
+            widgets = params.get(param_name)
+            if widgets is None:
+                continue
+            row, column = divmod(index, self.grid_columns)
+            row += 1
+            widgets[0].grid_configure(row=row, column=column, sticky="nw")
 
     def toggle_section(self, section):
+        if self.virtual_grid is not None:
+            self.section_states[section] = not self.section_states.get(section, False)
+            self.virtual_grid.relayout()
+            return
         info = self.widget_registry.get(section)
         if not info:
             return
         collapsed = self.section_states.get(section, False)
         if collapsed:
+            if not info["built"]:
+                self._build_section_params(section)
+                self._layout_section(section)
             info["grid_frame"].grid()
             info["toggle"].config(text="-")
         else:
             info["grid_frame"].grid_remove()
             info["toggle"].config(text="+")
         self.section_states[section] = not collapsed
-        self.adjust_window_size()
+        self.schedule_layout()
 
     def move_section_up(self, section):
-        keys = list(self.sections.keys())
-        idx = keys.index(section)
-        if idx > 0:
-            keys[idx - 1], keys[idx] = keys[idx], keys[idx - 1]
-            self.sections = OrderedDict((k, self.sections[k]) for k in keys)
-            self.refresh_ui()
-            self.adjust_window_size()
-            save_parameters(self.file_path, self.sections)
+        self.move_section(section, -1)
 
     def move_section_down(self, section):
+        self.move_section(section, 1)
+
+    def move_section(self, section, offset, record=True):
+        """Move ``section`` by ``offset`` positions, re-gridding existing widgets."""
         keys = list(self.sections.keys())
         idx = keys.index(section)
-        if idx < len(keys) - 1:
-            keys[idx + 1], keys[idx] = keys[idx], keys[idx + 1]
-            self.sections = OrderedDict((k, self.sections[k]) for k in keys)
-            self.refresh_ui()
-            self.adjust_window_size()
-            save_parameters(self.file_path, self.sections)
+        target = idx + offset
+        if not 0 <= target < len(keys):
+            return False
+        keys.insert(target, keys.pop(idx))
+        self.sections = OrderedDict((k, self.sections[k]) for k in keys)
+        self._model_changed(())
+        if record:
+            self.journal.record_move(section, offset)
+        if self.virtual_grid is not None:
+            self.virtual_grid.relayout()
+        elif self.populating:
+            # 나누어 만드는 중이면 남은 섹션의 행 번호가 달라지므로 다시 시작
+            self.refresh_ui(progressive=True)
+        else:
+            self._grid_sections()
+        self.schedule_layout()
+        self._schedule_save()
+        return True
+
+    def _existing_changes(self, changes):
+        # 외부 변경으로 사라진 섹션이나 키는 건너뛴다
+        return {
+            section: {k: v for k, v in values.items() if k in self.sections[section]}
+            for section, values in changes.items()
+            if section in self.sections
+        }
+
+    def undo(self):
+        """Revert the last edit or section move; returns ``False`` if none."""
+        entry = self.journal.undo()
+        if entry is None:
+            return False
+        if entry[0] == MOVE:
+            _kind, section, offset = entry
+            if section in self.sections:
+                self.move_section(section, -offset, record=False)
+        elif entry[0] == ADD:
+            _kind, section, items, created = entry
+            self._remove_parameters(section, [key for key, _value in items], created)
+        else:
+            self.apply_changes(self._existing_changes(inverse_changes(entry[1])), record=False)
+        return True
+
+    def redo(self):
+        """Re-apply the last undone edit; returns ``False`` if none."""
+        entry = self.journal.redo()
+        if entry is None:
+            return False
+        if entry[0] == MOVE:
+            _kind, section, offset = entry
+            if section in self.sections:
+                self.move_section(section, offset, record=False)
+        elif entry[0] == ADD:
+            _kind, section, items, _created = entry
+            self.insert_parameters(section, dict(items), record=False)
+        else:
+            self.apply_changes(self._existing_changes(forward_changes(entry[1])), record=False)
+        return True
+
+    @property
+    def cell_count(self):
+        """Number of parameter cell widgets this tab keeps alive."""
+        if self.virtual_grid is not None:
+            return self.virtual_grid.cell_count
+        built = sum(len(info["params"]) for info in self.widget_registry.values())
+        return built + len(self._cell_pool)
 
     def get_state(self):
-        """섹션 접힘 상태와 순서를 저장하기 위한 딕셔너리를 반환합니다."""
+        """섹션 접힘 상태, 순서, 스크롤 위치를 저장하기 위한 딕셔너리를 반환합니다."""
+        scroll = self._pending_scroll
+        if scroll is None:
+            scroll = self.canvas.yview()[0]
         return {
             "collapsed": self.section_states,
-            "order": list(self.sections.keys()),
+            # 아직 불러오는 중이면 저장된 순서를 그대로 유지
+            "order": self._saved_order if self.loading else list(self.sections.keys()),
+            "scroll": scroll,
         }
 
     def destroy(self):
@@ -392,6 +1234,31 @@ class ParameterTab(ttk.Frame):
         # Resize events are managed by ParameterManagerGUI, so no unbinding
         # of <Configure> is necessary here.
         self.unbind_mousewheel()
+        self.loading = False
+        self._cancel_populate()
+        self._layout_scheduler.cancel()
+        if self._load_poll_id is not None:
+            self.after_cancel(self._load_poll_id)
+            self._load_poll_id = None
+        if self._own_loader is not None:
+            self._own_loader.close(wait=False)
+            self._own_loader = None
+        self.flush_save()
+        if self._save_poll_id is not None:
+            self.after_cancel(self._save_poll_id)
+            self._save_poll_id = None
+        if self._own_writer is not None:
+            self._own_writer.close()
+            self._own_writer = None
+        if self._watch_after_id is not None:
+            self.after_cancel(self._watch_after_id)
+            self._watch_after_id = None
+        if self._own_watcher is not None:
+            self._own_watcher.close()
+            self._own_watcher = None
+        if self.virtual_grid is not None:
+            self.virtual_grid.destroy()
+            self.virtual_grid = None
         super().destroy()
 
 
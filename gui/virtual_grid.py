@@ -0,0 +1,315 @@
+import tkinter as tk
+from tkinter import ttk
+from bisect import bisect_right
+
+# 뷰포트 위아래로 미리 만들어 둘 행 수
+OVERSCAN_ROWS = 3
+# 셀 사이 간격 (일반 모드의 padx/pady=1 과 맞춤)
+CELL_GAP = 2
+
+
+class _Cell:
+    """재사용 가능한 파라미터 셀 위젯 묶음."""
+
+    __slots__ = ("frame", "label", "button", "entry", "item", "section", "key")
+
+    def __init__(self):
+        self.section = None
+        self.key = None
+
+
+class _Header:
+    """재사용 가능한 섹션 헤더 위젯 묶음."""
+
+    __slots__ = ("frame", "toggle", "label", "item", "section")
+
+    def __init__(self):
+        self.section = None
+
+
+class VirtualGrid:
+    """Render only the rows of a ``ParameterTab`` that intersect the viewport.
+
+    Rows are laid out on the tab's canvas at fixed heights: one header row per
+    section followed by ``ceil(len(params) / grid_columns)`` cell rows unless
+    the section is collapsed.  Cell and header widgets are kept in pools and
+    rebound to other parameters as the view scrolls, so the number of live Tk
+    widgets is bounded by the viewport size instead of the file size.
+    """
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.canvas = tab.canvas
+        self._row_tops = []
+        self._rows = []
+        self._section_keys = {}
+        self.total_height = 0
+        self.cell_height = None
+        self.header_height = None
+        self._cells = {}
+        self._headers = {}
+        self._free_cells = []
+        self._free_headers = []
+        self._render_pending = None
+        self.canvas.bind("<Configure>", self._on_canvas_configure, add="+")
+
+    # ------------------------------------------------------------------
+    # metrics and row model
+    def invalidate_metrics(self):
+        """Forget measured row heights, e.g. after fonts changed size."""
+        self.cell_height = None
+        self.header_height = None
+
+    def _measure(self):
+        if self.cell_height is not None:
+            return
+        cell = self._free_cells.pop() if self._free_cells else self._new_cell()
+        header = self._free_headers.pop() if self._free_headers else self._new_header()
+        cell.label.config(text="X")
+        cell.button.config(font=self.tab.button_font)
+        cell.entry.config(font=self.tab.param_font)
+        self.canvas.update_idletasks()
+        self.cell_height = max(1, cell.frame.winfo_reqheight())
+        self.header_height = max(1, header.frame.winfo_reqheight())
+        self._free_cells.append(cell)
+        self._free_headers.append(header)
+
+    def rebuild_rows(self):
+        """Recompute the row table from the tab's model and section states."""
+        self._measure()
+        tab = self.tab
+        cols = max(1, tab.grid_columns)
+        cell_pitch = self.cell_height + CELL_GAP
+        header_pitch = self.header_height + CELL_GAP
+        rows = []
+        tops = []
+        keys_by_section = {}
+        matches = tab.filter_matches
+        y = 0
+        for section, params in tab.sections.items():
+            if matches is not None:
+                # 필터와 일치하는 항목이 없는 섹션은 헤더도 만들지 않는다
+                keys = matches.get(section)
+                if keys is None:
+                    continue
+            tops.append(y)
+            rows.append((section, -1))
+            y += header_pitch
+            if tab.section_states.get(section, False):
+                continue
+            if matches is None:
+                keys = list(params.keys())
+            keys_by_section[section] = keys
+            for start in range(0, len(keys), cols):
+                tops.append(y)
+                rows.append((section, start))
+                y += cell_pitch
+        self._rows = rows
+        self._row_tops = tops
+        self._section_keys = keys_by_section
+        self.total_height = y
+
+    def scrollregion(self):
+        return (0, 0, max(1, self.canvas.winfo_width()), max(1, self.total_height))
+
+    # ------------------------------------------------------------------
+    # widget pools
+    def _new_cell(self):
+        tab = self.tab
+        cell = _Cell()
+        cell.frame = ttk.Frame(self.canvas, borderwidth=1, relief="solid")
+        cell.label = ttk.Label(cell.frame, text="", font=tab.param_font, anchor=tk.W)
+        cell.label.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        cell.button = tk.Button(
+            cell.frame,
+            fg="white",
+            font=tab.button_font,
+            width=4,
+            command=lambda c=cell: tab.toggle_parameter_value(c.section, c.key),
+        )
+        cell.button.grid(row=1, column=0)
+        cell.entry = ttk.Entry(cell.frame, width=8, font=tab.param_font)
+        cell.entry.bind(
+            "<Return>",
+            lambda e, c=cell: tab.update_parameter_value(c.section, c.key, c.entry.get()),
+        )
+        cell.entry.grid(row=1, column=1)
+        cell.item = self.canvas.create_window(
+            0, 0, window=cell.frame, anchor="nw", state="hidden"
+        )
+        return cell
+
+    def _new_header(self):
+        tab = self.tab
+        header = _Header()
+        header.frame = ttk.Frame(self.canvas, borderwidth=2, relief="groove")
+        header.toggle = ttk.Button(
+            header.frame,
+            width=2,
+            command=lambda h=header: tab.toggle_section(h.section),
+        )
+        header.toggle.pack(side="left")
+        ttk.Button(
+            header.frame,
+            text="\u2191",
+            width=2,
+            command=lambda h=header: tab.move_section_up(h.section),
+        ).pack(side="left")
+        ttk.Button(
+            header.frame,
+            text="\u2193",
+            width=2,
+            command=lambda h=header: tab.move_section_down(h.section),
+        ).pack(side="left")
+        header.label = ttk.Label(header.frame, text="", font=tab.header_font)
+        header.label.pack(side="left", padx=(4, 0), fill="x", expand=True)
+        header.item = self.canvas.create_window(
+            0, 0, window=header.frame, anchor="nw", state="hidden"
+        )
+        return header
+
+    def _bind_cell(self, cell, section, key, value):
+        cell.section = section
+        cell.key = key
+        cell.label.config(text=key)
+        self._show_value(cell, value)
+
+    def _show_value(self, cell, value):
+        cell.button.config(
+            text="ON" if value == "1" else "OFF",
+            bg="green" if value == "1" else "red",
+        )
+        cell.entry.delete(0, tk.END)
+        cell.entry.insert(0, value)
+
+    @property
+    def cell_count(self):
+        """Number of cell widgets alive in the pools, bound or free."""
+        return len(self._cells) + len(self._free_cells)
+
+    def release_all(self):
+        """Hide every bound widget and return it to the pools."""
+        for cell in self._cells.values():
+            self.canvas.itemconfigure(cell.item, state="hidden")
+            cell.section = cell.key = None
+            self._free_cells.append(cell)
+        for header in self._headers.values():
+            self.canvas.itemconfigure(header.item, state="hidden")
+            header.section = None
+            self._free_headers.append(header)
+        self._cells.clear()
+        self._headers.clear()
+
+    def destroy(self):
+        """Destroy all pooled widgets and canvas items."""
+        self.release_all()
+        for cell in self._free_cells:
+            self.canvas.delete(cell.item)
+            cell.frame.destroy()
+        for header in self._free_headers:
+            self.canvas.delete(header.item)
+            header.frame.destroy()
+        self._free_cells.clear()
+        self._free_headers.clear()
+        if self._render_pending is not None:
+            self.canvas.after_cancel(self._render_pending)
+            self._render_pending = None
+
+    # ------------------------------------------------------------------
+    # rendering
+    def relayout(self):
+        """Rebuild the row table and redraw the viewport."""
+        self.rebuild_rows()
+        self.canvas.config(scrollregion=self.scrollregion())
+        self.render()
+
+    def schedule_render(self):
+        if self._render_pending is None:
+            self._render_pending = self.canvas.after_idle(self._run_render)
+
+    def _run_render(self):
+        self._render_pending = None
+        self.render()
+
+    def _on_canvas_configure(self, event):
+        self.canvas.config(scrollregion=self.scrollregion())
+        width = max(1, event.width)
+        for header in self._headers.values():
+            self.canvas.itemconfigure(header.item, width=width)
+        self.schedule_render()
+
+    def visible_rows(self):
+        """Return the ``range`` of row indices inside the viewport plus overscan."""
+        if not self._rows:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        bottom = top + max(1, self.canvas.winfo_height())
+        first = max(0, bisect_right(self._row_tops, top) - 1 - OVERSCAN_ROWS)
+        last = bisect_right(self._row_tops, bottom) + OVERSCAN_ROWS
+        return range(first, min(len(self._rows), last))
+
+    def render(self):
+        """Bind pooled widgets to the rows currently in view."""
+        if self.cell_height is None:
+            return
+        tab = self.tab
+        cols = max(1, tab.grid_columns)
+        pitch = tab.cell_width + CELL_GAP
+        width = max(1, self.canvas.winfo_width())
+        wanted_cells = {}
+        wanted_headers = {}
+        for row in self.visible_rows():
+            section, start = self._rows[row]
+            y = self._row_tops[row]
+            if start < 0:
+                wanted_headers[section] = y
+                continue
+            keys = self._section_keys[section]
+            for col, key in enumerate(keys[start:start + cols]):
+                wanted_cells[(section, key)] = (col * pitch + 1, y)
+
+        for slot in [s for s in self._cells if s not in wanted_cells]:
+            cell = self._cells.pop(slot)
+            self.canvas.itemconfigure(cell.item, state="hidden")
+            self._free_cells.append(cell)
+        for section in [s for s in self._headers if s not in wanted_headers]:
+            header = self._headers.pop(section)
+            self.canvas.itemconfigure(header.item, state="hidden")
+            self._free_headers.append(header)
+
+        for (section, key), (x, y) in wanted_cells.items():
+            cell = self._cells.get((section, key))
+            if cell is None:
+                cell = self._free_cells.pop() if self._free_cells else self._new_cell()
+                self._bind_cell(cell, section, key, tab.sections[section][key])
+                self._cells[(section, key)] = cell
+            self.canvas.coords(cell.item, x, y)
+            self.canvas.itemconfigure(
+                cell.item,
+                width=tab.cell_width,
+                height=self.cell_height,
+                state="normal",
+            )
+        for section, y in wanted_headers.items():
+            header = self._headers.get(section)
+            if header is None:
+                header = self._free_headers.pop() if self._free_headers else self._new_header()
+                header.section = section
+                header.label.config(text=section)
+                self._headers[section] = header
+            header.toggle.config(text="+" if tab.section_states.get(section, False) else "-")
+            self.canvas.coords(header.item, 0, y)
+            self.canvas.itemconfigure(header.item, width=width, state="normal")
+
+    def update_cell(self, section, key, value):
+        """Refresh a bound cell; parameters outside the viewport are skipped."""
+        cell = self._cells.get((section, key))
+        if cell is not None:
+            self._show_value(cell, value)
+
+    def cell_widgets(self, section, key):
+        """Return ``(frame, button, entry)`` if the parameter is materialized."""
+        cell = self._cells.get((section, key))
+        if cell is None:
+            return None
+        return cell.frame, cell.button, cell.entry
@@ -0,0 +1,151 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from workspace_index import DONE, REMOVED, UPDATED, WorkspaceIndex
+
+# 스캔 결과를 트리에 반영하는 주기(ms)와 한 번에 반영하는 최대 항목 수
+WORKSPACE_POLL_MS = 50
+WORKSPACE_INSERT_BATCH = 500
+# 섹션 열에 이름을 보여 줄 최대 섹션 수
+SECTION_PREVIEW = 4
+
+
+def _section_text(entry):
+    if entry.error:
+        return entry.error
+    # 키가 없는 암묵적인 DEFAULT 섹션은 보여 주지 않는다
+    names = [name for name in entry.sections if name != "DEFAULT"]
+    text = ", ".join(names[:SECTION_PREVIEW])
+    if len(names) > SECTION_PREVIEW:
+        text += f", … ({len(names)})"
+    return text
+
+
+class WorkspacePanel(ttk.Frame):
+    """File tree of a workspace folder that fills in while it is scanned.
+
+    The folder is indexed by ``workspace_index.WorkspaceIndex`` on a
+    background thread; the panel drains its results every WORKSPACE_POLL_MS
+    and inserts at most WORKSPACE_INSERT_BATCH rows per tick.  Activating a
+    file (double-click or Return) calls ``manager.open_workspace_file``, so
+    tabs are only created for the files that are actually opened.
+    """
+
+    def __init__(self, master, manager, root):
+        super().__init__(master)
+        self.manager = manager
+        self.index = WorkspaceIndex(root)
+        self._poll_id = None
+
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, side=tk.TOP)
+        ttk.Label(bar, text=os.path.basename(self.index.root) or self.index.root).pack(
+            side=tk.LEFT, padx=4
+        )
+        ttk.Button(bar, text="Rescan", command=self.rescan).pack(side=tk.RIGHT)
+        self.status_label = ttk.Label(self, text="", anchor=tk.W)
+        self.status_label.pack(fill=tk.X, side=tk.BOTTOM, padx=4)
+
+        self.tree = ttk.Treeview(self, columns=("keys", "sections"), selectmode="browse")
+        self.tree.heading("#0", text="File")
+        self.tree.heading("keys", text="Keys")
+        self.tree.heading("sections", text="Sections")
+        self.tree.column("#0", width=220)
+        self.tree.column("keys", width=60, anchor=tk.E, stretch=False)
+        self.tree.column("sections", width=200)
+        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind("<Double-1>", self._on_activate)
+        self.tree.bind("<Return>", self._on_activate)
+
+        self.rescan()
+
+    @property
+    def root(self):
+        return self.index.root
+
+    def rescan(self):
+        """Scan the folder again; only files whose stat changed are re-read."""
+        if not self.index.start_scan():
+            return False
+        self.status_label.config(text=f"Scanning… {len(self.index.entries)} files")
+        if self._poll_id is None:
+            self._poll_id = self.after(WORKSPACE_POLL_MS, self._poll_scan)
+        return True
+
+    def _poll_scan(self):
+        self._poll_id = None
+        self.apply_updates(self.index.drain(WORKSPACE_INSERT_BATCH))
+        if self.index.busy:
+            self._poll_id = self.after(WORKSPACE_POLL_MS, self._poll_scan)
+
+    def apply_updates(self, updates):
+        """Reflect ``WorkspaceIndex.drain`` results in the tree."""
+        for kind, value in updates:
+            if kind == UPDATED:
+                self._show_entry(value)
+            elif kind == REMOVED:
+                self._remove_path(value)
+            elif kind == DONE:
+                self._show_summary(value)
+        if self.index.busy:
+            self.status_label.config(text=f"Scanning… {len(self.index.entries)} files")
+
+    def _directory_node(self, directory):
+        if directory == self.root:
+            return ""
+        if not self.tree.exists(directory):
+            parent = self._directory_node(os.path.dirname(directory))
+            self.tree.insert(
+                parent, "end", iid=directory, text=os.path.basename(directory), open=False
+            )
+        return directory
+
+    def _show_entry(self, entry):
+        values = ("" if entry.key_count is None else entry.key_count, _section_text(entry))
+        if self.tree.exists(entry.path):
+            self.tree.item(entry.path, values=values)
+            return
+        parent = self._directory_node(os.path.dirname(entry.path))
+        self.tree.insert(
+            parent, "end", iid=entry.path, text=os.path.basename(entry.path), values=values
+        )
+
+    def _remove_path(self, path):
+        if not self.tree.exists(path):
+            return
+        parent = self.tree.parent(path)
+        self.tree.delete(path)
+        # 비게 된 상위 디렉터리 노드도 지운다
+        while parent and not self.tree.get_children(parent):
+            grandparent = self.tree.parent(parent)
+            self.tree.delete(parent)
+            parent = grandparent
+
+    def _show_summary(self, stats):
+        if stats is None:
+            self.status_label.config(text="Scan failed; see the log.")
+            return
+        keys = sum(entry.key_count or 0 for entry in self.index.entries.values())
+        self.status_label.config(
+            text=f"{stats['files']} files, {keys} keys "
+            f"({stats['parsed']} read in {stats['seconds']:.2f} s)"
+        )
+
+    def _on_activate(self, event=None):
+        path = self.tree.focus()
+        if path not in self.index.entries:
+            # 디렉터리는 기본 동작대로 펼치거나 접는다
+            return None
+        self.manager.open_workspace_file(path)
+        return "break"
+
+    def destroy(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.index.close()
+        super().destroy()
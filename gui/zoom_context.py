@@ -0,0 +1,50 @@
+from tkinter import font as tkfont
+
+# 줌 배율 범위
+MIN_ZOOM = 0.5
+MAX_ZOOM = 3.0
+
+
+class ZoomContext:
+    """Fonts and cell metrics shared by every tab of one window.
+
+    Changing the zoom reconfigures the three named fonts once; Tk updates
+    every widget that uses them.  ``generation`` increases on each change so
+    a tab can tell whether its layout still matches the current metrics and
+    relayout lazily the next time it is shown.
+    """
+
+    base_cell_width = int(120 * 0.85)
+    base_header_font_size = 9
+    base_param_font_size = 10
+
+    def __init__(self, zoom=1.0):
+        self.zoom = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+        self.generation = 0
+        self.header_font = tkfont.Font(
+            family="Arial", size=self.base_header_font_size, weight="bold"
+        )
+        self.param_font = tkfont.Font(
+            family="Arial", size=self.base_param_font_size, weight="bold"
+        )
+        self.button_font = tkfont.Font(
+            family="Arial", size=self.base_param_font_size, weight="bold"
+        )
+        self.cell_width = self.base_cell_width
+        self._apply()
+
+    def _apply(self):
+        self.cell_width = int(self.base_cell_width * self.zoom)
+        self.header_font.config(size=int(self.base_header_font_size * self.zoom))
+        self.param_font.config(size=int(self.base_param_font_size * self.zoom))
+        self.button_font.config(size=int(self.base_param_font_size * self.zoom))
+
+    def set_zoom(self, value):
+        """Clamp and apply ``value``; returns ``True`` if the zoom changed."""
+        value = max(MIN_ZOOM, min(MAX_ZOOM, value))
+        if value == self.zoom:
+            return False
+        self.zoom = value
+        self.generation += 1
+        self._apply()
+        return True
@@ -0,0 +1,180 @@
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from fnmatch import fnmatchcase
+
+from bulk_edit import bulk_edit_file, count_changes, plan_bulk_edit
+from config_io import load_parameters
+
+OPERATIONS = ("get", "set", "toggle", "query", "dump")
+# 작업자 하나에 한 번에 넘기는 파일 묶음 수를 정할 때 작업자당 묶음 개수
+CHUNKS_PER_WORKER = 8
+
+
+def expand_paths(patterns):
+    """glob 패턴(``**`` 포함)을 파일 경로 목록으로 펼칩니다 (중복 제거, 순서 유지)."""
+    seen = set()
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches and os.path.exists(pattern):
+            matches = [pattern]
+        for path in matches:
+            if os.path.isfile(path) and path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def _get(path, options):
+    sections = load_parameters(path, compact=True)
+    params = sections.get(options["section"])
+    value = None if params is None else params.get(options["key"])
+    return {"section": options["section"], "key": options["key"], "value": value}
+
+
+def _query(path, options):
+    sections = load_parameters(path, compact=True)
+    matches = []
+    value_pattern = options.get("value")
+    for section, params in sections.items():
+        if not fnmatchcase(section, options["section"]):
+            continue
+        for key, value in params.items():
+            if not fnmatchcase(key, options["key"]):
+                continue
+            if value_pattern is not None and not fnmatchcase(value, value_pattern):
+                continue
+            matches.append({"section": section, "key": key, "value": value})
+    return {"matches": matches}
+
+
+def _edit(path, options, flip):
+    if options.get("dry_run"):
+        sections = load_parameters(path, compact=True)
+        changes = plan_bulk_edit(
+            sections, options["key"], options.get("value"), options["section"], flip
+        )
+        return {"changed": count_changes(changes), "written": False}
+    changed = bulk_edit_file(
+        path, options["key"], options.get("value"), options["section"], flip
+    )
+    return {"changed": changed, "written": bool(changed)}
+
+
+def _dump(path, options):
+    sections = load_parameters(path, compact=True)
+    return {"sections": {name: dict(params.items()) for name, params in sections.items()}}
+
+
+def process_file(task):
+    """작업자 프로세스에서 파일 하나를 처리하고 결과 딕셔너리를 반환합니다."""
+    operation, path, options = task
+    try:
+        if operation == "get":
+            result = _get(path, options)
+        elif operation == "query":
+            result = _query(path, options)
+        elif operation == "set":
+            result = _edit(path, options, flip=False)
+        elif operation == "toggle":
+            result = _edit(path, options, flip=True)
+        elif operation == "dump":
+            result = _dump(path, options)
+        else:
+            raise ValueError(f"unknown operation {operation!r}")
+    except Exception as e:  # 한 파일의 실패는 결과로 보고하고 계속 진행
+        return {"file": path, "error": f"{type(e).__name__}: {e}"}
+    return {"file": path, **result}
+
+
+def run(operation, paths, options, jobs=None, out=None):
+    """``paths`` 를 처리하며 결과를 JSON 줄로 ``out`` 에 쓰고 요약을 반환합니다.
+
+    ``jobs`` 가 1 이면 현재 프로세스에서, 아니면 그 수(기본값 CPU 수)의
+    프로세스 풀에서 순서와 관계없이 끝나는 대로 결과를 씁니다.
+    """
+    out = sys.stdout if out is None else out
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [(operation, path, options) for path in paths]
+    summary = {"files": 0, "changed_files": 0, "errors": 0}
+    started = time.perf_counter()
+
+    def emit(result):
+        summary["files"] += 1
+        if "error" in result:
+            summary["errors"] += 1
+        elif result.get("written"):
+            summary["changed_files"] += 1
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    if jobs == 1 or len(tasks) < 2:
+        for task in tasks:
+            emit(process_file(task))
+    else:
+        chunksize = max(1, len(tasks) // (jobs * CHUNKS_PER_WORKER))
+        with multiprocessing.Pool(min(jobs, len(tasks))) as pool:
+            for result in pool.imap_unordered(process_file, tasks, chunksize):
+                emit(result)
+    out.flush()
+    elapsed = time.perf_counter() - started
+    summary["seconds"] = round(elapsed, 6)
+    summary["files_per_second"] = round(summary["files"] / elapsed, 1) if elapsed else None
+    return summary
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Query and edit many INI files without the GUI (JSON lines output)."
+    )
+    parser.add_argument("operation", choices=OPERATIONS)
+    parser.add_argument("paths", nargs="+", help="files or glob patterns (** allowed)")
+    parser.add_argument(
+        "--section",
+        help="section name; a glob pattern for set/toggle/query (default: * , DEFAULT for get)",
+    )
+    parser.add_argument("--key", help="key name; a glob pattern for set/toggle/query")
+    parser.add_argument("--value", help="new value for set; a glob filter for query")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report what set/toggle would change"
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.operation in ("get", "set", "toggle") and not args.key:
+        parser.error(f"{args.operation} requires --key")
+    if args.operation == "set" and args.value is None:
+        parser.error("set requires --value")
+    default_section = "DEFAULT" if args.operation == "get" else "*"
+    options = {
+        "section": args.section or default_section,
+        "key": args.key or "*",
+        "value": args.value,
+        "dry_run": args.dry_run,
+    }
+    paths = expand_paths(args.paths)
+    if not paths:
+        print("no files matched", file=sys.stderr)
+        return 2
+    try:
+        summary = run(args.operation, paths, options, jobs=args.jobs)
+    except BrokenPipeError:
+        # 출력을 읽던 쪽(head 등)이 먼저 끝났다
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    print(json.dumps({"summary": summary}), file=sys.stderr)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
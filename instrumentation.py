@@ -0,0 +1,171 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# 이 환경 변수가 "1" 이면 시작할 때부터 측정
+TRACE_ENV_VAR = "INI_EDITOR_TRACE"
+# 보관하는 최대 구간 수 (오래된 것부터 버림)
+MAX_EVENTS = 100000
+# p50/p99 를 계산할 때 쓰는 최근 구간 수 (탭·이름별)
+ROLLING_WINDOW = 200
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(
+            self.name, self.category, self.start, time.perf_counter_ns(), self.args
+        )
+        return False
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Tracer:
+    """이름 붙은 시간 구간을 기록하고 통계와 Chrome trace 를 만드는 측정기.
+
+    꺼져 있을 때 ``span()`` 은 아무 일도 하지 않는 공용 객체를 돌려주므로
+    측정 지점을 코드에 남겨 두어도 비용이 거의 없습니다. 여러 스레드(저장,
+    로더)에서 동시에 기록해도 됩니다.
+    """
+
+    def __init__(self, enabled=False, max_events=MAX_EVENTS, window=ROLLING_WINDOW):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=max_events)
+        self._recent = {}
+        self._window = window
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name, category=None, **args):
+        """``with tracer.span("parse", "a.ini"):`` 형태로 구간을 기록합니다."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def record(self, name, start, end, category=None, **args):
+        """이미 끝난 구간을 ``perf_counter_ns`` 기준 시각으로 기록합니다."""
+        if self.enabled:
+            self._record(name, category, start, end, args)
+
+    def _record(self, name, category, start, end, args):
+        duration = end - start
+        with self._lock:
+            self._events.append(
+                (name, category, start, duration, threading.get_ident(), args)
+            )
+            recent = self._recent.get((category, name))
+            if recent is None:
+                recent = self._recent[(category, name)] = deque(maxlen=self._window)
+            recent.append(duration)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._recent.clear()
+
+    def summary(self, category=None):
+        """``{이름: (개수, p50_ms, p99_ms)}`` 를 반환합니다.
+
+        ``category`` 를 주면 그 분류(보통 파일의 절대 경로)의 구간만 집계합니다.
+        """
+        with self._lock:
+            items = [
+                (name, list(durations))
+                for (cat, name), durations in self._recent.items()
+                if category is None or cat == category
+            ]
+        merged = {}
+        for name, durations in items:
+            merged.setdefault(name, []).extend(durations)
+        result = {}
+        for name, durations in merged.items():
+            durations.sort()
+            result[name] = (
+                len(durations),
+                _percentile(durations, 0.50) / 1e6,
+                _percentile(durations, 0.99) / 1e6,
+            )
+        return result
+
+    def chrome_trace(self):
+        """Chrome trace event 형식(``chrome://tracing``, Perfetto)의 딕셔너리."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        trace_events = []
+        for name, category, start, duration, tid, args in events:
+            event = {
+                "name": name,
+                "cat": category or "app",
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """기록된 구간을 Chrome trace JSON 파일로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+# 프로그램 전체가 공유하는 측정기
+tracer = Tracer(enabled=os.environ.get(TRACE_ENV_VAR) == "1")
+
+
+def trace_category(path):
+    """파일 경로를 구간 분류 이름(절대 경로)으로 바꿉니다.
+
+    파일 이름만 쓰면 다른 폴더의 같은 이름 파일(prod/app.ini, staging/app.ini)
+    구간이 한 분류로 합쳐집니다.
+    """
+    return os.path.abspath(path) if path else None
+
+
+def traced(name):
+    """``file_path`` 속성을 가진 객체의 메서드를 ``name`` 구간으로 기록합니다."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not tracer.enabled:
+                return func(self, *args, **kwargs)
+            with tracer.span(name, trace_category(getattr(self, "file_path", None))):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorate
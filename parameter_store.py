@@ -0,0 +1,180 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+
+# 이 길이 이하의 값만 문자열 풀에서 공유 ("0"/"1", "true" 같은 반복 값)
+INTERN_VALUE_MAX_LEN = 16
+
+
+class SectionStore(MutableMapping):
+    """키와 값을 병렬 리스트로 보관하는 순서 있는 섹션 매핑.
+
+    불러올 때 키와 짧은 값은 파일 단위 문자열 풀로 공유합니다. 키 조회용
+    인덱스는 ``OrderedDict`` 의 해시 테이블과 연결 리스트 대신 정렬된 키
+    리스트와 위치 배열(``array('I')``)로 만들며, 처음 조회할 때 생성합니다.
+    같은 구조(키 순서)인지는 키 리스트 비교만으로 확인할 수 있습니다.
+    """
+
+    __slots__ = ("_keys", "_values", "_sorted", "_positions")
+
+    def __init__(self, items=()):
+        self._keys = []
+        self._values = []
+        self._sorted = None
+        self._positions = None
+        if isinstance(items, Mapping):
+            items = items.items()
+        for key, value in items:
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, params, pool=None):
+        """중복이 정리된 ``dict`` 에서 인덱스 없이 바로 만듭니다.
+
+        ``pool`` 딕셔너리를 넘기면 같은 문자열을 한 객체로 공유합니다.
+        ``sys.intern`` 과 달리 불러오기가 끝나면 풀과 함께 해제됩니다.
+        """
+        store = cls.__new__(cls)
+        if pool is None:
+            store._keys = list(params)
+            store._values = list(params.values())
+        else:
+            share = pool.setdefault
+            store._keys = [share(key, key) for key in params]
+            store._values = [
+                share(value, value) if len(value) <= INTERN_VALUE_MAX_LEN else value
+                for value in params.values()
+            ]
+        store._sorted = None
+        store._positions = None
+        return store
+
+    @classmethod
+    def from_lists(cls, keys, values):
+        """중복 없는 키 리스트와 같은 길이의 값 리스트를 그대로 넘겨받습니다."""
+        store = cls.__new__(cls)
+        store._keys = keys
+        store._values = values
+        store._sorted = None
+        store._positions = None
+        return store
+
+    def lists(self):
+        """내부 ``(키 리스트, 값 리스트)`` 를 복사 없이 반환합니다 (수정 금지)."""
+        return self._keys, self._values
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    def _position(self, key):
+        if self._sorted is None:
+            order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+            self._sorted = [self._keys[i] for i in order]
+            self._positions = array("I", order)
+        index = bisect_left(self._sorted, key)
+        if index < len(self._sorted) and self._sorted[index] == key:
+            return self._positions[index]
+        return -1
+
+    def _drop_index(self):
+        self._sorted = None
+        self._positions = None
+
+    # ------------------------------------------------------------------
+    # 매핑 인터페이스
+    def __getitem__(self, key):
+        position = self._position(key)
+        if position < 0:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __setitem__(self, key, value):
+        position = self._position(key)
+        if position >= 0:
+            self._values[position] = value
+            return
+        index = bisect_left(self._sorted, key)
+        self._sorted.insert(index, key)
+        self._positions.insert(index, len(self._keys))
+        self._keys.append(key)
+        self._values.append(value)
+
+    def __delitem__(self, key):
+        position = self._position(key)
+        if position < 0:
+            raise KeyError(key)
+        del self._keys[position]
+        del self._values[position]
+        self._drop_index()
+
+    def __contains__(self, key):
+        return self._position(key) >= 0
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        return list(self._values)
+
+    def items(self):
+        return list(zip(self._keys, self._values))
+
+    def __eq__(self, other):
+        if isinstance(other, SectionStore):
+            return self._keys == other._keys and self._values == other._values
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SectionStore({self.items()!r})"
+
+    def copy(self):
+        """키/값 리스트를 복사한 새 섹션을 만듭니다 (문자열은 공유)."""
+        clone = SectionStore.__new__(SectionStore)
+        clone._keys = list(self._keys)
+        clone._values = list(self._values)
+        clone._sorted = None
+        clone._positions = None
+        return clone
+
+    # ------------------------------------------------------------------
+    # 구조 비교
+    def same_structure(self, other):
+        """키와 그 순서가 같은지 확인합니다."""
+        if isinstance(other, SectionStore):
+            return self._keys == other._keys
+        return self._keys == list(other.keys())
+
+    def changed_keys(self, other):
+        """구조가 같은 ``other`` 와 값이 다른 키 목록을 반환합니다."""
+        if isinstance(other, SectionStore):
+            other_values = other._values
+        else:
+            other_values = [other[key] for key in self._keys]
+        return [
+            key
+            for key, mine, theirs in zip(self._keys, self._values, other_values)
+            if mine is not theirs and mine != theirs
+        ]
+
+
+class ParameterStore(OrderedDict):
+    """섹션 이름에서 :class:`SectionStore` 로 가는 순서 있는 매핑."""
+
+    def same_structure(self, other):
+        """섹션 순서와 각 섹션의 키 순서가 모두 같은지 확인합니다."""
+        if list(self.keys()) != list(other.keys()):
+            return False
+        for name, section in self.items():
+            if not section.same_structure(other[name]):
+                return False
+        return True
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+import threading
+
+from config_io import compute_file_hash, stat_signature
+from parameter_store import ParameterStore, SectionStore
+
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 형식이 바뀌면 올려서 이전 항목을 무효화
+CACHE_FORMAT_VERSION = 1
+# 캐시 디렉터리 전체 크기 상한 (넘으면 가장 오래 쓰지 않은 항목부터 삭제)
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+_SUFFIX = ".cache"
+
+
+class ParseCache:
+    """파싱한 파라미터 모델을 디스크에 보관하는 캐시.
+
+    항목은 파일 경로별로 하나씩 ``marshal`` 형식으로 저장되며 stat 서명
+    ``(mtime_ns, size, inode)`` 과 내용 해시를 함께 기록합니다. 서명이 같으면
+    파일을 읽지 않고 바로 사용하고, 서명만 다르면 해시를 계산해 내용이 같을
+    때 파싱을 건너뜁니다. 전체 크기가 ``max_bytes`` 를 넘으면 마지막 사용
+    시각(항목 파일의 mtime) 기준 LRU 로 정리합니다.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _entry_path(self, path):
+        key = hashlib.sha1(os.fsencode(os.path.abspath(path))).hexdigest()
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _read_entry(self, entry_path):
+        try:
+            with open(entry_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            entry = marshal.loads(data)
+            version, path, signature, file_hash, sections = entry
+        except (EOFError, ValueError, TypeError) as e:
+            logger.warning("Discarding corrupt cache entry %s: %s", entry_path, e)
+            self._discard(entry_path)
+            return None
+        if version != CACHE_FORMAT_VERSION:
+            return None
+        return path, signature, file_hash, sections
+
+    def _discard(self, entry_path):
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+    def load(self, path, parse):
+        """``(file_hash, sections)`` 를 캐시에서 찾거나 ``parse(path)`` 로 만듭니다.
+
+        ``parse`` 가 :class:`parameter_store.ParameterStore` 를 반환한 경우에만
+        결과를 캐시에 기록합니다.
+        """
+        signature = stat_signature(path)
+        entry_path = self._entry_path(path)
+        entry = self._read_entry(entry_path) if signature is not None else None
+        file_hash = None
+        if entry is not None and entry[0] == os.path.abspath(path):
+            _path, cached_signature, cached_hash, rows = entry
+            if tuple(cached_signature) == signature:
+                self._touch(entry_path)
+                return cached_hash, _to_store(rows)
+            file_hash = compute_file_hash(path)
+            if file_hash == cached_hash and stat_signature(path) == signature:
+                # 내용은 같고 stat 정보만 바뀜 (touch, 복사 등)
+                self._write(entry_path, path, signature, file_hash, rows)
+                return file_hash, _to_store(rows)
+        if file_hash is None:
+            file_hash = compute_file_hash(path)
+        sections = parse(path)
+        if isinstance(sections, ParameterStore) and stat_signature(path) == signature:
+            # 읽는 동안 파일이 바뀌지 않은 경우에만 기록
+            self.store(path, signature, file_hash, sections)
+        return file_hash, sections
+
+    def store(self, path, signature, file_hash, sections):
+        """``signature`` 시점의 ``path`` 를 파싱한 ``sections`` 를 기록합니다."""
+        rows = [(name, *params.lists()) for name, params in sections.items()]
+        self._write(self._entry_path(path), path, signature, file_hash, rows)
+
+    def _write(self, entry_path, path, signature, file_hash, rows):
+        try:
+            data = marshal.dumps(
+                (CACHE_FORMAT_VERSION, os.path.abspath(path), signature, file_hash, rows)
+            )
+        except ValueError as e:
+            logger.warning("Cannot cache %s: %s", path, e)
+            return
+        if len(data) > self.max_bytes // 4:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                self._discard(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write cache entry for %s: %s", path, e)
+            return
+        self._evict()
+
+    def _touch(self, entry_path):
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            try:
+                for item in os.scandir(self.directory):
+                    if not item.name.endswith(_SUFFIX):
+                        continue
+                    try:
+                        st = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, item.path))
+            except OSError:
+                return
+            total = sum(size for _mtime, size, _path in entries)
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for _mtime, size, entry_path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._discard(entry_path)
+                total -= size
+
+
+def _to_store(rows):
+    return ParameterStore(
+        (name, SectionStore.from_lists(keys, values)) for name, keys, values in rows
+    )
@@ -0,0 +1,78 @@
+# 키와 값 사이의 구분자 (검색어에 들어갈 수 없어 경계를 넘는 일치가 없다)
+_SEP = "\x00"
+
+
+class _SectionText:
+    """한 섹션의 검색용 소문자 문자열."""
+
+    __slots__ = ("keys", "texts", "blob")
+
+    def __init__(self, params):
+        self.keys = list(params.keys())
+        self.texts = [
+            key.lower() + _SEP + value.lower() for key, value in params.items()
+        ]
+        # 섹션 전체를 이은 문자열: 일치하는 항목이 없는 섹션을 한 번에 건너뛴다
+        self.blob = "\n".join(self.texts)
+
+
+class SearchIndex:
+    """탭 모델의 키와 값을 대소문자 구분 없이 부분 문자열로 찾는 색인.
+
+    섹션마다 ``"키\\0값"`` 을 소문자로 바꾼 목록과 그것을 이은 문자열을
+    만들어 둡니다. 검색은 먼저 섹션 문자열에서 검색어를 찾아(C 수준 비교)
+    일치가 없는 섹션을 건너뛰고, 남은 섹션에서만 항목을 확인합니다. 값이
+    바뀌면 그 섹션만 무효화되고 다음 검색 때 다시 만들어집니다.
+    """
+
+    def __init__(self, sections):
+        self.sections = sections
+        self._texts = {}
+
+    def set_sections(self, sections, changed=None):
+        """모델을 ``sections`` 로 바꿉니다.
+
+        ``changed`` 에는 내용이 달라진 섹션 이름을 줍니다(예:
+        :func:`config_io.diff_parameters` 의 ``sections``). 없어진 섹션과
+        ``changed`` 의 섹션만 다시 만들고, ``None`` 이면 모두 다시 만듭니다.
+        """
+        self.sections = sections
+        if changed is None:
+            self._texts.clear()
+            return
+        for section in list(self._texts):
+            if section in changed or section not in sections:
+                del self._texts[section]
+
+    def invalidate(self, section):
+        """``section`` 의 키나 값이 바뀌었음을 알립니다."""
+        self._texts.pop(section, None)
+
+    def build(self):
+        """아직 만들지 않은 섹션을 모두 만들어 첫 검색을 빠르게 합니다."""
+        for section, params in self.sections.items():
+            if section not in self._texts:
+                self._texts[section] = _SectionText(params)
+
+    def search(self, query):
+        """``{섹션: [일치하는 키, ...]}`` 를 모델 순서대로 반환합니다.
+
+        빈 검색어는 ``None`` (필터 없음)을 반환합니다.
+        """
+        query = query.lower()
+        if not query:
+            return None
+        matches = {}
+        cache = self._texts
+        for section, params in self.sections.items():
+            text = cache.get(section)
+            if text is None:
+                text = cache[section] = _SectionText(params)
+            if query not in text.blob:
+                continue
+            keys = [
+                key for key, entry in zip(text.keys, text.texts) if query in entry
+            ]
+            if keys:
+                matches[section] = keys
+        return matches
@@ -0,0 +1,228 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+from instrumentation import trace_category, tracer
+
+logger = logging.getLogger(__name__)
+
+# 메인 루프의 심장 박동 간격(ms)
+HEARTBEAT_MS = 100
+# 박동이 이 시간(초) 이상 늦으면 멈춤으로 보고 스택을 기록
+STALL_THRESHOLD_S = 0.5
+# 스택에서 보여 줄 최대 프레임 수 (안쪽부터)
+STACK_LIMIT = 30
+
+
+def _is_tkinter(filename):
+    return os.path.basename(os.path.dirname(filename)) == "tkinter"
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def stack_frames(frame):
+    """``frame`` 과 그 호출자들을 바깥쪽부터의 목록으로 반환합니다."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def callback_name(frames):
+    """Tk 가 호출한 콜백(tkinter 프레임 바로 다음의 프레임) 이름을 반환합니다.
+
+    tkinter 프레임이 없으면(메인 루프 밖) 가장 바깥 프레임을 씁니다.
+    """
+    seen_tk = False
+    for frame in frames:
+        if _is_tkinter(frame.f_code.co_filename):
+            seen_tk = True
+        elif seen_tk:
+            return _frame_name(frame)
+    return _frame_name(frames[0]) if frames else "unknown"
+
+
+def format_context(context):
+    """``{"tab": 경로, "size": 바이트}`` 문맥을 로그용 문자열로 바꿉니다."""
+    if not context:
+        return ""
+    text = context.get("tab") or "no tab"
+    size = context.get("size")
+    if size is not None:
+        text += f", {size / 1024:.0f} KiB"
+    return f" [{text}]"
+
+
+def format_frames(frames, limit=STACK_LIMIT):
+    """스택을 traceback 형식으로 씁니다. 너무 깊으면 가장 안쪽 ``limit`` 개만."""
+    return "".join(
+        f'  File "{frame.f_code.co_filename}", line {frame.f_lineno}, in '
+        f"{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}\n"
+        for frame in frames[-limit:]
+    )
+
+
+class StallWatchdog:
+    """Tk 메인 루프의 응답성을 심장 박동 ``after()`` 와 감시 스레드로 확인합니다.
+
+    메인 스레드는 ``schedule(ms, callback)`` (보통 ``root.after``)로 박동
+    시각을 갱신하고, 감시 스레드는 박동이 ``threshold`` 초 넘게 늦으면 그
+    순간 메인 스레드의 파이썬 스택을 잡아 Tk 가 호출한 콜백과 함께 기록합니다.
+    ``context()`` 는 감시 스레드에서 불리므로 Tk 를 호출하지 않고 현재 탭의
+    ``{"tab": 경로, "size": 바이트}`` 같은 값만 돌려줘야 합니다. 멈춤이
+    끝나면 지속 시간을 콜백별로 집계하며, 측정기(:mod:`instrumentation`)가
+    켜져 있으면 ``stall`` 구간으로도 남깁니다.
+    """
+
+    def __init__(
+        self,
+        schedule,
+        threshold=STALL_THRESHOLD_S,
+        interval_ms=HEARTBEAT_MS,
+        context=None,
+    ):
+        self._schedule = schedule
+        self.threshold = threshold
+        self.interval = interval_ms / 1000
+        self._context = context
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._main_ident = None
+        self._last_beat = None
+        # 진행 중인 멈춤의 (콜백, 문맥): 감시 스레드가 스택을 잡은 뒤 박동이
+        # 다시 올 때까지 남아 있다
+        self._stall = None
+        # 끝난 멈춤 목록: (콜백, 지속 시간 초, 문맥)
+        self.stalls = []
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """현재 스레드(Tk 메인 스레드)를 감시하기 시작합니다."""
+        if self._thread is not None:
+            return
+        self._main_ident = threading.get_ident()
+        self._stop.clear()
+        self._last_beat = time.perf_counter()
+        self._schedule(int(self.interval * 1000), self._beat)
+        self._thread = threading.Thread(
+            target=self._monitor, name="ini-stall-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """감시 스레드를 멈춥니다. 이미 예약된 박동은 아무 일도 하지 않습니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self):
+        if self._stop.is_set():
+            return
+        now = time.perf_counter()
+        with self._lock:
+            previous = self._last_beat
+            self._last_beat = now
+            stall, self._stall = self._stall, None
+        if stall is not None:
+            self._finish(stall, previous, now)
+        self._schedule(int(self.interval * 1000), self._beat)
+
+    def _finish(self, stall, previous, now):
+        callback, context = stall
+        # 박동 간격만큼은 원래 기다리는 시간이다
+        duration = max(0.0, now - previous - self.interval)
+        self.stalls.append((callback, duration, context))
+        logger.warning(
+            "UI stalled for %.2f s in %s%s", duration, callback, format_context(context)
+        )
+        tracer.record(
+            "stall",
+            int((previous + self.interval) * 1e9),
+            int(now * 1e9),
+            trace_category((context or {}).get("tab")),
+            callback=callback,
+        )
+
+    def _monitor(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                late = time.perf_counter() - self._last_beat
+                pending = self._stall is not None
+            if late - self.interval < self.threshold or pending:
+                continue
+            self._capture(late)
+
+    def _capture(self, late):
+        frame = sys._current_frames().get(self._main_ident)
+        frames = stack_frames(frame) if frame is not None else []
+        callback = callback_name(frames)
+        stack = format_frames(frames)
+        # 프레임(과 그 지역 변수)을 붙잡아 두지 않는다
+        del frame, frames
+        context = None
+        if self._context is not None:
+            try:
+                context = self._context()
+            except Exception as e:  # 문맥을 못 구해도 스택은 남긴다
+                logger.debug("Stall context unavailable: %s", e)
+        with self._lock:
+            self._stall = (callback, context)
+        logger.warning(
+            "UI thread blocked for %.2f s in %s%s; stack:\n%s",
+            late - self.interval,
+            callback,
+            format_context(context),
+            stack,
+        )
+
+    def summary(self):
+        """``{"stalls", "total_s", "max_s", "by_callback": {콜백: (횟수, 합계 초)}}``."""
+        by_callback = {}
+        for callback, duration, _context in self.stalls:
+            count, total = by_callback.get(callback, (0, 0.0))
+            by_callback[callback] = (count + 1, total + duration)
+        durations = [duration for _callback, duration, _context in self.stalls]
+        return {
+            "stalls": len(durations),
+            "total_s": sum(durations),
+            "max_s": max(durations, default=0.0),
+            "by_callback": by_callback,
+        }
+
+    def log_summary(self):
+        """멈춤 횟수와 시간을 콜백별로 로그에 남기고 요약을 반환합니다.
+
+        로깅을 설정하지 않고 실행해도 종료 보고가 보이도록 멈춤이 없을 때도
+        WARNING 으로 남깁니다.
+        """
+        summary = self.summary()
+        if not summary["stalls"]:
+            logger.warning("No UI stalls over %.2f s", self.threshold)
+            return summary
+        lines = [
+            f"  {callback}: {count} stall(s), {total:.2f} s"
+            for callback, (count, total) in sorted(
+                summary["by_callback"].items(), key=lambda item: -item[1][1]
+            )
+        ]
+        logger.warning(
+            "UI stalls: %d, total %.2f s, longest %.2f s\n%s",
+            summary["stalls"],
+            summary["total_s"],
+            summary["max_s"],
+            "\n".join(lines),
+        )
+        return summary
@@ -0,0 +1,79 @@
+import threading
+
+from async_writer import AsyncWriter
+from config_io import (
+    compute_file_hash,
+    load_parameters,
+    snapshot_parameters,
+    stat_signature,
+)
+
+
+def test_submit_writes_and_reports_hash(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\nkey=1\n")
+    sections = load_parameters(str(ini))
+    sections["S"]["key"] = "0"
+    results = []
+    writer = AsyncWriter()
+    before = stat_signature(str(ini))
+    writer.submit(
+        str(ini), snapshot_parameters(sections), lambda *result: results.append(result)
+    )
+    assert writer.flush(timeout=5)
+    assert writer.drain() == 1
+    assert results == [(compute_file_hash(str(ini)), None, stat_signature(str(ini)), before)]
+    assert load_parameters(str(ini))["S"]["key"] == "0"
+    writer.close()
+
+
+def test_pending_requests_for_same_file_are_coalesced(tmp_path):
+    ini = tmp_path / "a.ini"
+    gate = threading.Event()
+    calls = []
+
+    def slow_save(path, sections, changed):
+        gate.wait(5)
+        calls.append((path, dict(sections)))
+        return "hash", None, None
+
+    writer = AsyncWriter(save_func=slow_save)
+    writer.submit("other.ini", {"n": 0})
+    for n in range(1, 4):
+        writer.submit(str(ini), {"n": n}, lambda h, e, s, p: calls.append(h))
+    gate.set()
+    writer.close()
+    # other.ini 다음에 마지막 스냅샷 한 번만 저장되고 콜백은 모두 호출된다
+    assert calls[:2] == [("other.ini", {"n": 0}), (str(ini), {"n": 3})]
+    assert calls[2:] == ["hash", "hash", "hash"]
+
+
+def test_save_error_is_passed_to_callback(tmp_path):
+    def failing_save(path, sections, changed):
+        raise OSError("disk full")
+
+    results = []
+    writer = AsyncWriter(save_func=failing_save)
+    writer.submit(str(tmp_path / "a.ini"), {}, lambda h, e, s, p: results.append((h, str(e))))
+    writer.close()
+    assert results == [(None, "disk full")]
+
+
+def test_change_hints_are_merged():
+    seen = []
+    gate = threading.Event()
+
+    def record(path, sections, changed):
+        gate.wait(5)
+        seen.append((path, changed))
+        return None, None, None
+
+    writer = AsyncWriter(save_func=record)
+    writer.submit("busy.ini", {})
+    writer.submit("a.ini", {}, changed={"S": {"a"}})
+    writer.submit("a.ini", {}, changed={"S": {"b"}, "T": {"c"}})
+    writer.submit("b.ini", {}, changed={"S": {"a"}})
+    writer.submit("b.ini", {}, changed=None)
+    gate.set()
+    writer.close()
+    assert seen[1:] == [("a.ini", {"S": {"a", "b"}, "T": {"c"}}), ("b.ini", None)]
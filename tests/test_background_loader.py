@@ -0,0 +1,47 @@
+import threading
+import time
+
+from background_loader import BackgroundLoader
+
+
+def _wait_idle(loader):
+    while loader.busy:
+        if not loader.drain():
+            time.sleep(0.01)
+
+
+def test_results_are_delivered_by_drain():
+    results = []
+    loader = BackgroundLoader(max_workers=2)
+    loader.submit(lambda a, b: a + b, lambda r, e: results.append((r, e)), 1, 2)
+    _wait_idle(loader)
+    assert results == [(3, None)]
+    loader.close()
+
+
+def test_slow_job_does_not_block_others():
+    gate = threading.Event()
+    results = []
+    loader = BackgroundLoader(max_workers=2)
+    loader.submit(gate.wait, lambda r, e: results.append("slow"), 5)
+    loader.submit(str, lambda r, e: results.append(r), "fast")
+    while not results:
+        loader.drain()
+        gate.wait(0.01)
+    assert results == ["fast"]
+    gate.set()
+    _wait_idle(loader)
+    assert results == ["fast", "slow"]
+    loader.close()
+
+
+def test_errors_are_passed_to_callback():
+    def fail():
+        raise OSError("unreachable share")
+
+    results = []
+    loader = BackgroundLoader(max_workers=1)
+    loader.submit(fail, lambda r, e: results.append((r, str(e))))
+    _wait_idle(loader)
+    assert results == [(None, "unreachable share")]
+    loader.close()
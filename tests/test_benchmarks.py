@@ -0,0 +1,38 @@
+import json
+
+from benchmarks.run import compare, run, set_first_value
+from benchmarks.synthetic import FIRST_KEY, FIRST_SECTION, generate_ini
+from config_io import load_parameters
+
+
+def test_generator_is_deterministic(tmp_path):
+    a, b = tmp_path / "a.ini", tmp_path / "b.ini"
+    size = generate_ini(str(a), 3, 4, value_length=6, seed=7)
+    generate_ini(str(b), 3, 4, value_length=6, seed=7)
+    assert a.read_bytes() == b.read_bytes()
+    assert size == a.stat().st_size
+    sections = load_parameters(str(a))
+    assert list(sections)[1:] == ["Section00000", "Section00001", "Section00002"]
+    assert all(len(sections[name]) == 4 for name in list(sections)[1:])
+
+
+def test_set_first_value_rewrites_only_that_value(tmp_path):
+    ini = tmp_path / "a.ini"
+    generate_ini(str(ini), 2, 3)
+    before = load_parameters(str(ini))
+    set_first_value(str(ini), "edited")
+    after = load_parameters(str(ini))
+    assert after[FIRST_SECTION][FIRST_KEY] == "edited"
+    after[FIRST_SECTION][FIRST_KEY] = before[FIRST_SECTION][FIRST_KEY]
+    assert after == before
+
+
+def test_run_produces_comparable_json():
+    result = run([(2, 5)], repeat=1, include_tk=False)
+    json.dumps(result)
+    cases = {r["case"] for r in result["results"]}
+    assert {"hash", "parse", "save_patch", "watch_detect_latency"} <= cases
+    assert all(r["median_s"] >= 0 for r in result["results"])
+    lines = compare(result, result)
+    assert len(lines) == len(result["results"])
+    assert all(line.endswith("x1.00") for line in lines)
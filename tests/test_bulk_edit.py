@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+import pytest
+
+from bulk_edit import apply_changes, bulk_edit_file, plan_bulk_edit
+from config_io import compute_file_hash, load_parameters
+from file_watcher import FileWatcher
+from gui.parameter_tab import _load_file
+
+
+def _sections():
+    return OrderedDict(
+        [
+            ("feature.a", OrderedDict([("enable_x", "1"), ("enable_y", "0"), ("level", "3")])),
+            ("feature.b", OrderedDict([("enable_x", "0"), ("level", "3")])),
+            ("other", OrderedDict([("enable_x", "0")])),
+        ]
+    )
+
+
+def test_plan_sets_value_only_where_it_changes():
+    changes = plan_bulk_edit(_sections(), "level", "5", section_pattern="feature.*")
+    assert changes == {"feature.a": {"level": "5"}, "feature.b": {"level": "5"}}
+    assert plan_bulk_edit(_sections(), "level", "3") == {}
+
+
+def test_plan_flip_uses_toggle_rule():
+    changes = plan_bulk_edit(_sections(), "enable_*", flip=True, section_pattern="feature.a")
+    assert changes == {"feature.a": {"enable_x": "0", "enable_y": "1"}}
+
+
+def test_plan_requires_value_or_flip():
+    with pytest.raises(ValueError):
+        plan_bulk_edit(_sections(), "level")
+
+
+def test_apply_changes_returns_save_hints():
+    sections = _sections()
+    hints = apply_changes(sections, plan_bulk_edit(sections, "enable_x", flip=True))
+    assert hints == {"feature.a": {"enable_x"}, "feature.b": {"enable_x"}, "other": {"enable_x"}}
+    assert [params["enable_x"] for params in sections.values()] == ["0", "1", "1"]
+
+
+def test_bulk_edit_file_flips_across_many_files_keeping_format(tmp_path):
+    text = "; flags\n[feature.a]\nenable_x = 1  \n\nlevel=3\n[other]\nenable_x=0\n"
+    paths = []
+    for i in range(200):
+        path = tmp_path / f"c{i}.ini"
+        path.write_text(text)
+        paths.append(str(path))
+
+    counts = [bulk_edit_file(p, "enable_x", flip=True, section_pattern="feature.*") for p in paths]
+
+    assert counts == [1] * 200
+    expected = text.replace("enable_x = 1  ", "enable_x = 0  ")
+    assert all(open(p).read() == expected for p in paths)
+    assert bulk_edit_file(paths[0], "missing", "1") == 0
+    assert load_parameters(paths[0])["feature.a"]["enable_x"] == "0"
+
+
+def test_bulk_edit_between_load_and_watch_is_reloaded(tmp_path):
+    ini = tmp_path / "app.ini"
+    ini.write_text("[feature.a]\nenable_x=0\n")
+    # 탭의 로더가 읽은 뒤, 감시를 시작하기 전에 다른 로더 스레드가 쓴 경우
+    file_hash, sections, signature = _load_file(str(ini))
+    assert bulk_edit_file(str(ini), "enable_x", "1") == 1
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini), file_hash, signature)
+    assert sections["feature.a"]["enable_x"] == "0"
+    assert watcher.poll() == [(str(ini), compute_file_hash(str(ini)))]
@@ -0,0 +1,153 @@
+import os
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+from gui.compare_view import CompareWindow, tab_labels
+from gui.parameter_tab import ParameterTab
+from gui.zoom_context import ZoomContext
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    return root
+
+
+def test_compare_shows_differences_and_copies_values(tmp_path):
+    prod = tmp_path / "prod.ini"
+    staging = tmp_path / "staging.ini"
+    prod.write_text("[A]\nflag=1\nsame=x\n[B]\nlimit=5\n")
+    staging.write_text("[A]\nflag=0\nsame=x\n[B]\nlimit=5\nextra=1\n")
+    root = _make_root()
+    left = ParameterTab(root, str(prod))
+    right = ParameterTab(root, str(staging))
+    manager = SimpleNamespace(
+        root_window=root,
+        tabs={str(prod): left, str(staging): right},
+        zoom_context=ZoomContext(),
+    )
+
+    window = CompareWindow(manager, left, right)
+    assert set(window._rows) == {("A", "flag"), ("B", "extra")}
+
+    window.copy_value("A", "flag", to_right=True)
+    assert right.sections["A"]["flag"] == "1"
+    assert set(window._rows) == {("B", "extra")}
+    assert "A" not in window._section_frames
+
+    assert right.undo() and right.sections["A"]["flag"] == "0"
+    assert "A" not in right.section_prints and "B" in right.section_prints
+    window.refresh()
+    assert ("A", "flag") in window._rows
+    window.destroy()
+    left.destroy()
+    right.destroy()
+    root.destroy()
+
+
+def test_tab_labels_disambiguate_same_file_names():
+    prod = os.path.join("srv", "prod", "app.ini")
+    staging = os.path.join("srv", "staging", "app.ini")
+    other = os.path.join("srv", "prod", "db.ini")
+    assert tab_labels([prod, staging, other]) == {
+        os.path.join("prod", "app.ini"): prod,
+        os.path.join("staging", "app.ini"): staging,
+        "db.ini": other,
+    }
+
+
+def test_compare_same_file_name_in_two_directories(tmp_path):
+    (tmp_path / "prod").mkdir()
+    (tmp_path / "staging").mkdir()
+    prod = tmp_path / "prod" / "app.ini"
+    staging = tmp_path / "staging" / "app.ini"
+    prod.write_text("[A]\nflag=1\n")
+    staging.write_text("[A]\nflag=0\n")
+    root = _make_root()
+    left = ParameterTab(root, str(prod))
+    right = ParameterTab(root, str(staging))
+    manager = SimpleNamespace(
+        root_window=root,
+        tabs={str(prod): left, str(staging): right},
+        zoom_context=ZoomContext(),
+    )
+
+    window = CompareWindow(manager, left, right)
+    assert window.left_tab is left and window.right_tab is right
+    assert set(window._rows) == {("A", "flag")}
+    window.destroy()
+    left.destroy()
+    right.destroy()
+    root.destroy()
+
+
+def test_compare_copies_key_missing_on_one_side(tmp_path):
+    prod = tmp_path / "prod.ini"
+    staging = tmp_path / "staging.ini"
+    prod.write_text("[A]\nflag=1\nextra=7\n[New]\nx=1\n")
+    staging.write_text("[A]\nflag=1\n")
+    root = _make_root()
+    left = ParameterTab(root, str(prod))
+    right = ParameterTab(root, str(staging))
+    manager = SimpleNamespace(
+        root_window=root,
+        tabs={str(prod): left, str(staging): right},
+        zoom_context=ZoomContext(),
+    )
+
+    window = CompareWindow(manager, left, right)
+    assert set(window._rows) == {("A", "extra"), ("New", "x")}
+    assert str(window._rows[("A", "extra")][2].cget("state")) == "normal"
+    assert str(window._rows[("A", "extra")][3].cget("state")) == "disabled"
+
+    window.copy_value("A", "extra", to_right=True)
+    window.copy_value("New", "x", to_right=True)
+    assert right.sections["A"]["extra"] == "7"
+    assert right.sections["New"]["x"] == "1"
+    assert not window._rows
+    right._writer().flush()
+    assert staging.read_text() == "[A]\nflag=1\nextra=7\n\n[New]\nx=1\n"
+
+    assert right.undo() and "New" not in right.sections
+    assert right.undo() and "extra" not in right.sections["A"]
+    assert right.redo() and right.sections["A"]["extra"] == "7"
+    window.destroy()
+    left.destroy()
+    right.destroy()
+    root.destroy()
+
+
+def test_compare_pages_after_copying_a_whole_section(tmp_path, monkeypatch):
+    monkeypatch.setattr("gui.compare_view.COMPARE_PAGE_ROWS", 1)
+    prod = tmp_path / "prod.ini"
+    staging = tmp_path / "staging.ini"
+    prod.write_text("[A]\nflag=1\n[B]\nx=1\ny=1\n")
+    staging.write_text("[A]\nflag=0\n[B]\nx=0\ny=0\n")
+    root = _make_root()
+    left = ParameterTab(root, str(prod))
+    right = ParameterTab(root, str(staging))
+    manager = SimpleNamespace(
+        root_window=root,
+        tabs={str(prod): left, str(staging): right},
+        zoom_context=ZoomContext(),
+    )
+
+    window = CompareWindow(manager, left, right)
+    assert set(window._rows) == {("A", "flag")}
+    # 섹션의 마지막 차이를 복사해 섹션이 사라진 뒤에도 다음 페이지를 볼 수 있어야 한다
+    window.copy_value("A", "flag", to_right=True)
+    assert "A" not in window.differences
+    window._show_more()
+    assert set(window._rows) == {("B", "x")}
+    window.copy_value("B", "x", to_right=True)
+    window._show_more()
+    assert set(window._rows) == {("B", "y")}
+    window.destroy()
+    left.destroy()
+    right.destroy()
+    root.destroy()
@@ -1,7 +1,23 @@
 import hashlib
+import os
 from collections import OrderedDict
 
-from config_io import compute_file_hash, load_parameters, save_parameters
+import config_io
+from config_io import (
+    MappedParameters,
+    compare_parameters,
+    compute_file_hash,
+    diff_parameters,
+    load_parameters,
+    load_parameters_parallel,
+    patch_parameters,
+    patch_parameters_signed,
+    save_parameters,
+    section_fingerprint,
+    shard_ranges,
+    stat_signature,
+    write_atomic,
+)
 
 
 def test_compute_file_hash(tmp_path):
@@ -34,3 +50,259 @@ def test_save_parameters_roundtrip(tmp_path):
     save_parameters(str(output), sections)
     reloaded = load_parameters(str(output))
     assert reloaded == sections
+
+
+def test_diff_parameters_detects_structure_and_values():
+    old = OrderedDict([
+        ("DEFAULT", OrderedDict([("a", "1"), ("b", "2")])),
+        ("Keep", OrderedDict([("x", "1")])),
+        ("Gone", OrderedDict([("y", "1")])),
+    ])
+    new = OrderedDict([
+        ("DEFAULT", OrderedDict([("b", "3"), ("a", "1"), ("c", "0")])),
+        ("Keep", OrderedDict([("x", "1")])),
+        ("New", OrderedDict([("z", "1")])),
+    ])
+    diff = diff_parameters(old, new)
+    assert diff["added"] == ["New"]
+    assert diff["removed"] == ["Gone"]
+    assert diff["order_changed"] is False
+    assert diff["sections"] == {
+        "DEFAULT": {
+            "added": ["c"],
+            "removed": [],
+            "changed": ["b"],
+            "reordered": True,
+        }
+    }
+
+
+def test_diff_parameters_section_order():
+    old = OrderedDict([("A", OrderedDict()), ("B", OrderedDict())])
+    new = OrderedDict([("B", OrderedDict()), ("A", OrderedDict())])
+    diff = diff_parameters(old, new)
+    assert diff["order_changed"] is True
+    assert diff["sections"] == {}
+
+
+def test_load_parameters_mapped_matches_default(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_bytes(
+        b"; header\r\ntop = a b \r\n[S1]\nk=1\nk=2\nother=x=y\n"
+        b"[S2]\n  spaced  =  v  \n[S1]\nreplaced=1\n# end\n"
+    )
+    expected = load_parameters(str(ini))
+    mapped = load_parameters(str(ini), mapped=True)
+    assert isinstance(mapped, MappedParameters)
+    assert list(mapped.keys()) == list(expected.keys())
+    assert mapped == expected
+    mapped.close()
+
+
+def test_mapped_section_mutation(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[S]\na=1\nb=2\n")
+    mapped = load_parameters(str(ini), mapped=True)
+    section = mapped["S"]
+    section["a"] = "0"
+    section["c"] = "3"
+    del section["b"]
+    assert list(section.items()) == [("a", "0"), ("c", "3")]
+    # 인덱스의 원래 키 목록은 그대로 유지된다
+    assert mapped.index[1].keys == ["a", "b"]
+
+    save_parameters(str(ini), mapped)
+    assert load_parameters(str(ini))["S"] == OrderedDict([("a", "0"), ("c", "3")])
+
+
+def test_mapped_load_and_patch_without_mmap(tmp_path, monkeypatch):
+    # Windows 에서는 매핑된 파일을 교체할 수 없어 메모리로 읽는다
+    monkeypatch.setattr(config_io, "MAP_EDITED_FILES", False)
+    ini = tmp_path / "sample.ini"
+    ini.write_text("; note\n[S]\na=1\nb=2\n")
+    mapped = load_parameters(str(ini), mapped=True)
+    assert mapped._mmap is None
+    assert list(mapped["S"].items()) == [("a", "1"), ("b", "2")]
+    mapped["S"]["a"] = "0"
+    patch_parameters(str(ini), mapped, {"S": {"a"}})
+    assert ini.read_text() == "; note\n[S]\na=0\nb=2\n"
+    mapped.close()
+
+
+def test_load_parameters_mapped_empty_file(tmp_path):
+    ini = tmp_path / "empty.ini"
+    ini.write_text("")
+    assert load_parameters(str(ini), mapped=True) == OrderedDict(
+        [("DEFAULT", OrderedDict())]
+    )
+
+
+def test_save_parameters_returns_hash_of_written_bytes(tmp_path):
+    output = tmp_path / "out.ini"
+    output.write_text("old\n")
+    output.chmod(0o640)
+    sections = OrderedDict([("S", OrderedDict([("k", "v")]))])
+    file_hash = save_parameters(str(output), sections)
+    assert file_hash == compute_file_hash(str(output))
+    assert output.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["out.ini"]
+
+
+def test_new_file_mode_follows_current_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        save_parameters(str(tmp_path / "new.ini"), OrderedDict([("S", OrderedDict())]))
+        # umask 를 읽기만 하고 바꾸지 않는다
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(previous)
+    assert (tmp_path / "new.ini").stat().st_mode & 0o777 == 0o640
+
+
+ANNOTATED = (
+    "; generated file\n"
+    "top = 1   # trailing text is part of the value\n"
+    "\n"
+    "[Alpha]\n"
+    "# alpha settings\n"
+    "a = 1\n"
+    "b=0\n"
+    "\n"
+    "[Beta]\n"
+    "c = 1\n"
+)
+
+
+def test_patch_parameters_changes_only_edited_value(tmp_path):
+    ini = tmp_path / "annotated.ini"
+    ini.write_text(ANNOTATED)
+    sections = load_parameters(str(ini))
+    sections["Alpha"]["a"] = "0"
+    file_hash = patch_parameters(str(ini), sections, changed={"Alpha": {"a"}})
+    assert ini.read_text() == ANNOTATED.replace("a = 1", "a = 0")
+    assert file_hash == compute_file_hash(str(ini))
+
+
+def test_patch_parameters_structural_edits_keep_comments(tmp_path):
+    ini = tmp_path / "annotated.ini"
+    ini.write_text(ANNOTATED)
+    sections = load_parameters(str(ini))
+    del sections["Alpha"]["b"]
+    sections["Alpha"]["new"] = "1"
+    sections["Gamma"] = OrderedDict([("g", "1")])
+    sections = OrderedDict(
+        (name, sections[name]) for name in ["DEFAULT", "Beta", "Alpha", "Gamma"]
+    )
+    patch_parameters(str(ini), sections)
+    text = ini.read_text()
+    assert "# alpha settings\na = 1\nnew=1\n" in text
+    assert text.startswith("; generated file\n")
+    assert load_parameters(str(ini)) == sections
+    assert list(load_parameters(str(ini))) == list(sections)
+
+    # 캐시된 인덱스로 이어서 저장해도 결과가 같아야 한다
+    sections["Gamma"]["g"] = "0"
+    patch_parameters(str(ini), sections, changed={"Gamma": {"g"}})
+    assert load_parameters(str(ini)) == sections
+
+
+def test_patch_parameters_without_changes_is_lossless(tmp_path):
+    ini = tmp_path / "annotated.ini"
+    ini.write_text(ANNOTATED)
+    patch_parameters(str(ini), load_parameters(str(ini)))
+    assert ini.read_text() == ANNOTATED
+
+
+def test_compare_parameters_lists_only_differing_values(tmp_path):
+    left_ini = tmp_path / "prod.ini"
+    right_ini = tmp_path / "staging.ini"
+    left_ini.write_text("[Same]\na=1\nb=2\n[Diff]\nx=1\ny=2\nonly_left=3\n[Left]\nk=v\n")
+    right_ini.write_text("[Diff]\nonly_right=4\ny=2\nx=0\n[Same]\na=1\nb=2\n[Right]\nk=w\n")
+    left = load_parameters(str(left_ini), compact=True)
+    right = load_parameters(str(right_ini))
+
+    result = compare_parameters(left, right)
+
+    assert list(result) == ["Diff", "Left", "Right"]
+    assert result["Diff"] == [("x", "1", "0"), ("only_left", "3", None), ("only_right", None, "4")]
+    assert result["Left"] == [("k", "v", None)]
+    assert result["Right"] == [("k", None, "w")]
+
+
+def test_compare_parameters_reuses_fingerprints():
+    left = OrderedDict([("S", OrderedDict([("a", "1")])), ("T", OrderedDict([("b", "2")]))])
+    right = OrderedDict([("S", OrderedDict([("a", "1")])), ("T", OrderedDict([("b", "3")]))])
+    left_prints, right_prints = {}, {}
+    assert list(compare_parameters(left, right, left_prints, right_prints)) == ["T"]
+    assert left_prints["S"] == right_prints["S"] == section_fingerprint(left["S"])
+
+    # 지문이 남아 있으면 같은 섹션으로 보고 건너뛴다
+    right["S"]["a"] = "9"
+    assert list(compare_parameters(left, right, left_prints, right_prints)) == ["T"]
+    del right_prints["S"]
+    assert list(compare_parameters(left, right, left_prints, right_prints)) == ["S", "T"]
+    assert section_fingerprint(OrderedDict([("a", "1b")])) != section_fingerprint(
+        OrderedDict([("a1", "b")])
+    )
+
+
+def _sharded_ini(tmp_path):
+    lines = ["top=1\r\n"]
+    for i in range(40):
+        lines.append(f"[S{i % 30}]\n" if i % 7 else f"  [S{i % 30}]  \n")
+        lines.extend(f"k{j}=v{i}_{j}\n" for j in range(20))
+        lines.append("[notheader=1\n")
+    lines.append("[DEFAULT]\nlate=2\n")
+    ini = tmp_path / "big.ini"
+    ini.write_bytes("".join(lines).encode("utf-8"))
+    return ini
+
+
+def test_shard_ranges_start_at_section_headers(tmp_path):
+    ini = _sharded_ini(tmp_path)
+    data = ini.read_bytes()
+    ranges = shard_ranges(str(ini), 8)
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_start, end), (start, _end) in zip(ranges, ranges[1:]):
+        assert end == start
+        line = data[start:data.index(b"\n", start)].strip()
+        assert line.startswith(b"[") and line.endswith(b"]")
+
+
+def test_shard_ranges_without_headers(tmp_path):
+    ini = tmp_path / "flat.ini"
+    ini.write_text("a=1\nb=2\n" * 100)
+    assert shard_ranges(str(ini), 4) == [(0, ini.stat().st_size)]
+
+
+def test_load_parameters_parallel_matches_sequential(tmp_path):
+    ini = _sharded_ini(tmp_path)
+    expected = load_parameters(str(ini))
+    parallel = load_parameters_parallel(str(ini), workers=2, threshold=0)
+    assert list(parallel.items()) == list(expected.items())
+    compact = load_parameters_parallel(str(ini), compact=True, workers=2, threshold=0)
+    assert [(name, list(params.items())) for name, params in compact.items()] == [
+        (name, list(params.items())) for name, params in expected.items()
+    ]
+
+
+def test_load_parameters_parallel_small_file_is_sequential(tmp_path, monkeypatch):
+    ini = _sharded_ini(tmp_path)
+    monkeypatch.setattr(config_io, "ProcessPoolExecutor", None)
+    assert load_parameters(str(ini), parallel=True) == load_parameters(str(ini))
+
+
+def test_write_atomic_returns_signature_of_written_file(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\nkey=1\n")
+    file_hash, signature = write_atomic(str(ini), [b"[S]\n", b"key=2\n"])
+    assert file_hash == compute_file_hash(str(ini))
+    assert signature == stat_signature(str(ini))
+    sections = load_parameters(str(ini))
+    sections["S"]["key"] = "3"
+    assert patch_parameters_signed(str(ini), sections, {"S": {"key"}}) == (
+        compute_file_hash(str(ini)),
+        stat_signature(str(ini)),
+        signature,
+    )
@@ -0,0 +1,50 @@
+from edit_journal import ADD, MOVE, VALUES, EditJournal, forward_changes, inverse_changes
+
+
+def test_undo_redo_round_trip():
+    journal = EditJournal()
+    journal.record_values([("S", "a", "0", "1")])
+    journal.record_move("S", -1)
+    assert journal.undo() == (MOVE, "S", -1)
+    assert journal.undo() == (VALUES, (("S", "a", "0", "1"),))
+    assert journal.undo() is None
+    assert journal.redo() == (VALUES, (("S", "a", "0", "1"),))
+    assert journal.can_undo and journal.can_redo
+
+
+def test_new_edit_clears_redo_and_noop_edits_are_ignored():
+    journal = EditJournal()
+    journal.record_values([("S", "a", "0", "1")])
+    journal.undo()
+    journal.record_values([("S", "b", "x", "x")])
+    assert journal.can_redo
+    journal.record_values([("S", "b", "x", "y")])
+    assert not journal.can_redo
+
+
+def test_history_is_bounded_by_entries_and_values():
+    journal = EditJournal(limit=3, max_values=5)
+    for i in range(10):
+        journal.record_values([("S", "k%d" % i, "0", "1")])
+    assert len(journal._undo) == 3
+    journal.record_values([("S", "k%d" % i, "0", "1") for i in range(4)])
+    assert len(journal._undo) == 2
+    assert journal._values == 5
+    journal.record_values([("S", "big%d" % i, "0", "1") for i in range(6)])
+    assert not journal.can_undo and journal._values == 0
+
+
+def test_change_maps_restore_first_old_value():
+    deltas = (("S", "a", "0", "1"), ("S", "b", "x", "y"))
+    assert inverse_changes(deltas) == {"S": {"a": "0", "b": "x"}}
+    assert forward_changes(deltas) == {"S": {"a": "1", "b": "y"}}
+
+
+def test_added_keys_count_toward_value_budget():
+    journal = EditJournal(max_values=3)
+    journal.record_add("S", [("a", "1"), ("b", "2")], created=True)
+    assert journal._values == 2
+    assert journal.undo() == (ADD, "S", (("a", "1"), ("b", "2")), True)
+    assert journal.redo() == (ADD, "S", (("a", "1"), ("b", "2")), True)
+    journal.record_add("T", [("c", "1"), ("d", "1")])
+    assert len(journal._undo) == 1
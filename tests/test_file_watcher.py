@@ -0,0 +1,89 @@
+import os
+
+from config_io import compute_file_hash, stat_signature
+from file_watcher import FileWatcher
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_poll_reports_content_change(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini))
+    assert watcher.poll() == []
+
+    ini.write_text("key=0\n")
+    _bump_mtime(ini)
+    assert watcher.poll() == [(str(ini), compute_file_hash(str(ini)))]
+    assert watcher.poll() == []
+
+
+def test_touch_without_content_change_is_ignored(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini))
+    _bump_mtime(ini)
+    assert watcher.poll() == []
+
+
+def test_acknowledged_write_is_not_reported(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini))
+    ini.write_text("key=22\n")
+    watcher.acknowledge(str(ini), compute_file_hash(str(ini)))
+    assert watcher.poll() == []
+
+
+def test_add_with_earlier_signature_reports_later_write(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    signature = stat_signature(str(ini))
+    known_hash = compute_file_hash(str(ini))
+    ini.write_text("key=0\n")
+    _bump_mtime(ini)
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini), known_hash, signature)
+    assert watcher.signature(str(ini)) == signature
+    assert watcher.poll() == [(str(ini), compute_file_hash(str(ini)))]
+
+
+def test_acknowledge_with_write_signature_keeps_later_external_write(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini))
+    ours = compute_file_hash(str(ini))
+    written = stat_signature(str(ini))
+    # 저장 결과를 Tk 스레드가 처리하기 전에 다른 프로세스가 쓴 경우
+    ini.write_text("key=external\n")
+    _bump_mtime(ini)
+    watcher.acknowledge(str(ini), ours, written)
+    assert watcher.poll() == [(str(ini), compute_file_hash(str(ini)))]
+
+
+def test_deleted_file_reports_none(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher(use_inotify=False)
+    watcher.add(str(ini))
+    ini.unlink()
+    assert watcher.poll() == [(str(ini), None)]
+
+
+def test_inotify_backend_detects_replace(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("key=1\n")
+    watcher = FileWatcher()
+    watcher.add(str(ini))
+    tmp = tmp_path / "a.ini.tmp"
+    tmp.write_text("key=0\nother=1\n")
+    os.replace(tmp, ini)
+    assert watcher.poll() == [(str(ini), compute_file_hash(str(ini)))]
+    watcher.close()
@@ -0,0 +1,86 @@
+import io
+import json
+
+from config_io import load_parameters
+from ini_batch import expand_paths, main, run
+
+
+def _write_configs(tmp_path, count=3):
+    paths = []
+    for i in range(count):
+        path = tmp_path / "nested" / f"app{i}.ini"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"; config {i}\n[Feature]\nenabled = {i % 2}\ntimeout=30\n[Other]\nname=n{i}\n")
+        paths.append(str(path))
+    return paths
+
+
+def _run(operation, paths, jobs=1, **options):
+    out = io.StringIO()
+    options.setdefault("section", "*")
+    options.setdefault("key", "*")
+    summary = run(operation, paths, options, jobs=jobs, out=out)
+    return [json.loads(line) for line in out.getvalue().splitlines()], summary
+
+
+def test_expand_paths_supports_recursive_globs(tmp_path):
+    paths = _write_configs(tmp_path)
+    assert expand_paths([str(tmp_path / "**" / "*.ini"), paths[0]]) == paths
+
+
+def test_get_query_and_dump(tmp_path):
+    paths = _write_configs(tmp_path, 2)
+    results, summary = _run("get", paths, section="Feature", key="enabled")
+    assert [r["value"] for r in results] == ["0", "1"]
+    assert summary["files"] == 2 and summary["files_per_second"] > 0
+
+    results, _ = _run("query", paths[:1], key="*e*", value="n*")
+    assert results[0]["matches"] == [{"section": "Other", "key": "name", "value": "n0"}]
+
+    results, _ = _run("dump", paths[:1])
+    assert results[0]["sections"]["Feature"] == {"enabled": "0", "timeout": "30"}
+
+
+def test_set_writes_only_changed_files_and_keeps_format(tmp_path):
+    paths = _write_configs(tmp_path)
+    before = [open(p).read() for p in paths]
+
+    results, summary = _run("set", paths, section="Feature", key="enabled", value="1")
+
+    assert [r["written"] for r in results] == [True, False, True]
+    assert summary["changed_files"] == 2
+    assert open(paths[1]).read() == before[1]
+    assert open(paths[0]).read() == before[0].replace("enabled = 0", "enabled = 1")
+
+
+def test_toggle_dry_run_and_errors(tmp_path):
+    paths = _write_configs(tmp_path, 2)
+    results, summary = _run("toggle", paths, key="enabled", dry_run=True)
+    assert [r["changed"] for r in results] == [1, 1]
+    assert summary["changed_files"] == 0
+    assert load_parameters(paths[0])["Feature"]["enabled"] == "0"
+
+    results, summary = _run("get", [str(tmp_path / "missing.ini")], key="x")
+    assert "error" in results[0] and summary["errors"] == 1
+
+
+def test_process_pool_toggles_every_file(tmp_path):
+    paths = _write_configs(tmp_path, 6)
+    results, summary = _run("toggle", paths, jobs=2, section="Feature", key="enabled")
+    assert sorted(r["file"] for r in results) == sorted(paths)
+    assert summary["changed_files"] == 6
+    assert [load_parameters(p)["Feature"]["enabled"] for p in paths] == ["1", "0"] * 3
+
+
+def test_main_requires_key_for_set(tmp_path, capsys):
+    paths = _write_configs(tmp_path, 1)
+    try:
+        main(["set", paths[0], "--value", "1"])
+    except SystemExit as e:
+        assert e.code == 2
+    else:
+        raise AssertionError("expected a usage error")
+    assert main(["get", paths[0], "--section", "Feature", "--key", "timeout", "--jobs", "1"]) == 0
+    out, err = capsys.readouterr()
+    assert json.loads(out)["value"] == "30"
+    assert json.loads(err.splitlines()[-1])["summary"]["files"] == 1
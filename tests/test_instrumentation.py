@@ -0,0 +1,67 @@
+import json
+import os
+import threading
+
+from instrumentation import Tracer, trace_category, traced, tracer
+
+
+def test_disabled_tracer_records_nothing():
+    t = Tracer(enabled=False)
+    with t.span("parse", "a.ini"):
+        pass
+    assert t.summary() == {}
+    assert t.chrome_trace()["traceEvents"] == []
+
+
+def test_summary_percentiles_per_category():
+    t = Tracer(enabled=True)
+    for duration in range(1, 101):
+        t._record("parse", "a.ini", 0, duration * 1_000_000, {})
+    t._record("parse", "b.ini", 0, 500 * 1_000_000, {})
+    count, p50, p99 = t.summary("a.ini")["parse"]
+    assert count == 100
+    assert 49 <= p50 <= 51
+    assert 98 <= p99 <= 100
+    assert t.summary()["parse"][0] == 101
+
+
+def test_rolling_window_keeps_recent_spans():
+    t = Tracer(enabled=True, window=10)
+    for _ in range(50):
+        t._record("save", None, 0, 1_000_000, {})
+    assert t.summary()["save"][0] == 10
+
+
+def test_chrome_trace_export(tmp_path):
+    t = Tracer(enabled=True)
+    with t.span("refresh_ui", "a.ini", rows=3):
+        pass
+    worker = threading.Thread(target=lambda: t.span("save", "a.ini").__enter__().__exit__())
+    worker.start()
+    worker.join()
+    out = tmp_path / "trace.json"
+    t.export_chrome_trace(str(out))
+    events = json.loads(out.read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["refresh_ui", "save"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 and e["cat"] == "a.ini" for e in events)
+    assert events[0]["args"] == {"rows": "3"}
+    assert events[0]["tid"] != events[1]["tid"]
+
+
+def test_traced_method_uses_file_path_as_category():
+    class Tab:
+        file_path = "/tmp/dir/a.ini"
+
+        @traced("layout_parameters")
+        def layout(self):
+            return 42
+
+    tracer.clear()
+    was_enabled, tracer.enabled = tracer.enabled, True
+    try:
+        assert Tab().layout() == 42
+    finally:
+        tracer.enabled = was_enabled
+    assert "layout_parameters" in tracer.summary(os.path.abspath("/tmp/dir/a.ini"))
+    assert tracer.summary(trace_category("/tmp/other/a.ini")) == {}
+    tracer.clear()
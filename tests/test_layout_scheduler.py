@@ -0,0 +1,73 @@
+from gui.layout_scheduler import LayoutScheduler
+
+
+class _FakeWidget:
+    """Records ``after``/``after_idle`` callbacks so tests can run them by hand."""
+
+    def __init__(self):
+        self.timers = {}
+        self.idle = {}
+        self._next = 0
+
+    def _add(self, table, callback, args):
+        self._next += 1
+        table[self._next] = (callback, args)
+        return self._next
+
+    def after(self, ms, callback, *args):
+        return self._add(self.timers, callback, args)
+
+    def after_idle(self, callback, *args):
+        return self._add(self.idle, callback, args)
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+        self.idle.pop(after_id, None)
+
+    def run_pending(self):
+        for table in (self.timers, self.idle):
+            while table:
+                callback, args = table.pop(min(table))
+                callback(*args)
+
+
+def test_burst_of_requests_runs_one_pass_with_merged_flags():
+    widget = _FakeWidget()
+    passes = []
+    scheduler = LayoutScheduler(widget, passes.append, frame_interval_ms=0)
+    for _ in range(50):
+        scheduler.request(resize=True)
+    scheduler.request(zoom=True)
+    scheduler.request()
+    assert scheduler.pending
+    widget.run_pending()
+    assert passes == [{"resize": True, "zoom": True}]
+    assert not scheduler.pending
+
+
+def test_pass_within_frame_interval_is_delayed():
+    widget = _FakeWidget()
+    passes = []
+    scheduler = LayoutScheduler(widget, passes.append, frame_interval_ms=10_000)
+    scheduler.request()
+    assert widget.idle and not widget.timers
+    widget.run_pending()
+    # 직전 패스 직후의 요청은 프레임 간격만큼 타이머를 거친 뒤 idle 에 실행
+    scheduler.request(resize=True)
+    assert widget.timers and not widget.idle
+    widget.run_pending()
+    assert passes == [{}, {"resize": True}]
+
+
+def test_flush_runs_immediately_and_cancel_drops_pending():
+    widget = _FakeWidget()
+    passes = []
+    scheduler = LayoutScheduler(widget, passes.append, frame_interval_ms=0)
+    scheduler.request(resize=True)
+    scheduler.flush()
+    assert passes == [{"resize": True}]
+    assert not widget.idle
+    scheduler.request(zoom=True)
+    scheduler.cancel()
+    widget.run_pending()
+    assert passes == [{"resize": True}]
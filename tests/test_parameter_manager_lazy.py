@@ -0,0 +1,191 @@
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+from gui.lazy_tab import LazyTab
+from gui.parameter_manager import ParameterManagerGUI
+from gui.parameter_tab import ParameterTab
+from state_manager import load_state, save_state
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    return root
+
+
+def _restore_session(tmp_path, monkeypatch, count=3):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    files = []
+    for i in range(count):
+        ini = tmp_path / f"f{i}.ini"
+        ini.write_text(f"[S{i}]\nk=1\n")
+        files.append(str(ini))
+    state_path = tmp_path / ".ini_editor" / "state.json"
+    states = {files[0]: {"collapsed": {"S0": True}, "order": ["S0"]}}
+    save_state(str(state_path), None, files, states)
+    return files, state_path
+
+
+def test_restored_tabs_are_built_on_first_selection(tmp_path, monkeypatch):
+    files, _ = _restore_session(tmp_path, monkeypatch)
+    root = _make_root()
+    gui = ParameterManagerGUI(root)
+    root.update()
+
+    assert isinstance(gui.tabs[files[-1]], ParameterTab)
+    assert all(isinstance(gui.tabs[f], LazyTab) for f in files[:-1])
+
+    gui.notebook.select(gui.tabs[files[0]])
+    root.update()
+    tab = gui.tabs[files[0]]
+    assert isinstance(tab, ParameterTab)
+    assert gui.current_tab is tab
+    assert gui.notebook.index(tab) == 0
+    assert isinstance(gui.tabs[files[1]], LazyTab)
+    gui.on_close()
+
+
+def test_unopened_tabs_keep_their_saved_state(tmp_path, monkeypatch):
+    files, state_path = _restore_session(tmp_path, monkeypatch)
+    root = _make_root()
+    gui = ParameterManagerGUI(root)
+    root.update()
+    gui.on_close()
+
+    _geometry, saved_files, saved_states, _zoom = load_state(str(state_path))
+    assert saved_files == files
+    assert saved_states[files[0]] == {"collapsed": {"S0": True}, "order": ["S0"]}
+
+
+def test_startup_timing_reports_first_interactive_tab(tmp_path, monkeypatch):
+    _restore_session(tmp_path, monkeypatch)
+    root = _make_root()
+    gui = ParameterManagerGUI(root, startup_timing=True)
+    for _ in range(500):
+        if gui.startup_ms is not None:
+            break
+        root.update()
+        root.after(5)
+    assert gui.startup_ms is not None and gui.startup_ms > 0
+    gui.on_close()
+
+
+def test_workspace_tree_opens_tabs_only_on_activation(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    workspace = tmp_path / "configs"
+    (workspace / "svc").mkdir(parents=True)
+    paths = []
+    for i in range(3):
+        ini = workspace / "svc" / f"app{i}.ini"
+        ini.write_text(f"[S{i}]\nk=1\nj=0\n")
+        paths.append(str(ini))
+    root = _make_root()
+    gui = ParameterManagerGUI(root)
+    panel = gui.open_workspace(str(workspace))
+    deadline = time.monotonic() + 5
+    while panel.index.busy and time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.01)
+    root.update()
+
+    assert panel.tree.exists(paths[2])
+    assert panel.tree.set(paths[2], "keys") == "2"
+    assert gui.tabs == {}
+
+    tab = gui.open_workspace_file(paths[1])
+    assert isinstance(tab, ParameterTab) and list(gui.tabs) == [paths[1]]
+    assert gui.open_workspace_file(paths[1]) is tab
+    gui.on_close()
+
+
+def _wait_built(root, tabs):
+    deadline = time.monotonic() + 5
+    while any(tab.loading or tab.populating for tab in tabs) and time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.01)
+    root.update()
+
+
+def test_tabs_over_budget_hibernate_and_wake_with_their_model(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    paths = []
+    for i in range(3):
+        ini = tmp_path / f"f{i}.ini"
+        ini.write_text(f"[S]\nk=1\nname=n{i}\n")
+        paths.append(str(ini))
+    root = _make_root()
+    gui = ParameterManagerGUI(root, max_live_tabs=2)
+    tabs = [gui._open_file(path) for path in paths]
+    _wait_built(root, tabs)
+    tabs[0].toggle_parameter_value("S", "k")
+    tabs[0].flush_save()
+    gui.writer.flush()
+    gui.writer.drain()
+    model = tabs[0].sections
+
+    # 가장 오래전에 본 탭 하나만 잠든다
+    assert gui.enforce_tab_budget() == [paths[0]]
+    sleeper = gui.tabs[paths[0]]
+    assert isinstance(sleeper, LazyTab) and sleeper.hibernated
+    assert paths[0] not in gui.file_watcher
+    assert gui.notebook.index(sleeper) == 0
+
+    gui.notebook.select(sleeper)
+    root.update()
+    awake = gui.tabs[paths[0]]
+    assert isinstance(awake, ParameterTab)
+    assert awake.sections is model
+    assert awake.undo() and awake.sections["S"]["k"] == "1"
+
+    # 잠든 동안 바뀐 파일은 다시 읽는다
+    assert gui.enforce_tab_budget(now=time.monotonic() + 10**6) == paths[1:]
+    (tmp_path / "f1.ini").write_text("[S]\nk=0\nname=changed\n")
+    gui.notebook.select(gui.tabs[paths[1]])
+    _wait_built(root, [gui.tabs[paths[1]]])
+    assert gui.tabs[paths[1]].sections["S"]["name"] == "changed"
+    gui.on_close()
+
+
+def test_closing_a_tab_with_a_pending_save_keeps_watching_others(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    paths = []
+    for i in range(2):
+        ini = tmp_path / f"f{i}.ini"
+        ini.write_text("[S]\nk=1\n")
+        paths.append(str(ini))
+    root = _make_root()
+    gui = ParameterManagerGUI(root)
+    tabs = [gui._open_file(path) for path in paths]
+    _wait_built(root, tabs)
+    tabs[0].toggle_parameter_value("S", "k")
+    gui._tab_index_for_menu = gui.notebook.index(tabs[0])
+    gui.close_current_tab()
+    gui.writer.flush()
+
+    # 닫힌 탭의 저장 완료가 처리된 뒤에도 다른 탭의 외부 변경은 다시 읽는다
+    gui._poll_file_events()
+    (tmp_path / "f1.ini").write_text("[S]\nk=changed\n")
+    gui._poll_file_events()
+    assert tabs[1].sections["S"]["k"] == "changed"
+    gui.on_close()
+
+
+def test_file_poll_is_rescheduled_when_a_callback_fails():
+    scheduled = []
+
+    def drain():
+        raise RuntimeError("callback failed")
+
+    gui = SimpleNamespace(
+        writer=SimpleNamespace(drain=drain),
+        root_window=SimpleNamespace(after=lambda ms, func: scheduled.append(func)),
+    )
+    gui._poll_file_events = lambda: None
+    with pytest.raises(RuntimeError):
+        ParameterManagerGUI._poll_file_events(gui)
+    assert scheduled == [gui._poll_file_events]
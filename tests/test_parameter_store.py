@@ -0,0 +1,65 @@
+import tracemalloc
+from collections import OrderedDict
+
+from config_io import diff_parameters, load_parameters
+from parameter_store import ParameterStore, SectionStore
+
+
+def test_section_store_behaves_like_ordered_mapping():
+    store = SectionStore([("b", "1"), ("a", "0")])
+    store["c"] = "2"
+    store["a"] = "1"
+    assert list(store) == ["b", "a", "c"]
+    assert store["a"] == "1" and "c" in store and "z" not in store
+    del store["b"]
+    assert store.items() == [("a", "1"), ("c", "2")]
+    assert store.get("b") is None
+    assert store == OrderedDict([("a", "1"), ("c", "2")])
+
+
+def test_copy_is_independent():
+    store = SectionStore.from_dict({"k": "1"})
+    clone = store.copy()
+    clone["k"] = "0"
+    assert store["k"] == "1" and clone["k"] == "0"
+
+
+def test_structure_and_changed_keys():
+    old = SectionStore.from_dict({"a": "1", "b": "2"})
+    new = SectionStore.from_dict({"a": "1", "b": "3"})
+    assert old.same_structure(new)
+    assert old.changed_keys(new) == ["b"]
+    assert not old.same_structure(SectionStore.from_dict({"b": "2", "a": "1"}))
+    assert ParameterStore(S=old).same_structure(ParameterStore(S=new))
+
+
+def test_compact_load_matches_default(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("x=0\n[S]\na=1\n; c\nb = 2\n[T]\n")
+    compact = load_parameters(str(ini), compact=True)
+    assert isinstance(compact, ParameterStore)
+    assert isinstance(compact["S"], SectionStore)
+    assert compact == load_parameters(str(ini))
+    edited = load_parameters(str(ini), compact=True)
+    edited["S"]["b"] = "3"
+    assert diff_parameters(compact, edited)["sections"]["S"]["changed"] == ["b"]
+
+
+def _measure(path, **kwargs):
+    tracemalloc.start()
+    try:
+        model = load_parameters(path, **kwargs)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del model
+    return size
+
+
+def test_compact_store_uses_less_memory_than_ordered_dict(tmp_path):
+    ini = tmp_path / "big.ini"
+    with open(ini, "w") as f:
+        for s in range(100):
+            f.write(f"[section{s}]\n")
+            f.writelines(f"param_{s}_{k}={k % 2}\n" for k in range(1000))
+    assert _measure(str(ini), compact=True) < _measure(str(ini)) * 0.7
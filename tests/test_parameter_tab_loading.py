@@ -0,0 +1,66 @@
+import time
+import tkinter as tk
+import pytest
+from gui.parameter_tab import ParameterTab
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    return root
+
+
+def _pump(root, tab, timeout=5):
+    deadline = time.monotonic() + timeout
+    while (tab.loading or tab.populating) and time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.005)
+
+
+def test_background_load_shows_placeholder_then_widgets(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\na=1\nb=0\n[B]\nc=1\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini), background=True)
+    assert tab.loading
+    assert tab.widget_registry == {}
+
+    _pump(root, tab)
+    assert not tab.loading and not tab.populating
+    assert tab.last_file_hash is not None
+    assert set(tab.widget_registry["A"]["params"]) == {"a", "b"}
+    assert tab.widget_registry["B"]["built"]
+    root.destroy()
+
+
+def test_progressive_population_survives_section_expand(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\n" + "".join(f"k{i}=1\n" for i in range(300)))
+    root = _make_root()
+    tab = ParameterTab(root, str(ini), background=True, virtual=False)
+    deadline = time.monotonic() + 5
+    while tab.loading and time.monotonic() < deadline:
+        root.update()
+    # 일부만 만들어진 상태에서 접었다 펴도 셀이 중복되지 않아야 한다
+    tab.toggle_section("A")
+    tab.toggle_section("A")
+    _pump(root, tab)
+    info = tab.widget_registry["A"]
+    assert info["built"]
+    assert len(info["params"]) == 300
+    assert len(info["grid_frame"].grid_slaves()) == 300
+    root.destroy()
+
+
+def test_get_state_keeps_saved_order_while_loading(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\na=1\n[B]\nb=0\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini), initial_state={"order": ["B", "A"]}, background=True)
+    assert tab.get_state()["order"] == ["B", "A"]
+    _pump(root, tab)
+    assert list(tab.sections) == ["B", "A"]
+    root.destroy()
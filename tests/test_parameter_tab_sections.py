@@ -0,0 +1,241 @@
+import tkinter as tk
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import config_io
+from config_io import load_parameters
+from gui.parameter_tab import ParameterTab, _read_file
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    return root
+
+
+def test_collapsed_section_built_on_first_expand(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[Open]\na=1\n[Closed]\nb=0\n")
+    root = _make_root()
+    tab = ParameterTab(
+        root, str(ini), initial_state={"collapsed": {"Closed": True}}
+    )
+    root.update_idletasks()
+
+    closed = tab.widget_registry["Closed"]
+    assert not closed["built"]
+    assert closed["params"] == {}
+    assert "a" in tab.widget_registry["Open"]["params"]
+
+    # 위젯이 없어도 모델 갱신과 레이아웃은 동작해야 한다
+    tab.update_parameter_value("Closed", "b", "1")
+    tab.layout_parameters()
+    assert tab.sections["Closed"]["b"] == "1"
+
+    tab.toggle_section("Closed")
+    assert closed["built"]
+    entry = closed["params"]["b"][2]
+    assert entry.get() == "1"
+    root.destroy()
+
+
+def test_reload_appending_key_keeps_existing_widgets(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\na=1\n[B]\nb=0\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    frame_a = tab.widget_registry["A"]["frame"]
+    cell_b = tab.widget_registry["B"]["params"]["b"][0]
+
+    ini.write_text("[A]\na=0\n[B]\nb=0\nc=1\n")
+    tab.monitor_file_changes()
+
+    assert tab.widget_registry["A"]["frame"] is frame_a
+    assert tab.widget_registry["B"]["params"]["b"][0] is cell_b
+    assert "c" in tab.widget_registry["B"]["params"]
+    assert tab.widget_registry["A"]["params"]["a"][2].get() == "0"
+    root.destroy()
+
+
+def test_filter_grid_removes_non_matching_cells_and_sections(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\nspeed=1\nmode=0\n[B]\nlimit=5\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    assert tab.set_filter("spe") == 1
+    root.update_idletasks()
+    assert not tab.widget_registry["B"]["frame"].winfo_manager()
+    params = tab.widget_registry["A"]["params"]
+    assert params["speed"][0].winfo_manager() == "grid"
+    assert not params["mode"][0].winfo_manager()
+
+    tab.set_filter("")
+    root.update_idletasks()
+    assert tab.widget_registry["B"]["frame"].winfo_manager() == "grid"
+    assert params["mode"][0].winfo_manager() == "grid"
+    root.destroy()
+
+
+def test_bulk_edit_updates_widgets_and_saves_once(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\nflag_a=1\nflag_b=0\n[B]\nflag_a=1\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+    submitted = []
+    writer = tab._writer()
+    original_submit = writer.submit
+    writer.submit = lambda *args, **kwargs: (
+        submitted.append(kwargs.get("changed")), original_submit(*args, **kwargs)
+    )
+
+    assert tab.bulk_edit("flag_*", flip=True) == 3
+    assert submitted == [{"A": {"flag_a", "flag_b"}, "B": {"flag_a"}}]
+    assert tab.widget_registry["A"]["params"]["flag_b"][2].get() == "1"
+    writer.flush()
+    assert "flag_b=1" in ini.read_text()
+    tab.destroy()
+    root.destroy()
+
+
+def test_undo_redo_values_and_moves_without_rebuilding(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\nflag=1\nname=x\n[B]\nflag=0\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+    frame_a = tab.widget_registry["A"]["frame"]
+    entry = tab.widget_registry["A"]["params"]["name"][2]
+
+    tab.update_parameter_value("A", "name", "typo")
+    tab.toggle_parameter_value("A", "flag")
+    tab.move_section_down("A")
+    assert list(tab.sections) == ["DEFAULT", "B", "A"]
+
+    assert tab.undo()
+    assert list(tab.sections) == ["DEFAULT", "A", "B"]
+    assert tab.widget_registry["A"]["frame"] is frame_a
+    assert tab.undo() and tab.sections["A"]["flag"] == "1"
+    assert tab.undo() and tab.sections["A"]["name"] == "x"
+    assert entry.get() == "x"
+    assert not tab.undo()
+
+    assert tab.redo() and entry.get() == "typo"
+    tab.flush_save()
+    tab._writer().flush()
+    assert "name=typo" in ini.read_text()
+    tab.destroy()
+    root.destroy()
+
+
+def test_rebuild_recycles_cells_and_move_keeps_scroll(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text(
+        "".join(f"[S{s}]\n" + "".join(f"k{i}=1\n" for i in range(20)) for s in range(10))
+    )
+    root = _make_root()
+    tab = ParameterTab(root, str(ini), virtual=False)
+    root.geometry("400x300")
+    root.update()
+    cells = {cell[0] for info in tab.widget_registry.values() for cell in info["params"].values()}
+
+    tab.canvas.yview_moveto(0.5)
+    top = tab.canvas.yview()[0]
+    tab.move_section_up("S5")
+    root.update()
+    assert tab.canvas.yview()[0] == top
+
+    tab.sections["S0"]["k0"] = "0"
+    tab.refresh_ui()
+    rebuilt = {cell[0] for info in tab.widget_registry.values() for cell in info["params"].values()}
+    assert rebuilt == cells
+    assert tab.widget_registry["S0"]["params"]["k0"][2].get() == "0"
+    assert tab.widget_registry["S0"]["params"]["k0"][1].cget("text") == "OFF"
+    assert not tab._cell_pool
+    tab.destroy()
+    root.destroy()
+
+
+def test_external_edit_during_save_is_reloaded_afterwards(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\nflag=1\n[B]\nlimit=5\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    tab.update_parameter_value("A", "flag", "0")
+    # 저장을 기다리는 동안 다른 프로그램이 다른 키를 바꾸고 감시자가 알린 경우
+    ini.write_text("[A]\nflag=1\n[B]\nlimit=50\n")
+    tab.monitor_file_changes("external")
+    assert tab.sections["B"]["limit"] == "5"
+    tab.flush_save()
+    tab._writer().flush()
+    tab._writer().drain()
+    assert ini.read_text() == "[A]\nflag=0\n[B]\nlimit=50\n"
+    assert tab.sections["B"]["limit"] == "50"
+    assert tab.sections["A"]["flag"] == "0"
+    tab.destroy()
+    root.destroy()
+
+
+def test_external_edit_before_unwatched_save_is_reloaded(tmp_path):
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[A]\nflag=1\n[B]\nlimit=5\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    tab.update_parameter_value("A", "flag", "0")
+    # 감시자가 확인하기 전에 외부 변경 위에 패치 저장한 경우
+    ini.write_text("[A]\nflag=1\n[B]\nlimit=500\n")
+    tab.flush_save()
+    tab._writer().flush()
+    tab._writer().drain()
+    assert tab.sections["B"]["limit"] == "500"
+    assert not tab._own_watcher.poll()
+    tab.destroy()
+    root.destroy()
+
+
+def _large_ini(tmp_path):
+    ini = tmp_path / "large.ini"
+    ini.write_text(
+        "".join(
+            f"[S{i}]\n" + "".join(f"k{j}=v{i}_{j}\n" for j in range(20))
+            for i in range(30)
+        )
+    )
+    return ini
+
+
+def _items(sections):
+    return [(name, list(params.items())) for name, params in sections.items()]
+
+
+def test_read_file_parses_large_file_in_parallel(tmp_path, monkeypatch):
+    ini = _large_ini(tmp_path)
+    monkeypatch.setattr(config_io, "PARALLEL_PARSE_THRESHOLD", 0)
+    monkeypatch.setattr(config_io, "PARSE_WORKERS", 2)
+    assert _items(_read_file(str(ini))) == _items(load_parameters(str(ini)))
+
+
+@pytest.mark.parametrize("error", [RuntimeError, OSError, BrokenProcessPool])
+def test_read_file_falls_back_when_pool_fails(tmp_path, monkeypatch, error):
+    ini = _large_ini(tmp_path)
+    monkeypatch.setattr(config_io, "PARALLEL_PARSE_THRESHOLD", 0)
+    monkeypatch.setattr(config_io, "PARSE_WORKERS", 2)
+
+    def broken_pool(*args, **kwargs):
+        raise error("pool unavailable")
+
+    # 풀을 시작할 수 없어도 GUI 로드는 순차 파싱으로 끝나야 한다
+    monkeypatch.setattr(config_io, "ProcessPoolExecutor", broken_pool)
+    assert _items(_read_file(str(ini))) == _items(load_parameters(str(ini)))
@@ -0,0 +1,64 @@
+import tkinter as tk
+import pytest
+from gui.parameter_tab import ParameterTab
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    return root
+
+
+def test_virtual_grid_materializes_visible_rows_only(tmp_path):
+    ini = tmp_path / "big.ini"
+    lines = ["[Section]"] + [f"key{i}=1" for i in range(3000)]
+    ini.write_text("\n".join(lines) + "\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    assert tab.virtual_grid is not None
+    assert tab.widget_registry == {}
+    assert tab.virtual_grid.cell_widgets("Section", "key2999") is None
+
+    tab.toggle_parameter_value("Section", "key2999")
+    assert tab.sections["Section"]["key2999"] == "0"
+
+    tab.toggle_section("Section")
+    assert tab.virtual_grid.cell_widgets("Section", "key0") is None
+    root.destroy()
+
+
+def test_virtual_grid_disabled_for_small_files(tmp_path):
+    ini = tmp_path / "small.ini"
+    ini.write_text("[Section]\nkey=1\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    assert tab.virtual_grid is None
+    assert "key" in tab.widget_registry["Section"]["params"]
+    root.destroy()
+
+
+def test_filter_hides_sections_without_matches(tmp_path):
+    ini = tmp_path / "big.ini"
+    lines = ["[A]"] + [f"key{i}=1" for i in range(2500)] + ["[B]", "other=value"]
+    ini.write_text("\n".join(lines) + "\n")
+    root = _make_root()
+    tab = ParameterTab(root, str(ini))
+    root.update_idletasks()
+
+    assert tab.set_filter("key249") == 11
+    rows = tab.virtual_grid._rows
+    assert {section for section, _start in rows} == {"A"}
+
+    assert tab.set_filter("VALUE") == 1
+    assert tab.virtual_grid._section_keys == {"B": ["other"]}
+
+    assert tab.set_filter("") is None
+    assert {section for section, _start in tab.virtual_grid._rows} == {"A", "B"}
+    root.destroy()
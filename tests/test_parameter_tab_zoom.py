@@ -53,3 +53,30 @@ def test_entry_font_scales(tmp_path):
     tab._on_mousewheel(_event(delta=-120))
     assert f.cget("size") == original_size
     root.destroy()
+
+
+def test_tabs_share_zoom_context_and_hidden_tabs_relayout_lazily(tmp_path):
+    from gui.zoom_context import ZoomContext
+
+    ini = tmp_path / "sample.ini"
+    ini.write_text("[Section]\nkey=1\n")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk unavailable: {e}")
+    root.withdraw()
+    context = ZoomContext(1.0)
+    visible = ParameterTab(root, str(ini), zoom_context=context)
+    hidden = ParameterTab(root, str(ini), zoom_context=context)
+    root.update_idletasks()
+    assert visible.param_font is hidden.param_font
+
+    assert context.set_zoom(1.5)
+    assert visible.sync_zoom()
+    # 숨은 탭은 폰트만 공유하고 다시 배치하지 않은 상태로 남는다
+    assert hidden.cell_width == visible.cell_width
+    assert hidden._zoom_generation != context.generation
+    hidden.update_layout_for_current_size()
+    assert hidden._zoom_generation == context.generation
+    assert not hidden.sync_zoom()
+    root.destroy()
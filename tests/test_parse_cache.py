@@ -0,0 +1,82 @@
+import os
+
+from config_io import compute_file_hash, load_parameters
+from parameter_store import ParameterStore
+from parse_cache import ParseCache
+
+
+def _counting_parser(calls):
+    def parse(path):
+        calls.append(path)
+        return load_parameters(path, compact=True)
+    return parse
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\na=1\nb=0\n")
+    calls = []
+    cache = ParseCache(str(tmp_path / "cache"))
+    first = cache.load(str(ini), _counting_parser(calls))
+    second = ParseCache(str(tmp_path / "cache")).load(str(ini), _counting_parser(calls))
+    assert calls == [str(ini)]
+    assert second[0] == first[0] == compute_file_hash(str(ini))
+    assert isinstance(second[1], ParameterStore)
+    assert second[1] == first[1]
+    # 캐시에서 받은 모델을 고쳐도 캐시 항목은 그대로여야 한다
+    second[1]["S"]["a"] = "0"
+    assert cache.load(str(ini), _counting_parser(calls))[1]["S"]["a"] == "1"
+
+
+def test_modified_file_is_parsed_again(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\na=1\n")
+    calls = []
+    cache = ParseCache(str(tmp_path / "cache"))
+    cache.load(str(ini), _counting_parser(calls))
+    ini.write_text("[S]\na=0\nb=1\n")
+    file_hash, sections = cache.load(str(ini), _counting_parser(calls))
+    assert len(calls) == 2
+    assert file_hash == compute_file_hash(str(ini))
+    assert dict(sections["S"]) == {"a": "0", "b": "1"}
+
+
+def test_touched_file_with_same_content_skips_parsing(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\na=1\n")
+    calls = []
+    cache = ParseCache(str(tmp_path / "cache"))
+    cache.load(str(ini), _counting_parser(calls))
+    st = os.stat(ini)
+    os.utime(ini, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache.load(str(ini), _counting_parser(calls))
+    assert len(calls) == 1
+
+
+def test_corrupt_entry_is_discarded(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_text("[S]\na=1\n")
+    calls = []
+    cache = ParseCache(str(tmp_path / "cache"))
+    cache.load(str(ini), _counting_parser(calls))
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.write_bytes(b"\x00garbage")
+    assert dict(cache.load(str(ini), _counting_parser(calls))[1]["S"]) == {"a": "1"}
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=4000)
+    calls = []
+    paths = []
+    for i in range(10):
+        ini = tmp_path / f"f{i}.ini"
+        ini.write_text(f"[S{i}]\n" + "".join(f"key{k}={i}\n" for k in range(40)))
+        paths.append(str(ini))
+        cache.load(str(ini), _counting_parser(calls))
+        entry = cache._entry_path(str(ini))
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+    total = sum(p.stat().st_size for p in (tmp_path / "cache").iterdir())
+    assert total <= 4000
+    assert not os.path.exists(cache._entry_path(paths[0]))
+    assert os.path.exists(cache._entry_path(paths[-1]))
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+from config_io import diff_parameters
+from search_index import SearchIndex
+
+
+def _sections():
+    return OrderedDict(
+        [
+            ("Alpha", OrderedDict([("Speed", "10"), ("mode", "fast"), ("Gain", "1")])),
+            ("Beta", OrderedDict([("limit", "0"), ("speed_max", "20")])),
+        ]
+    )
+
+
+def test_search_matches_keys_and_values_case_insensitively():
+    index = SearchIndex(_sections())
+    assert index.search("SPEED") == {"Alpha": ["Speed"], "Beta": ["speed_max"]}
+    assert index.search("fas") == {"Alpha": ["mode"]}
+    assert index.search("missing") == {}
+    assert index.search("") is None
+
+
+def test_search_does_not_match_across_key_and_value():
+    index = SearchIndex(_sections())
+    assert index.search("mode") == {"Alpha": ["mode"]}
+    assert index.search("modefast") == {}
+    assert index.search("1") == {"Alpha": ["Speed", "Gain"]}
+
+
+def test_invalidate_picks_up_edited_values():
+    sections = _sections()
+    index = SearchIndex(sections)
+    assert index.search("slow") == {}
+    sections["Alpha"]["mode"] = "slow"
+    index.invalidate("Alpha")
+    assert index.search("slow") == {"Alpha": ["mode"]}
+
+
+def test_set_sections_with_diff_rebuilds_only_changed_sections():
+    old = _sections()
+    index = SearchIndex(old)
+    index.build()
+    new = _sections()
+    new["Beta"]["limit"] = "99"
+    del new["Alpha"]
+    new["Gamma"] = OrderedDict([("limit", "99")])
+    index.set_sections(new, diff_parameters(old, new)["sections"])
+    assert index.search("99") == {"Beta": ["limit"], "Gamma": ["limit"]}
+    assert index.search("speed") == {"Beta": ["speed_max"]}
+
+
+def test_results_follow_model_order():
+    sections = _sections()
+    index = SearchIndex(sections)
+    index.build()
+    reordered = OrderedDict((name, sections[name]) for name in ("Beta", "Alpha"))
+    index.set_sections(reordered, ())
+    assert list(index.search("speed")) == ["Beta", "Alpha"]
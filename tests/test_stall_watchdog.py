@@ -0,0 +1,98 @@
+import logging
+import time
+from types import SimpleNamespace
+
+from instrumentation import trace_category, tracer
+from stall_watchdog import StallWatchdog, callback_name, format_context
+
+
+def _frame(filename, name, lineno=1):
+    code = SimpleNamespace(co_filename=filename, co_name=name, co_qualname=name)
+    return SimpleNamespace(f_code=code, f_lineno=lineno)
+
+
+def test_callback_name_is_first_frame_called_by_tkinter():
+    frames = [
+        _frame("/app/INI_EDIT.py", "<module>"),
+        _frame("/usr/lib/python3/tkinter/__init__.py", "mainloop"),
+        _frame("/usr/lib/python3/tkinter/__init__.py", "callit"),
+        _frame("/app/gui/parameter_tab.py", "ParameterTab.monitor_file_changes", 42),
+        _frame("/app/config_io.py", "compute_file_hash"),
+    ]
+    assert callback_name(frames) == "ParameterTab.monitor_file_changes (parameter_tab.py:42)"
+    assert callback_name(frames[3:]).startswith("ParameterTab.monitor_file_changes")
+    assert callback_name([]) == "unknown"
+
+
+def test_format_context():
+    assert format_context(None) == ""
+    assert format_context({"tab": "a.ini", "size": 4096}) == " [a.ini, 4 KiB]"
+
+
+class _Loop:
+    """``root.after`` 를 흉내 내는 단일 스레드 루프."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append((time.perf_counter() + ms / 1000, callback))
+
+    def run_for(self, seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            due = [item for item in self.pending if item[0] <= time.perf_counter()]
+            for item in due:
+                self.pending.remove(item)
+                item[1]()
+            time.sleep(0.002)
+
+
+def _slow_refresh():
+    time.sleep(0.4)
+
+
+def test_stall_is_captured_with_stack_context_and_summary(caplog, monkeypatch):
+    monkeypatch.setattr(tracer, "enabled", True)
+    tracer.clear()
+    loop = _Loop()
+    watchdog = StallWatchdog(
+        loop.after,
+        threshold=0.1,
+        interval_ms=20,
+        context=lambda: {"tab": "/cfg/big.ini", "size": 10 * 1024 * 1024},
+    )
+    with caplog.at_level(logging.INFO, logger="stall_watchdog"):
+        watchdog.start()
+        loop.run_for(0.1)
+        _slow_refresh()
+        loop.run_for(0.1)
+        watchdog.stop()
+        summary = watchdog.log_summary()
+
+    assert summary["stalls"] == 1
+    assert 0.25 < summary["max_s"] < 1.0
+    blocked = [r.getMessage() for r in caplog.records if "blocked" in r.getMessage()]
+    assert len(blocked) == 1
+    assert "_slow_refresh" in blocked[0] and "[/cfg/big.ini, 10240 KiB]" in blocked[0]
+    assert "UI stalls: 1" in caplog.text
+    assert tracer.summary(trace_category("/cfg/big.ini"))["stall"][0] == 1
+    tracer.clear()
+
+
+def test_no_stall_when_loop_keeps_beating():
+    loop = _Loop()
+    watchdog = StallWatchdog(loop.after, threshold=0.1, interval_ms=10)
+    watchdog.start()
+    loop.run_for(0.2)
+    watchdog.stop()
+    assert watchdog.summary()["stalls"] == 0
+
+
+def test_summary_without_stalls_is_visible_by_default(caplog):
+    loop = _Loop()
+    watchdog = StallWatchdog(loop.after, threshold=0.1, interval_ms=10)
+    # 기본 로깅 설정(WARNING)에서도 종료 보고가 보여야 한다
+    with caplog.at_level(logging.WARNING, logger="stall_watchdog"):
+        watchdog.log_summary()
+    assert "No UI stalls over 0.10 s" in caplog.text
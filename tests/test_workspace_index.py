@@ -0,0 +1,91 @@
+import os
+import time
+
+from config_io import load_parameters
+from workspace_index import DONE, REMOVED, UPDATED, WorkspaceIndex, summarize_file
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+
+def test_summarize_file_follows_load_rules(tmp_path):
+    path = _write(
+        tmp_path / "a.ini",
+        "; comment\ntop=1\n[A]\nx=1\nx=2\ny = 3\n[B]\nz=1\n[A]\nw=0\n",
+    )
+    # 다시 나온 [A] 는 앞의 내용을 대체하고 처음 위치를 유지한다
+    assert summarize_file(path) == (("DEFAULT", "A", "B"), 3)
+
+
+def test_summarize_file_strips_unicode_whitespace_like_load(tmp_path):
+    ini = tmp_path / "a.ini"
+    ini.write_bytes(
+        "\u3000[A]\u3000\nkey\u3000=1\nkey=2\n\u00a0other = 3\n\u3000; note=1\n".encode()
+    )
+    path = str(ini)
+    # 탭에 보이는 것과 같이 U+3000, NBSP 공백을 다듬고 센다
+    loaded = load_parameters(path)
+    assert summarize_file(path) == (
+        tuple(loaded), sum(len(keys) for keys in loaded.values())
+    ) == (("DEFAULT", "A"), 2)
+
+
+def test_scan_indexes_tree_and_skips_hidden_dirs(tmp_path):
+    a = _write(tmp_path / "svc" / "a.ini", "[A]\nx=1\n")
+    b = _write(tmp_path / "svc" / "deep" / "b.ini", "[B]\ny=1\nz=2\n")
+    _write(tmp_path / "svc" / "notes.txt", "[C]\n")
+    _write(tmp_path / ".git" / "c.ini", "[C]\n")
+
+    index = WorkspaceIndex(str(tmp_path))
+    updates = index.scan()
+
+    assert [value.path for kind, value in updates if kind == UPDATED] == [a, b]
+    assert updates[-1] == (DONE, index.last_scan)
+    assert index.entries[b].sections == ("DEFAULT", "B")
+    assert index.entries[b].key_count == 2
+    assert index.last_scan["files"] == 2
+
+
+def test_rescan_rereads_only_changed_files(tmp_path):
+    a = _write(tmp_path / "a.ini", "[A]\nx=1\n")
+    b = _write(tmp_path / "b.ini", "[B]\ny=1\n")
+    index = WorkspaceIndex(str(tmp_path))
+    index.scan()
+
+    assert index.scan() == [(DONE, index.last_scan)]
+    assert index.last_scan["parsed"] == 0
+
+    _write(tmp_path / "a.ini", "[A]\nx=1\n[A2]\nq=1\n")
+    st = os.stat(a)
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    os.remove(b)
+    c = str(tmp_path / "c.ini")
+    with open(c, "wb") as f:
+        f.write(b"[\xff]\n")
+
+    updates = index.scan()
+    kinds = {(kind, getattr(value, "path", value)) for kind, value in updates[:-1]}
+    assert kinds == {(UPDATED, a), (UPDATED, c), (REMOVED, b)}
+    assert index.entries[a].sections == ("DEFAULT", "A", "A2")
+    assert index.entries[c].error and index.entries[c].key_count is None
+    assert b not in index.entries
+
+
+def test_background_scan_is_drained_in_batches(tmp_path):
+    for i in range(30):
+        _write(tmp_path / f"d{i % 3}" / f"f{i}.ini", "[S]\nk=1\n")
+    index = WorkspaceIndex(str(tmp_path))
+    assert index.start_scan()
+
+    seen = []
+    deadline = time.monotonic() + 5
+    while index.busy and time.monotonic() < deadline:
+        seen.extend(index.drain(limit=7))
+        time.sleep(0.001)
+    assert sum(kind == UPDATED for kind, _ in seen) == 30
+    assert seen[-1][0] == DONE
+    assert len(index.entries) == 30
+    index.close()
@@ -0,0 +1,221 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from fnmatch import fnmatch
+
+logger = logging.getLogger(__name__)
+
+# 작업 공간에서 찾을 파일 이름 패턴
+WORKSPACE_PATTERNS = ("*.ini",)
+# 스캔 스레드가 결과를 한 번에 넘기는 파일 수
+SCAN_BATCH = 200
+
+# 스캔 결과 종류
+UPDATED = "updated"
+REMOVED = "removed"
+DONE = "done"
+
+
+class WorkspaceEntry:
+    """작업 공간 색인의 파일 한 개 항목.
+
+    ``signature`` 는 :func:`config_io.stat_signature` 와 같은
+    ``(mtime_ns, size, inode)`` 이고, ``sections`` 는 ``load_parameters`` 와
+    같은 순서의 섹션 이름 튜플입니다. 읽지 못한 파일은 ``error`` 에 이유가
+    남고 ``key_count`` 는 ``None`` 입니다.
+    """
+
+    __slots__ = ("path", "signature", "sections", "key_count", "error")
+
+    def __init__(self, path, signature, sections=(), key_count=None, error=None):
+        self.path = path
+        self.signature = signature
+        self.sections = sections
+        self.key_count = key_count
+        self.error = error
+
+
+def summarize_file(path):
+    """파일을 한 줄씩 훑어 ``(섹션 이름 튜플, 키 개수)`` 를 반환합니다.
+
+    값은 저장하지 않고 키 이름만 모으므로 파싱보다 가볍습니다. 줄은
+    :func:`config_io.load_parameters` 와 같이 디코딩한 뒤 다듬으므로 U+3000 이나
+    NBSP 같은 공백이 붙은 키도 탭에 보이는 것과 같게 셉니다. 섹션과 키가 다시
+    나올 때의 규칙도 같습니다.
+    """
+    sections = {"DEFAULT": set()}
+    current = sections["DEFAULT"]
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                name = sys.intern(line[1:-1].strip())
+                current = sections[name] = set()
+            else:
+                eq = line.find("=")
+                if eq >= 0:
+                    current.add(line[:eq].strip())
+    return tuple(sections), sum(len(keys) for keys in sections.values())
+
+
+def _summarize_entry(path, signature):
+    try:
+        sections, key_count = summarize_file(path)
+    except (OSError, UnicodeDecodeError) as e:
+        return WorkspaceEntry(path, signature, error=f"{type(e).__name__}: {e}")
+    return WorkspaceEntry(path, signature, sections, key_count)
+
+
+class WorkspaceIndex:
+    """디렉터리 트리의 INI 파일을 경로, stat 서명, 섹션 이름, 키 개수로 색인합니다.
+
+    ``start_scan()`` 은 스캔을 백그라운드 스레드에서 실행하고, 결과는
+    :class:`background_loader.BackgroundLoader` 와 마찬가지로 큐에 쌓였다가
+    ``drain()`` 을 호출한 스레드(보통 Tk 메인 스레드)에서 ``entries`` 에
+    반영되며 ``(종류, 값)`` 목록으로 반환됩니다. 다시 스캔할 때는 stat 서명이
+    바뀐 파일만 다시 읽고, 사라진 파일은 ``REMOVED`` 로 알립니다.
+    """
+
+    def __init__(self, root, patterns=WORKSPACE_PATTERNS):
+        self.root = os.path.abspath(root)
+        self.patterns = tuple(patterns)
+        self.entries = {}
+        # 마지막 스캔 통계 (files, parsed, removed, seconds)
+        self.last_scan = None
+        self._lock = threading.Lock()
+        self._updates = deque()
+        self._thread = None
+        self._cancel = threading.Event()
+
+    def _matches(self, name):
+        return any(fnmatch(name, pattern) for pattern in self.patterns)
+
+    def _walk(self):
+        """일치하는 파일의 ``os.DirEntry`` 를 디렉터리별 이름 순서로 내놓습니다.
+
+        숨은 디렉터리(``.git`` 등)와 심볼릭 링크 디렉터리는 건너뜁니다.
+        """
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    items = sorted(it, key=lambda item: item.name)
+            except OSError as e:
+                logger.warning("Cannot scan %s: %s", directory, e)
+                continue
+            subdirs = []
+            for item in items:
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        if not item.name.startswith("."):
+                            subdirs.append(item.path)
+                    elif item.is_file() and self._matches(item.name):
+                        yield item
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))
+
+    def _publish(self, updates):
+        with self._lock:
+            self._updates.extend(updates)
+
+    def _scan(self, known):
+        started = time.perf_counter()
+        seen = set()
+        batch = []
+        parsed = 0
+        for item in self._walk():
+            if self._cancel.is_set():
+                return
+            seen.add(item.path)
+            try:
+                st = item.stat()
+            except OSError:
+                continue
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+            if known.get(item.path) == signature:
+                continue
+            batch.append((UPDATED, _summarize_entry(item.path, signature)))
+            parsed += 1
+            if len(batch) >= SCAN_BATCH:
+                self._publish(batch)
+                batch = []
+        removed = [(REMOVED, path) for path in known if path not in seen]
+        stats = {
+            "files": len(seen),
+            "parsed": parsed,
+            "removed": len(removed),
+            "seconds": round(time.perf_counter() - started, 6),
+        }
+        self._publish(batch + removed + [(DONE, stats)])
+
+    def _run(self, known):
+        try:
+            self._scan(known)
+        except Exception as e:  # 스캔 실패도 완료로 알린다
+            logger.warning("Workspace scan of %s failed: %s", self.root, e)
+            self._publish([(DONE, None)])
+
+    @property
+    def scanning(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def busy(self):
+        """스캔 중이거나 전달되지 않은 결과가 있으면 ``True``."""
+        with self._lock:
+            return self.scanning or bool(self._updates)
+
+    def start_scan(self):
+        """백그라운드 스캔을 시작합니다. 이미 진행 중이면 ``False``."""
+        if self.busy:
+            return False
+        known = {path: entry.signature for path, entry in self.entries.items()}
+        self._cancel.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(known,), name="ini-workspace-scan", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def scan(self):
+        """현재 스레드에서 스캔하고 반영한 결과를 반환합니다."""
+        if self.busy:
+            raise RuntimeError("a scan is already in progress")
+        self._cancel.clear()
+        self._run({path: entry.signature for path, entry in self.entries.items()})
+        return self.drain()
+
+    def drain(self, limit=None):
+        """쌓인 결과를 ``entries`` 에 반영하고 ``(종류, 값)`` 목록으로 반환합니다.
+
+        ``limit`` 을 주면 최대 그 수만큼만 꺼내 UI 갱신을 나눌 수 있습니다.
+        ``UPDATED`` 의 값은 :class:`WorkspaceEntry`, ``REMOVED`` 는 경로,
+        ``DONE`` 은 스캔 통계(실패하면 ``None``)입니다.
+        """
+        with self._lock:
+            count = len(self._updates) if limit is None else min(limit, len(self._updates))
+            updates = [self._updates.popleft() for _ in range(count)]
+        for kind, value in updates:
+            if kind == UPDATED:
+                self.entries[value.path] = value
+            elif kind == REMOVED:
+                self.entries.pop(value, None)
+            else:
+                self.last_scan = value
+        return updates
+
+    def close(self):
+        """진행 중인 스캔을 멈추고 남은 결과를 버립니다."""
+        self._cancel.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._updates.clear()